@@ -0,0 +1,105 @@
+"""
+동기(스레드풀) 모드와 비동기(AsyncSession) 모드의 처리량 비교 벤치마크.
+
+모드마다 별도 프로세스에서 같은 데이터로 시딩한 SQLite 파일을 만들고,
+ASGI 앱에 동시 요청을 보내 RPS 와 지연시간을 측정한다.
+
+    poetry run python benchmarks/async_db.py --companies 2000 --requests 3000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from seed import seed_database
+
+
+async def run_load(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from wanted_jjh.main import app
+
+    urls = [
+        f"/companies/company_{i % args.companies + 1}"
+        if i % 2
+        else f"/tags?query=tag_{i % args.tags + 1}"
+        for i in range(args.requests)
+    ]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+
+        async def request(url: str) -> None:
+            async with semaphore:
+                started_at = time.perf_counter()
+                resp = await client.get(url, headers={"x-wanted-language": "ko"})
+                latencies.append(time.perf_counter() - started_at)
+                resp.raise_for_status()
+
+        # 커넥션 풀/색인 워밍업
+        await asyncio.gather(*(request(url) for url in urls[: args.concurrency]))
+        latencies.clear()
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(request(url) for url in urls))
+        elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        "mode": "async" if os.environ["ASYNC_DB"] == "true" else "sync",
+        "requests": len(latencies),
+        "concurrency": args.concurrency,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--companies", type=int, default=2000)
+    parser.add_argument("--tags", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(asyncio.run(run_load(args))))
+        return
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = f"sqlite:///{tmp_dir}/bench.sqlite"
+        seed_database(database_url, args.companies, args.tags)
+
+        for async_db in ["false", "true"]:
+            output = subprocess.run(
+                [sys.executable, __file__, "--worker", *sys.argv[1:]],
+                env={
+                    **os.environ,
+                    "DATABASE_URI": database_url,
+                    "ASYNC_DB": async_db,
+                    "SEARCH_INDEX_WARMUP": "false",
+                },
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results.append(json.loads(output.splitlines()[-1]))
+
+    for result in results:
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+load_test.py 결과 JSON 두 개(기준 커밋 / 비교 커밋)를 시나리오별로 비교한다.
+
+p95 지연시간이 threshold 보다 많이 늘었거나 RPS 가 threshold 보다 많이 줄었거나
+오류가 새로 생긴 시나리오가 있으면 종료 코드 1 로 끝난다.
+
+    poetry run python benchmarks/compare_results.py bench/main.json bench/feature.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[dict]:
+    rows = []
+    for scenario, result in current["scenarios"].items():
+        base = baseline["scenarios"].get(scenario)
+        if base is None:
+            continue
+
+        p95_change = result["p95_ms"] / base["p95_ms"] - 1 if base["p95_ms"] else 0.0
+        rps_change = result["rps"] / base["rps"] - 1 if base["rps"] else 0.0
+        rows.append(
+            {
+                "scenario": scenario,
+                "rps": (base["rps"], result["rps"]),
+                "rps_change": rps_change,
+                "p50_ms": (base["p50_ms"], result["p50_ms"]),
+                "p95_ms": (base["p95_ms"], result["p95_ms"]),
+                "p99_ms": (base["p99_ms"], result["p99_ms"]),
+                "p95_change": p95_change,
+                "errors": (base["errors"], result["errors"]),
+                "regressed": (
+                    p95_change > threshold
+                    or rps_change < -threshold
+                    or result["errors"] > base["errors"]
+                ),
+            }
+        )
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="허용하는 변화율 (기본값: 10%%)"
+    )
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    rows = compare(baseline, current, args.threshold)
+
+    print(f"{baseline['meta']['commit']} -> {current['meta']['commit']}")
+    for row in rows:
+        print(
+            f"{'REGRESSED' if row['regressed'] else 'ok':>9} {row['scenario']:<12} "
+            f"rps {row['rps'][0]:>9} -> {row['rps'][1]:>9} ({row['rps_change']:+.1%}) "
+            f"p50 {row['p50_ms'][0]:>8} -> {row['p50_ms'][1]:>8} ms "
+            f"p95 {row['p95_ms'][0]:>8} -> {row['p95_ms'][1]:>8} ms "
+            f"({row['p95_change']:+.1%}) "
+            f"p99 {row['p99_ms'][0]:>8} -> {row['p99_ms'][1]:>8} ms "
+            f"errors {row['errors'][0]} -> {row['errors'][1]}"
+        )
+
+    if any(row["regressed"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+서비스 DTO 표현별 /search 결과 메모리 사용량 비교 벤치마크.
+
+같은 데이터로 시딩한 SQLite 파일과 미리 구축한 회사명 색인으로
+`search_companies_by_name` 을 limit 없이 호출해 모든 회사를 결과로 받고,
+결과가 살아 있는 동안 늘어난 메모리(tracemalloc)를 결과 수로 나눈다.
+- legacy: __slots__ 없는 frozen dataclass, 태그명은 list (이전 DTO)
+- slots: 현재 DTO (slots dataclass, 태그명은 tuple)
+회사명 문자열은 색인이 가지고 있는 것을 그대로 쓰므로 DTO 자체의 크기만 측정된다.
+
+    poetry run python benchmarks/dto_memory.py --companies 100000
+"""
+
+import argparse
+import gc
+import json
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from seed import seed_database
+from wanted_jjh.dtos.company import CompanyDTO
+from wanted_jjh.indexes.company_name import CompanyNameIndex
+from wanted_jjh.services import company as company_services
+
+
+@dataclass(frozen=True)
+class LegacyCompanyDTO:
+    name: str
+    tag_names: list[str] | None = None
+
+    def __post_init__(self):
+        if self.tag_names is not None:
+            object.__setattr__(self, "tag_names", list(self.tag_names))
+
+
+def measure(
+    db_session: Session, name_index: CompanyNameIndex, query: str
+) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    search_result_dto = company_services.search_companies_by_name(
+        db_session=db_session, name=query, name_index=name_index
+    )
+
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return retained, len(search_result_dto.companies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--companies", type=int, default=100000)
+    parser.add_argument("--tags", type=int, default=50)
+    parser.add_argument("--query", default="company")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = f"sqlite:///{tmp_dir}/bench.sqlite"
+        seed_database(database_url, args.companies, args.tags)
+        engine = create_engine(database_url)
+
+        with Session(engine) as db_session:
+            name_index = CompanyNameIndex()
+            name_index.sync(db_session)
+
+            for representation, dto_class in [
+                ("legacy", LegacyCompanyDTO),
+                ("slots", CompanyDTO),
+            ]:
+                company_services.CompanyDTO = dto_class
+                retained, results = measure(db_session, name_index, args.query)
+                print(
+                    json.dumps(
+                        {
+                            "dto": representation,
+                            "results": results,
+                            "retained_bytes": retained,
+                            "bytes_per_result": round(retained / max(results, 1), 1),
+                        }
+                    )
+                )
+            company_services.CompanyDTO = CompanyDTO
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+회사명/태그명 검색 경로별 소요 시간 비교 벤치마크.
+
+generate_companies.py 로 만든 회사를 임시 SQLite 에 적재하고, 회사명에서 뽑은 길이별 검색어로
+서비스 함수를 직접 호출해 검색 경로별 평균/p50/p95 소요 시간(ms)과 평균 결과 수를 출력한다.
+- like: 기본 모드에서 인메모리 색인 없이 `LIKE '%query%'` 로 찾는 경로
+- index: 기본 모드의 인메모리 n-gram 색인 (CompanyNameIndex / CompanyTagIndex)
+- fts: mode=fts 의 FTS5 trigram 색인 (3글자보다 짧은 검색어는 색인의 이름을 순서대로 확인한다.)
+
+    poetry run python benchmarks/full_text_search.py --companies 100000 --queries 200
+"""
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from generate_companies import iter_company_rows
+from generate_companies import write_company_csv
+from load_test import seed_from_csv
+
+
+def make_queries(
+    company_count: int, *, length: int, count: int, seed: int = 0
+) -> list[str]:
+    # 회사명의 임의 위치에서 length 글자를 잘라 검색어로 사용한다.
+    rng = random.Random(seed)
+    names = [
+        name
+        for row in iter_company_rows(min(company_count, 10_000), seed=seed)
+        for code in ("ko", "en")
+        if len(name := row[f"company_{code}"].strip()) >= length
+    ]
+    queries = []
+    for name in rng.sample(names, min(count, len(names))):
+        start = rng.randrange(len(name) - length + 1)
+        queries.append(name[start : start + length])
+    return queries
+
+
+def measure(search: Callable[[str], int], queries: list[str]) -> dict:
+    durations = []
+    result_counts = []
+    for query in queries:
+        started_at = time.perf_counter()
+        result_counts.append(search(query))
+        durations.append((time.perf_counter() - started_at) * 1000)
+
+    durations.sort()
+    return {
+        "avg_ms": round(statistics.fmean(durations), 3),
+        "p50_ms": round(durations[len(durations) // 2], 3),
+        "p95_ms": round(durations[int(len(durations) * 0.95)], 3),
+        "avg_results": round(statistics.fmean(result_counts), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--companies", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=200, help="길이별 검색어 수")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[2, 3, 6])
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "companies.csv"
+        database_url = f"sqlite:///{tmp_dir}/bench.sqlite"
+        write_company_csv(csv_path, args.companies)
+        seed_from_csv(database_url, csv_path)
+
+        from sqlalchemy.orm import sessionmaker
+
+        from wanted_jjh.db.session import create_db_engine
+        from wanted_jjh.enums import SearchMode
+        from wanted_jjh.indexes.company_name import CompanyNameIndex
+        from wanted_jjh.indexes.company_tag import CompanyTagIndex
+        from wanted_jjh.services.company import search_companies_by_name
+        from wanted_jjh.services.company import search_company_by_tag
+
+        engine = create_db_engine(database_url)
+        Session = sessionmaker(bind=engine)
+
+        with Session() as db_session:
+            name_index = CompanyNameIndex()
+            name_index.sync(db_session)
+            tag_index = CompanyTagIndex()
+            tag_index.sync(db_session)
+
+            name_searches = {
+                "like": {},
+                "index": {"name_index": name_index},
+                "fts": {"mode": SearchMode.fts},
+            }
+            for length in args.lengths:
+                queries = make_queries(
+                    args.companies, length=length, count=args.queries
+                )
+                for path, kwargs in name_searches.items():
+                    result = measure(
+                        lambda query, kwargs=kwargs: len(
+                            search_companies_by_name(
+                                db_session=db_session,
+                                name=query,
+                                limit=args.limit,
+                                **kwargs,
+                            ).companies
+                        ),
+                        queries,
+                    )
+                    print(
+                        json.dumps(
+                            {
+                                "target": "company-name",
+                                "path": path,
+                                "query_length": length,
+                                **result,
+                            }
+                        )
+                    )
+
+            # 태그명은 tag_k 형식이므로 기본 모드는 완전 일치, fts 는 부분 문자열로 찾는다.
+            tag_queries = [f"tag_{i % 30 + 1}" for i in range(args.queries)]
+            tag_searches = {
+                "like": {},
+                "index": {"tag_index": tag_index},
+                "fts": {"mode": SearchMode.fts},
+            }
+            for path, kwargs in tag_searches.items():
+                result = measure(
+                    lambda query, kwargs=kwargs: len(
+                        search_company_by_tag(
+                            db_session=db_session, tag_names=[query], **kwargs
+                        )
+                    ),
+                    tag_queries,
+                )
+                print(json.dumps({"target": "tag-name", "path": path, **result}))
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+company_tag_sample.csv 와 같은 형식의 벤치마크용 회사/태그 CSV 를 원하는 회사 수만큼 만든다.
+
+샘플 CSV 의 행을 차례로 반복하면서 회사명 뒤에 반복 회차를 붙여 회사명이 겹치지 않게 하고,
+언어별로 비어 있는 회사명도 샘플과 같은 비율로 남긴다.
+태그는 태그_k / tag_k / タグ_k 중 1~4개를 seed 로 고정한 난수로 고른다.
+파일을 한 행씩 쓰므로 1,000,000 개 회사도 메모리 사용량이 일정하다.
+
+    poetry run python benchmarks/generate_companies.py --companies 100000 -o companies_100k.csv
+    poetry run python src/wanted_jjh/cli.py import-companies companies_100k.csv --reset
+"""
+
+import argparse
+import csv
+import random
+from collections.abc import Iterator
+from pathlib import Path
+
+from wanted_jjh.importers.company_csv import TAG_SEPARATOR
+
+SAMPLE_CSV_PATH = Path(__file__).parent.parent / "data" / "company_tag_sample.csv"
+
+FIELDNAMES = ["company_ko", "company_en", "company_ja", "tag_ko", "tag_en", "tag_ja"]
+
+# 태그 k 의 언어별 태그명 접두어
+TAG_PREFIXES = {"ko": "태그", "en": "tag", "ja": "タグ"}
+
+
+def read_sample_names() -> list[dict[str, str]]:
+    with SAMPLE_CSV_PATH.open(newline="", encoding="utf-8") as file:
+        return [
+            {code: row[f"company_{code}"] for code in TAG_PREFIXES}
+            for row in csv.DictReader(file)
+        ]
+
+
+def iter_company_rows(
+    company_count: int, *, tag_count: int = 30, seed: int = 0
+) -> Iterator[dict[str, str]]:
+    """
+    i 번째 행의 회사명은 샘플 i % len(샘플) 번째 행의 회사명이고,
+    샘플을 한 바퀴 넘게 반복하면 " {회차}" 를 붙인다. (첫 바퀴는 샘플과 같다.)
+    """
+    sample_names = read_sample_names()
+    rng = random.Random(seed)
+
+    for i in range(company_count):
+        lap, sample_index = divmod(i, len(sample_names))
+        suffix = f" {lap}" if lap else ""
+        tag_ids = rng.sample(range(1, tag_count + 1), rng.randint(1, min(4, tag_count)))
+
+        yield {
+            **{
+                f"company_{code}": f"{name}{suffix}" if name else ""
+                for code, name in sample_names[sample_index].items()
+            },
+            **{
+                f"tag_{code}": TAG_SEPARATOR.join(
+                    f"{prefix}_{tag_id}" for tag_id in tag_ids
+                )
+                for code, prefix in TAG_PREFIXES.items()
+            },
+        }
+
+
+def write_company_csv(
+    path: Path, company_count: int, *, tag_count: int = 30, seed: int = 0
+) -> None:
+    with path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(
+            iter_company_rows(company_count, tag_count=tag_count, seed=seed)
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--companies", type=int, default=10_000)
+    parser.add_argument("--tags", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    write_company_csv(args.output, args.companies, tag_count=args.tags, seed=args.seed)
+    print(f"{args.companies} 개 회사를 {args.output} 에 만들었습니다.")
+
+
+if __name__ == "__main__":
+    main()
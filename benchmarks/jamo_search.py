@@ -0,0 +1,121 @@
+"""
+초성/자모 검색(mode=jamo) 소요 시간 비교 벤치마크.
+
+generate_companies.py 로 만든 회사를 임시 SQLite 에 적재하고, 한국어 회사명에서 뽑은 초성 검색어와
+조합 중인 음절로 끝나는 검색어(원티드 -> 원틷)로 검색 경로별 평균/p50/p95 소요 시간(ms)을 출력한다.
+- index: CompanyNameIndex 에 미리 만들어 둔 초성/자모 posting 으로 찾는 경로
+- scan: 검색할 때마다 모든 한국어 회사명을 풀어써서 비교하는 경로 (색인이 없을 때의 비용)
+
+    poetry run python benchmarks/jamo_search.py --companies 100000 --queries 200
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from full_text_search import measure
+from generate_companies import iter_company_rows
+from generate_companies import write_company_csv
+from load_test import seed_from_csv
+
+
+def make_queries(company_count: int, *, count: int, seed: int = 0) -> dict[str, list]:
+    # 한국어 회사명의 앞부분을 초성 검색어와, 마지막 음절의 종성까지만 입력한 검색어로 만든다.
+    from wanted_jjh.hangul import to_chosung
+    from wanted_jjh.hangul import to_jamo
+
+    rng = random.Random(seed)
+    names = [
+        name
+        for row in iter_company_rows(min(company_count, 10_000), seed=seed)
+        if len(name := row["company_ko"].strip()) >= 2
+    ]
+    chosung_queries = []
+    composing_queries = []
+    for name in rng.sample(names, min(count, len(names))):
+        prefix = name[: rng.randint(2, len(name))]
+        chosung_queries.append(to_chosung(prefix))
+        # 다음 음절의 초성을 받침으로 붙인 상태(원티 + ㄷ -> 원틷)를 흉내 낸다.
+        composing_queries.append(to_jamo(prefix)[:-1])
+    return {"chosung": chosung_queries, "composing": composing_queries}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--companies", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=200, help="종류별 검색어 수")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "companies.csv"
+        database_url = f"sqlite:///{tmp_dir}/bench.sqlite"
+        write_company_csv(csv_path, args.companies)
+        seed_from_csv(database_url, csv_path)
+
+        from sqlalchemy import select
+        from sqlalchemy.orm import sessionmaker
+
+        from wanted_jjh.db.session import create_db_engine
+        from wanted_jjh.enums import LanguageCode
+        from wanted_jjh.enums import SearchMode
+        from wanted_jjh.hangul import is_chosung_query
+        from wanted_jjh.hangul import to_chosung
+        from wanted_jjh.hangul import to_jamo
+        from wanted_jjh.indexes.company_name import CompanyNameIndex
+        from wanted_jjh.models.company import CompanyName
+
+        engine = create_db_engine(database_url)
+        Session = sessionmaker(bind=engine)
+
+        with Session() as db_session:
+            started_at = time.perf_counter()
+            name_index = CompanyNameIndex()
+            name_index.sync(db_session)
+            print(
+                json.dumps(
+                    {
+                        "target": "index-build",
+                        "names": len(name_index),
+                        "ms": round((time.perf_counter() - started_at) * 1000, 1),
+                    }
+                )
+            )
+
+            ko_names = db_session.execute(
+                select(CompanyName.company_id, CompanyName.name).where(
+                    CompanyName.language_code == LanguageCode.ko,
+                    CompanyName.name.is_not(None),
+                )
+            ).all()
+
+        def scan(query: str) -> int:
+            convert = to_chosung if is_chosung_query(query) else to_jamo
+            query = convert(query)
+            company_ids = {
+                company_id for company_id, name in ko_names if query in convert(name)
+            }
+            return min(len(company_ids), args.limit)
+
+        searches = {
+            "index": lambda query: len(
+                name_index.search(query, limit=args.limit, mode=SearchMode.jamo)
+            ),
+            "scan": scan,
+        }
+        for kind, queries in make_queries(args.companies, count=args.queries).items():
+            for path, search in searches.items():
+                print(
+                    json.dumps(
+                        {"query": kind, "path": path, **measure(search, queries)}
+                    )
+                )
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
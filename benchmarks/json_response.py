@@ -0,0 +1,80 @@
+"""
+목록 응답 JSON 인코딩 경로별 소요 시간 비교 마이크로 벤치마크.
+
+DB 없이 서비스가 돌려주는 것과 같은 CompanyDTO 목록으로 /search, /tags 응답 본문을 만든다.
+- schema: 항목마다 CompanySearchSchema 를 만들고 jsonable_encoder 로 변환 (이전 라우터 구현)
+- validated: FAST_JSON_RESPONSE=false 의 json_response (response_model 로 한 번 검증)
+- fast: FAST_JSON_RESPONSE=true 의 json_response (검증 없이 orjson 으로 바로 인코딩)
+
+    poetry run python benchmarks/json_response.py --sizes 10 1000 100000
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from functools import partial
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from wanted_jjh import settings
+from wanted_jjh.dtos.company import CompanyDTO
+from wanted_jjh.routers.utils.responses import json_response
+from wanted_jjh.schemas.company import CompanySearchSchema
+
+
+def encode_schema(company_dtos: list[CompanyDTO]) -> bytes:
+    response_data = [
+        CompanySearchSchema(company_name=company_dto.name)
+        for company_dto in company_dtos
+    ]
+    return JSONResponse(jsonable_encoder(response_data)).body
+
+
+def encode_json_response(company_dtos: list[CompanyDTO]) -> bytes:
+    return json_response(
+        [{"company_name": company_dto.name} for company_dto in company_dtos],
+        response_model=list[CompanySearchSchema],
+    ).body
+
+
+def measure(encode: Callable[[], bytes], min_seconds: float) -> tuple[float, bytes]:
+    body = encode()  # 워밍업 (TypeAdapter 캐시 등)
+    runs = 0
+    started_at = time.perf_counter()
+    while (elapsed := time.perf_counter() - started_at) < min_seconds or runs < 3:
+        encode()
+        runs += 1
+    return elapsed / runs, body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100000])
+    parser.add_argument("--min-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        company_dtos = [CompanyDTO(name=f"회사_{i}") for i in range(size)]
+        result = {"items": size}
+        bodies = set()
+
+        for path, fast, encode in [
+            ("schema", False, encode_schema),
+            ("validated", False, encode_json_response),
+            ("fast", True, encode_json_response),
+        ]:
+            settings.FAST_JSON_RESPONSE = fast
+            seconds, body = measure(partial(encode, company_dtos), args.min_seconds)
+            result[f"{path}_ms"] = round(seconds * 1000, 3)
+            bodies.add(body)
+
+        # 모든 경로의 응답 본문은 같아야 한다.
+        assert len(bodies) == 1
+        result["speedup"] = round(result["schema_ms"] / result["fast_ms"], 1)
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+"""
+엔드포인트별 부하 테스트. 시나리오마다 RPS 와 p50/p95/p99 지연시간을 JSON 으로 출력한다.
+
+generate_companies.py 로 만든 CSV 를 임시 SQLite 파일에 import-companies 와 같은 방법으로 적재하고,
+별도 프로세스에서 ASGI 앱에 동시 요청을 보낸다. 결과 파일은 compare_results.py 로 커밋 간 비교한다.
+
+시나리오 (쓰기 시나리오는 DB 를 바꾸므로 이 순서대로 실행한다)
+- search: GET /search (회사명 앞부분)
+- tags: GET /tags (회사에 연결된 태그명)
+- get-company: GET /companies/{company_name}
+- add-company: POST /companies
+- update-tags: PUT /companies/{company_name}/tags (새 태그 추가)
+- delete-tag: DELETE /companies/{company_name}/tags/{tag_name} (update-tags 가 추가한 태그)
+
+    poetry run python benchmarks/load_test.py --companies 100000 --output bench/100k.json
+
+    # 1,000,000 개 회사처럼 적재가 오래 걸리면 한 번 적재한 DB 와 CSV 를 다시 사용한다.
+    poetry run python benchmarks/load_test.py --csv companies_1m.csv \\
+        --database-url sqlite:////tmp/companies_1m.sqlite --output bench/1m.json
+
+    # 실행 중인 서버에 요청을 보낸다. (서버 DB 에 --csv 가 적재되어 있어야 한다.)
+    poetry run python benchmarks/load_test.py --csv companies_1m.csv --base-url http://localhost:8000
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import quote
+from urllib.parse import urlencode
+
+from generate_companies import write_company_csv
+
+SCENARIOS = [
+    "search",
+    "tags",
+    "get-company",
+    "add-company",
+    "update-tags",
+    "delete-tag",
+]
+READ_SCENARIOS = {"search", "tags", "get-company"}
+
+
+class Target(NamedTuple):
+    # 요청에 사용할 회사명과 그 언어, 회사에 연결된 태그명 (같은 언어)
+    language_code: str
+    company_name: str
+    tag_name: str
+
+
+class BenchRequest(NamedTuple):
+    method: str
+    url: str
+    headers: dict[str, str]
+    json: object = None
+
+
+def read_targets(
+    csv_path: Path, *, company_count: int, sample_size: int
+) -> list[Target]:
+    """CSV 전체에서 고르게 sample_size 개 회사를 골라 요청 대상으로 사용한다."""
+    from wanted_jjh.importers.company_csv import read_company_rows
+
+    step = max(company_count // sample_size, 1)
+    targets = []
+    with csv_path.open(newline="", encoding="utf-8") as file:
+        for row in islice(read_company_rows(file), 0, None, step):
+            language_code, company_name = next(
+                (code, name) for code, name in row.names.items() if name
+            )
+            tag_name = next(
+                (tag[language_code] for tag in row.tags if language_code in tag), None
+            )
+            if tag_name:
+                targets.append(Target(language_code, company_name, tag_name))
+
+    return targets[:sample_size]
+
+
+def build_requests(
+    scenario: str, targets: list[Target], count: int, run_id: str
+) -> list[BenchRequest]:
+    requests = []
+    for i in range(count):
+        target = targets[i % len(targets)]
+        headers = {"x-wanted-language": target.language_code}
+        # update-tags 와 delete-tag 는 i 번째 요청이 같은 태그를 추가/삭제한다.
+        new_tag_names = {
+            code: f"{prefix}_{run_id}_{i}"
+            for code, prefix in [
+                ("ko", "벤치태그"),
+                ("en", "bench_tag"),
+                ("ja", "ベンチタグ"),
+            ]
+        }
+
+        if scenario == "search":
+            query = target.company_name[: max(2, len(target.company_name) // 2)]
+            requests.append(
+                BenchRequest(
+                    "GET",
+                    f"/search?{urlencode({'query': query, 'limit': 10})}",
+                    headers,
+                )
+            )
+        elif scenario == "tags":
+            requests.append(
+                BenchRequest(
+                    "GET", f"/tags?{urlencode({'query': target.tag_name})}", headers
+                )
+            )
+        elif scenario == "get-company":
+            requests.append(
+                BenchRequest(
+                    "GET", f"/companies/{quote(target.company_name, safe='')}", headers
+                )
+            )
+        elif scenario == "add-company":
+            requests.append(
+                BenchRequest(
+                    "POST",
+                    "/companies",
+                    headers,
+                    json={
+                        "company_name": {
+                            "ko": f"벤치회사_{run_id}_{i}",
+                            "en": f"bench_company_{run_id}_{i}",
+                        },
+                        "tags": [{"tag_name": {"ko": target.tag_name}}],
+                    },
+                )
+            )
+        elif scenario == "update-tags":
+            requests.append(
+                BenchRequest(
+                    "PUT",
+                    f"/companies/{quote(target.company_name, safe='')}/tags",
+                    headers,
+                    json=[{"tag_name": new_tag_names}],
+                )
+            )
+        elif scenario == "delete-tag":
+            requests.append(
+                BenchRequest(
+                    "DELETE",
+                    f"/companies/{quote(target.company_name, safe='')}/tags/"
+                    f"{quote(new_tag_names[target.language_code], safe='')}",
+                    headers,
+                )
+            )
+
+    return requests
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    # nearest-rank
+    return sorted_values[max(math.ceil(p * len(sorted_values)) - 1, 0)]
+
+
+async def run_scenario(client, requests: list[BenchRequest], concurrency: int) -> dict:
+    import httpx
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def send(request: BenchRequest) -> None:
+        nonlocal errors
+        async with semaphore:
+            started_at = time.perf_counter()
+            try:
+                resp = await client.request(
+                    request.method,
+                    request.url,
+                    headers=request.headers,
+                    json=request.json,
+                )
+                failed = resp.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started_at)
+            errors += failed
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(send(request) for request in requests))
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2),
+    }
+
+
+async def run_load(args: argparse.Namespace) -> dict:
+    import httpx
+
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+    else:
+        from wanted_jjh.main import app
+
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench"
+        )
+
+    targets = read_targets(
+        args.csv, company_count=args.companies, sample_size=args.sample_size
+    )
+    run_id = f"{int(time.time())}"
+    results = {}
+
+    async with client:
+        # 색인 구축/커넥션 풀 워밍업 (읽기 시나리오만, 측정하지 않는다.)
+        for scenario in SCENARIOS:
+            if scenario in READ_SCENARIOS and scenario in args.scenarios:
+                await run_scenario(
+                    client,
+                    build_requests(scenario, targets, args.concurrency, run_id),
+                    args.concurrency,
+                )
+
+        for scenario in SCENARIOS:
+            if scenario not in args.scenarios:
+                continue
+            results[scenario] = await run_scenario(
+                client,
+                build_requests(scenario, targets, args.requests, run_id),
+                args.concurrency,
+            )
+
+    return results
+
+
+def get_git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def seed_from_csv(database_url: str, csv_path: Path) -> None:
+    from wanted_jjh.db.migrations import upgrade
+    from wanted_jjh.db.session import create_db_engine
+    from wanted_jjh.importers.company_csv import CompanyCsvImporter
+
+    engine = create_db_engine(database_url)
+    upgrade(engine)
+    CompanyCsvImporter(
+        engine, report=lambda message: print(message, file=sys.stderr)
+    ).run(csv_path)
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--companies", type=int, default=10_000)
+    parser.add_argument("--tags", type=int, default=30)
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument(
+        "--sample-size", type=int, default=1000, help="요청 대상 회사 수"
+    )
+    parser.add_argument("--csv", type=Path, help="적재된(적재할) 회사 CSV")
+    parser.add_argument(
+        "--database-url", help="이미 --csv 가 적재된 DB (기본값: 임시 SQLite 에 적재)"
+    )
+    parser.add_argument("--base-url", help="요청을 보낼 실행 중인 서버")
+    parser.add_argument(
+        "--response-cache",
+        default="none",
+        choices=["none", "local", "shared"],
+        help="RESPONSE_CACHE_BACKEND (기본값: none, DB 조회 경로를 측정)",
+    )
+    parser.add_argument("-o", "--output", type=Path, help="결과 JSON 파일")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(asyncio.run(run_load(args))))
+        return
+
+    if (args.database_url or args.base_url) and not args.csv:
+        parser.error(
+            "--database-url, --base-url 에는 적재된 데이터의 --csv 가 필요합니다."
+        )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = args.csv
+        if csv_path is None:
+            csv_path = Path(tmp_dir) / "companies.csv"
+            write_company_csv(csv_path, args.companies, tag_count=args.tags)
+
+        if args.base_url:
+            scenarios = asyncio.run(run_load(args))
+        else:
+            database_url = args.database_url or f"sqlite:///{tmp_dir}/bench.sqlite"
+            if not args.database_url:
+                seed_from_csv(database_url, csv_path)
+
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--worker",
+                    *sys.argv[1:],
+                    "--csv",
+                    str(csv_path),
+                ],
+                env={
+                    **os.environ,
+                    "DATABASE_URI": database_url,
+                    "RESPONSE_CACHE_BACKEND": args.response_cache,
+                    "SEARCH_INDEX_WARMUP": "false",
+                },
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            scenarios = json.loads(output.splitlines()[-1])
+
+    result = {
+        "meta": {
+            "commit": get_git_commit(),
+            "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "companies": args.companies,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "async_db": os.getenv("ASYNC_DB", "false"),
+            "response_cache": args.response_cache,
+            "target": args.base_url or "asgi",
+        },
+        "scenarios": scenarios,
+    }
+
+    print(json.dumps(result, indent=2))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
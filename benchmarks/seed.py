@@ -0,0 +1,62 @@
+from sqlalchemy import create_engine
+from sqlalchemy import insert
+
+from wanted_jjh.db.migrations import upgrade
+from wanted_jjh.db.session import DBBase
+from wanted_jjh.models.company import Company
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_tag import CompanyTag
+from wanted_jjh.models.company_tag import CompanyTagName
+from wanted_jjh.models.company_tag import association_company_and_company_tag
+from wanted_jjh.services.company_document import rebuild_company_documents
+from wanted_jjh.services.full_text_search import sync_company_name_fts
+from wanted_jjh.services.full_text_search import sync_company_tag_name_fts
+
+
+def seed_database(database_url: str, company_count: int, tag_count: int) -> None:
+    """
+    회사 i 는 회사_i / company_i, 태그 i 는 태그_i / tag_i 이름을 가지며
+    회사마다 태그 3개가 연결된 벤치마크용 DB 를 만든다.
+    """
+    engine = create_engine(database_url)
+    DBBase.metadata.drop_all(engine)
+    # 운영 DB 와 같이 전문 검색 테이블과 인덱스까지 만든다.
+    upgrade(engine)
+
+    with engine.begin() as conn:
+        conn.execute(insert(CompanyTag), [{"id": i} for i in range(1, tag_count + 1)])
+        conn.execute(
+            insert(CompanyTagName),
+            [
+                {"tag_id": i, "language_code": language_code, "name": f"{prefix}_{i}"}
+                for i in range(1, tag_count + 1)
+                for language_code, prefix in [("ko", "태그"), ("en", "tag")]
+            ],
+        )
+        conn.execute(insert(Company), [{"id": i} for i in range(1, company_count + 1)])
+        conn.execute(
+            insert(CompanyName),
+            [
+                {
+                    "company_id": i,
+                    "language_code": language_code,
+                    "name": f"{prefix}_{i}",
+                }
+                for i in range(1, company_count + 1)
+                for language_code, prefix in [("ko", "회사"), ("en", "company")]
+            ],
+        )
+        conn.execute(
+            insert(association_company_and_company_tag),
+            [
+                {"company_id": i, "company_tag_id": (i * 7 + j) % tag_count + 1}
+                for i in range(1, company_count + 1)
+                for j in range(3)
+            ],
+        )
+        sync_company_name_fts(conn)
+        sync_company_tag_name_fts(conn)
+
+    # Core INSERT 는 ORM 이벤트를 거치지 않으므로 전문 검색 색인과 회사 문서를 직접 만든다.
+    with engine.connect() as conn:
+        rebuild_company_documents(conn)
@@ -0,0 +1,134 @@
+"""
+SQLite PRAGMA 프로파일(default / production)별 동시 읽기/쓰기 처리량 비교 벤치마크.
+
+프로파일마다 별도 프로세스에서 같은 데이터로 시딩한 SQLite 파일에 대해
+읽기 스레드(get_company_by_name)와 쓰기 스레드(append_company_tags)를 동시에 돌려
+초당 처리 건수와 "database is locked" 오류 수를 측정한다.
+
+    poetry run python benchmarks/sqlite_profile.py --readers 8 --writers 2 --seconds 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from seed import seed_database
+
+
+def run_workload(args: argparse.Namespace) -> dict:
+    from sqlalchemy.exc import OperationalError
+
+    from wanted_jjh import settings
+    from wanted_jjh.db.session import Session
+    from wanted_jjh.dtos.company import TagDTO
+    from wanted_jjh.services import company as company_services
+
+    counts = {"reads": 0, "writes": 0, "locked_errors": 0}
+    counts_lock = threading.Lock()
+    errors: list[Exception] = []
+    deadline = time.perf_counter() + args.seconds
+
+    def worker(worker_id: int, is_writer: bool) -> None:
+        try:
+            run_worker(worker_id, is_writer)
+        except Exception as e:
+            with counts_lock:
+                errors.append(e)
+
+    def run_worker(worker_id: int, is_writer: bool) -> None:
+        i = 0
+        while time.perf_counter() < deadline:
+            i += 1
+            company_name = f"company_{(worker_id * 7919 + i) % args.companies + 1}"
+            try:
+                with Session() as db_session:
+                    if is_writer:
+                        company_services.append_company_tags(
+                            db_session=db_session,
+                            company_name=company_name,
+                            tags=[
+                                TagDTO(
+                                    ko_name=f"태그_w{worker_id}_{i}",
+                                    en_name=f"tag_w{worker_id}_{i}",
+                                    ja_name=f"タグ_w{worker_id}_{i}",
+                                )
+                            ],
+                        )
+                    else:
+                        company_services.get_company_by_name(
+                            db_session=db_session, company_name=company_name
+                        )
+                key = "writes" if is_writer else "reads"
+            except OperationalError as e:
+                if "locked" not in str(e):
+                    raise
+                key = "locked_errors"
+
+            with counts_lock:
+                counts[key] += 1
+
+    threads = [
+        threading.Thread(target=worker, args=(worker_id, worker_id < args.writers))
+        for worker_id in range(args.readers + args.writers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 스레드에서 난 예외는 스레드만 끝내므로, 멈춘 워커가 처리량 0 으로 보고되지 않게 실패시킨다.
+    if errors:
+        raise RuntimeError(f"워커 {len(errors)}개가 실패했습니다.") from errors[0]
+
+    return {
+        "profile": settings.SQLITE_PROFILE,
+        "reads_per_sec": round(counts["reads"] / args.seconds, 1),
+        "writes_per_sec": round(counts["writes"] / args.seconds, 1),
+        "locked_errors": counts["locked_errors"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--companies", type=int, default=5000)
+    parser.add_argument("--tags", type=int, default=100)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_workload(args)))
+        return
+
+    results = []
+    for profile in ["default", "production"]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            database_url = f"sqlite:///{tmp_dir}/bench.sqlite"
+            seed_database(database_url, args.companies, args.tags)
+
+            output = subprocess.run(
+                [sys.executable, __file__, "--worker", *sys.argv[1:]],
+                env={
+                    **os.environ,
+                    "DATABASE_URI": database_url,
+                    "SQLITE_PROFILE": profile,
+                },
+                check=True,
+                stdout=subprocess.PIPE,
+                text=True,
+            ).stdout
+            results.append(json.loads(output.splitlines()[-1]))
+
+    for result in results:
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+`python -X importtime` 기반 시작 시간 벤치마크.
+
+모듈마다 새 프로세스에서 여러 번 import 해서 다음 값의 최솟값(ms)을 출력한다.
+- total_ms: 의존성까지 포함한 import 시간 (워커 cold start)
+- own_ms: fastapi / pydantic / sqlalchemy 를 먼저 import 한 뒤 측정한 이 저장소 코드의 import 시간
+  (tests/test_startup.py 가 wanted_jjh.main 의 own_ms 예산을 검사한다.)
+- slowest: total_ms 측정에서 자체(self) 시간이 가장 긴 모듈
+
+    poetry run python benchmarks/startup.py --runs 5 --budget-ms 300
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+# own_ms 측정 전에 미리 import 하는 서드파티 패키지
+PRELOADED_MODULES = ["fastapi", "pydantic", "sqlalchemy.orm", "sqlalchemy.ext.asyncio"]
+
+
+def import_times(
+    module: str, *, preload: list[str], env: dict[str, str]
+) -> dict[str, tuple[int, int]]:
+    """모듈 이름 -> (self, cumulative) 마이크로초"""
+    statements = [f"import {name}" for name in [*preload, module]]
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(statements)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--modules", nargs="+", default=["wanted_jjh.main", "wanted_jjh.cli"]
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, help="wanted_jjh.main own_ms 예산")
+    args = parser.parse_args()
+
+    over_budget = False
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # import 만으로 DB 에 접근하지 않는지 확인할 수 있도록 빈 경로의 DB 를 사용한다.
+        env = {**os.environ, "DATABASE_URI": f"sqlite:///{tmp_dir}/startup.sqlite"}
+
+        for module in args.modules:
+            total_runs = [
+                import_times(module, preload=[], env=env) for _ in range(args.runs)
+            ]
+            own_runs = [
+                import_times(module, preload=PRELOADED_MODULES, env=env)
+                for _ in range(args.runs)
+            ]
+            total = min(total_runs, key=lambda times: times[module][1])
+            own = min(own_runs, key=lambda times: times[module][1])
+            result = {
+                "module": module,
+                "total_ms": total[module][1] / 1000,
+                "own_ms": own[module][1] / 1000,
+                "db_file_created": os.path.exists(f"{tmp_dir}/startup.sqlite"),
+                "slowest": [
+                    {"module": name, "self_ms": self_us / 1000}
+                    for name, (self_us, _) in sorted(
+                        total.items(), key=lambda item: item[1][0], reverse=True
+                    )[: args.top]
+                ],
+            }
+            print(json.dumps(result, ensure_ascii=False))
+
+            if (
+                args.budget_ms is not None
+                and module == "wanted_jjh.main"
+                and result["own_ms"] > args.budget_ms
+            ):
+                over_budget = True
+
+    if over_budget:
+        sys.exit(
+            f"wanted_jjh.main import 시간이 예산({args.budget_ms}ms)을 넘었습니다."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+워커 프로세스 수에 따른 처리량 비교 벤치마크.
+
+generate_companies.py 로 만든 데이터를 임시 SQLite 파일에 적재하고, 워커 수마다
+`cli.py serve --workers N` 서버를 띄운 뒤 load_test.py --base-url 클라이언트 여러 개로
+읽기 시나리오(search, get-company)를 동시에 보내 워커 수별 합계 RPS 와 p95 를 출력한다.
+클라이언트도 같은 호스트의 CPU 를 사용하므로, 코어 수보다 워커를 많이 띄우면 처리량이 늘지 않는다.
+
+    poetry run python benchmarks/workers.py --companies 10000 --workers 1 2 4 8 --clients 4
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from generate_companies import write_company_csv
+from load_test import seed_from_csv
+
+CLI_PATH = Path(__file__).parent.parent / "src" / "wanted_jjh" / "cli.py"
+LOAD_TEST_PATH = Path(__file__).parent / "load_test.py"
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(base_url: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{base_url}/metrics/db").raise_for_status()
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise TimeoutError(f"{base_url} 서버가 {timeout}초 안에 시작되지 않았습니다.")
+
+
+def run_clients(args: argparse.Namespace, base_url: str, csv_path: Path) -> dict:
+    clients = [
+        subprocess.Popen(
+            [
+                sys.executable,
+                str(LOAD_TEST_PATH),
+                "--base-url",
+                base_url,
+                "--csv",
+                str(csv_path),
+                "--companies",
+                str(args.companies),
+                "--scenarios",
+                *args.scenarios,
+                "--requests",
+                str(args.requests),
+                "--concurrency",
+                str(args.concurrency),
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(args.clients)
+    ]
+    results = [json.loads(client.communicate()[0]) for client in clients]
+
+    return {
+        scenario: {
+            "rps": round(sum(r["scenarios"][scenario]["rps"] for r in results), 1),
+            "p95_ms": max(r["scenarios"][scenario]["p95_ms"] for r in results),
+            "errors": sum(r["scenarios"][scenario]["errors"] for r in results),
+        }
+        for scenario in args.scenarios
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--companies", type=int, default=10_000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+    )
+    parser.add_argument("--clients", type=int, default=4, help="클라이언트 프로세스 수")
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="클라이언트별 요청 수"
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--scenarios", nargs="+", default=["search", "get-company"])
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "companies.csv"
+        database_url = f"sqlite:///{tmp_dir}/bench.sqlite"
+        write_company_csv(csv_path, args.companies)
+        seed_from_csv(database_url, csv_path)
+
+        for workers in args.workers:
+            port = get_free_port()
+            base_url = f"http://127.0.0.1:{port}"
+            server = subprocess.Popen(
+                [
+                    sys.executable,
+                    str(CLI_PATH),
+                    "serve",
+                    "--host",
+                    "127.0.0.1",
+                    "--port",
+                    str(port),
+                    "--workers",
+                    str(workers),
+                    "--preload",
+                ],
+                env={
+                    **os.environ,
+                    "DATABASE_URI": database_url,
+                    "RESPONSE_CACHE_BACKEND": "none",
+                },
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            try:
+                wait_until_ready(base_url)
+                results.append(
+                    {
+                        "workers": workers,
+                        "cpu_count": os.cpu_count(),
+                        "scenarios": run_clients(args, base_url, csv_path),
+                    }
+                )
+            finally:
+                server.terminate()
+                server.wait()
+
+    for result in results:
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
 #!/bin/bash
 echo "reset init db..."
 docker cp ./data wanted-jjh:/init-data/
-docker exec -it wanted-jjh /bin/bash -c "python /init-data/setup_init_db.py"
\ No newline at end of file
+docker exec -it wanted-jjh /bin/bash -c "python src/wanted_jjh/cli.py import-companies /init-data/company_tag_sample.csv --reset"
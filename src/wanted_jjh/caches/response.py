@@ -0,0 +1,481 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Iterable
+from typing import NamedTuple
+from typing import Protocol
+from urllib.parse import urlencode
+
+from starlette.responses import Response
+
+from wanted_jjh.enums import SearchMode
+from wanted_jjh.hangul import has_hangul
+from wanted_jjh.hangul import is_chosung_query
+from wanted_jjh.indexes.company_name import fold
+from wanted_jjh.normalization import normalize_name
+
+# 캐시에 저장하지 않는 응답 헤더 (응답을 만들 때 다시 계산된다.)
+_EXCLUDED_HEADERS = {"content-length"}
+
+# 태그명 전문 검색(mode=fts) 응답은 검색어를 포함하는 모든 태그명의 변경에 영향을 받으므로,
+# 회사-태그 연결이 바뀔 때마다 함께 무효화한다.
+FULL_TEXT_TAG_SEARCH_TAG = "tag-search:fts"
+
+# 회사명 검색 응답은 검색 방식별 keyspace 의 세대 번호를 key 에 붙여 저장한다.
+# 새 회사가 추가되면 keyspace 마다 세대 번호를 한 번 올려 이전 응답을 모두 무효화한다.
+# (검색어별 태그로 무효화하면 회사명의 모든 부분 문자열만큼 태그를 지워야 한다.)
+SEARCH_KEYSPACE = "search"
+FULL_TEXT_SEARCH_KEYSPACE = "search-fts"
+CHOSUNG_SEARCH_KEYSPACE = "search-chosung"
+JAMO_SEARCH_KEYSPACE = "search-jamo"
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    headers: dict[str, str]
+
+    @classmethod
+    def from_response(cls, response: Response) -> "CachedResponse":
+        return cls(
+            body=bytes(response.body),
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name not in _EXCLUDED_HEADERS
+            },
+        )
+
+    def to_response(self) -> Response:
+        return Response(content=self.body, headers=self.headers)
+
+
+def make_cache_key(route_name: str, **params) -> str:
+    # 같은 라우트/파라미터/언어의 요청은 같은 키가 된다. (여러 값을 받는 파라미터는 list)
+    return f"{route_name}?{urlencode(sorted(params.items()), doseq=True)}"
+
+
+# 회사명/태그명 조회는 정규화한 이름(name_key)으로 찾으므로, 표기가 다른 이름으로 조회한
+# 응답도 함께 무효화되도록 정규화한 이름으로 태그를 만든다.
+def company_name_tag(company_name: str) -> str:
+    return f"company-name:{normalize_name(company_name)}"
+
+
+def tag_name_tag(tag_name: str) -> str:
+    return f"tag-name:{normalize_name(tag_name)}"
+
+
+def search_keyspace(query: str, mode: SearchMode) -> str:
+    if mode == SearchMode.fts:
+        return FULL_TEXT_SEARCH_KEYSPACE
+    if mode == SearchMode.jamo:
+        # CompanyNameIndex.iter_matches 와 같은 기준으로 초성/자모/일반 검색어를 나눈다.
+        folded_query = fold(query)
+        if is_chosung_query(folded_query):
+            return CHOSUNG_SEARCH_KEYSPACE
+        if has_hangul(folded_query):
+            return JAMO_SEARCH_KEYSPACE
+    return SEARCH_KEYSPACE
+
+
+def search_keyspaces_for_name(company_name: str) -> set[str]:
+    """
+    회사명이 추가되었을 때 결과가 바뀔 수 있는 회사명 검색 keyspace.
+    초성/자모 검색(mode=jamo)의 한글 검색어는 한글이 있는 회사명만 찾는다.
+    """
+    keyspaces = {SEARCH_KEYSPACE, FULL_TEXT_SEARCH_KEYSPACE}
+    if has_hangul(company_name):
+        keyspaces.update((CHOSUNG_SEARCH_KEYSPACE, JAMO_SEARCH_KEYSPACE))
+    return keyspaces
+
+
+class ResponseCacheBackend(Protocol):
+    name: str
+
+    def get(self, key: str) -> CachedResponse | None: ...
+
+    def set(self, key: str, value: CachedResponse, tags: Iterable[str]) -> None: ...
+
+    def invalidate(self, tags: Iterable[str]) -> int: ...
+
+    def generation(self, keyspace: str) -> int: ...
+
+    def bump_generations(self, keyspaces: Iterable[str]) -> None: ...
+
+    def stats(self) -> dict: ...
+
+
+class LocalCacheBackend:
+    """
+    프로세스 메모리 LRU 캐시. 항목 수/응답 크기 합계 한도를 넘으면 가장 오래 사용하지 않은
+    항목부터 제거하고, TTL 이 지난 항목은 조회할 때 제거한다.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        max_bytes: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        # key -> (만료 시각, 응답, 태그)
+        self._entries: OrderedDict[
+            str, tuple[float, CachedResponse, frozenset[str]]
+        ] = OrderedDict()
+        # 태그 -> 해당 태그로 저장된 key
+        self._tag_keys: dict[str, set[str]] = {}
+        # keyspace -> 세대 번호 (이전 세대의 응답은 LRU/TTL 로 정리된다.)
+        self._generations: dict[str, int] = {}
+        self._bytes = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value, _ = entry
+            if expires_at <= self._clock():
+                self._remove(key)
+                self._expirations += 1
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: CachedResponse, tags: Iterable[str]) -> None:
+        if len(value.body) > self.max_bytes:
+            return
+
+        tags = frozenset(tags)
+        with self._lock:
+            self._remove(key)
+
+            self._entries[key] = (self._clock() + self.ttl_seconds, value, tags)
+            self._bytes += len(value.body)
+            for tag in tags:
+                self._tag_keys.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                for key in self._tag_keys.get(tag, set()).copy():
+                    self._remove(key)
+                    removed += 1
+        return removed
+
+    def generation(self, keyspace: str) -> int:
+        with self._lock:
+            return self._generations.get(keyspace, 0)
+
+    def bump_generations(self, keyspaces: Iterable[str]) -> None:
+        with self._lock:
+            for keyspace in keyspaces:
+                self._generations[keyspace] = self._generations.get(keyspace, 0) + 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        _, value, tags = entry
+        self._bytes -= len(value.body)
+        for tag in tags:
+            keys = self._tag_keys[tag]
+            keys.discard(key)
+            if not keys:
+                del self._tag_keys[tag]
+
+
+class LocalSharedStore:
+    """
+    SharedCacheBackend 가 사용하는 Redis 명령(get/set/incr/sadd/sunion/expire/delete)과
+    pipeline 만 프로세스 메모리로 흉내 낸 저장소. 공유 캐시 서버 없이 개발/테스트할 때 사용한다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (만료 시각 | None, 값)
+        self._data: dict[str, tuple[float | None, bytes | set[bytes]]] = {}
+
+    def get(self, name: str) -> bytes | None:
+        with self._lock:
+            value = self._get(name)
+            return value if isinstance(value, bytes) else None
+
+    def sadd(self, name: str, *values: str) -> int:
+        with self._lock:
+            members = self._get(name)
+            if not isinstance(members, set):
+                members = set()
+                self._data[name] = (None, members)
+            before = len(members)
+            members.update(value.encode() for value in values)
+            return len(members) - before
+
+    def sunion(self, *names: str) -> set[bytes]:
+        with self._lock:
+            return set().union(
+                *(
+                    members
+                    for name in names
+                    if isinstance(members := self._get(name), set)
+                )
+            )
+
+    def incr(self, name: str) -> int:
+        with self._lock:
+            entry = self._data.get(name)
+            expires_at = entry[0] if entry is not None else None
+            value = int(self._get(name) or 0) + 1
+            self._data[name] = (expires_at, str(value).encode())
+            return value
+
+    def expire(self, name: str, time: int) -> bool:
+        with self._lock:
+            value = self._get(name)
+            if value is None:
+                return False
+            self._data[name] = (self._expires_at(time), value)
+            return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(name, None) is not None for name in names)
+
+    def dbsize(self) -> int:
+        with self._lock:
+            return sum(self._get(name) is not None for name in list(self._data))
+
+    def pipeline(self, transaction: bool = True) -> "_LocalSharedPipeline":
+        return _LocalSharedPipeline(self)
+
+    def _get(self, name: str) -> bytes | set[bytes] | None:
+        entry = self._data.get(name)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[name]
+            return None
+        return value
+
+    def _expires_at(self, seconds: int | None) -> float | None:
+        return None if seconds is None else self._clock() + seconds
+
+    # 클래스 본문에서 내장 set 타입을 가리지 않도록 마지막에 정의한다.
+    def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        with self._lock:
+            self._data[name] = (self._expires_at(ex), value)
+        return True
+
+
+class _LocalSharedPipeline:
+    """명령을 모아 두었다가 execute 할 때 순서대로 실행하고 결과 목록을 돌려준다."""
+
+    def __init__(self, store: LocalSharedStore) -> None:
+        self._store = store
+        self._commands: list[tuple[Callable, tuple, dict]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., "_LocalSharedPipeline"]:
+        command = getattr(self._store, name)
+
+        def queue(*args, **kwargs) -> "_LocalSharedPipeline":
+            self._commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list:
+        commands, self._commands = self._commands, []
+        return [command(*args, **kwargs) for command, args, kwargs in commands]
+
+
+class SharedCacheBackend:
+    """
+    여러 워커/서버가 함께 쓰는 Redis 호환 저장소에 응답을 저장하는 캐시.
+    항목 수/메모리 한도는 저장소 설정(maxmemory 등)을 따르고, 태그는 key 집합(set)으로,
+    keyspace 의 세대 번호는 정수 key 로 저장한다. 저장/무효화는 태그 수와 상관없이
+    pipeline 으로 왕복 한두 번에 처리한다.
+    """
+
+    name = "shared"
+
+    def __init__(
+        self, client, *, ttl_seconds: int, prefix: str = "wanted_jjh:response:"
+    ) -> None:
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def get(self, key: str) -> CachedResponse | None:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+
+        headers, _, body = raw.partition(b"\n")
+        return CachedResponse(body=body, headers=json.loads(headers))
+
+    def set(self, key: str, value: CachedResponse, tags: Iterable[str]) -> None:
+        raw = json.dumps(value.headers).encode() + b"\n" + value.body
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.set(self.prefix + key, raw, ex=self.ttl_seconds)
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            pipeline.sadd(tag_key, key)
+            # 태그에 속한 응답보다 먼저 만료되지 않도록 TTL 을 함께 연장한다.
+            pipeline.expire(tag_key, self.ttl_seconds)
+        pipeline.execute()
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        if not tag_keys:
+            return 0
+
+        # 태그들에 속한 응답 key 를 한 번에 모은 뒤, 응답과 태그를 한 번에 지운다.
+        keys = [
+            self.prefix + (key.decode() if isinstance(key, bytes) else key)
+            for key in self.client.sunion(*tag_keys)
+        ]
+        pipeline = self.client.pipeline(transaction=False)
+        if keys:
+            pipeline.delete(*keys)
+        pipeline.delete(*tag_keys)
+        results = pipeline.execute()
+        return results[0] if keys else 0
+
+    def generation(self, keyspace: str) -> int:
+        return int(self.client.get(self._generation_key(keyspace)) or 0)
+
+    def bump_generations(self, keyspaces: Iterable[str]) -> None:
+        pipeline = self.client.pipeline(transaction=False)
+        for keyspace in keyspaces:
+            pipeline.incr(self._generation_key(keyspace))
+        pipeline.execute()
+
+    def stats(self) -> dict:
+        return {}
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _generation_key(self, keyspace: str) -> str:
+        return f"{self.prefix}generation:{keyspace}"
+
+
+class ResponseCache:
+    """
+    GET 응답(직렬화된 본문과 헤더)을 저장하는 read-through 캐시.
+
+    응답은 결과에 영향을 주는 회사명/태그명 태그와 함께 저장하고,
+    쓰기 API 는 바뀐 데이터의 태그만 무효화한다. (쓰기와 동시에 계산된 응답이
+    무효화 이후에 저장되면 TTL 동안 남을 수 있다.)
+    회사명 검색 응답은 태그 대신 keyspace 의 세대 번호를 key 에 붙여 저장하고, 새 회사가
+    추가되면 세대 번호를 올린다. 이전 세대의 응답은 더 이상 읽히지 않고 TTL/LRU 로 정리된다.
+    """
+
+    def __init__(self, backend: ResponseCacheBackend) -> None:
+        self.backend = backend
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, key: str) -> CachedResponse | None:
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, key: str, value: CachedResponse, *, tags: Iterable[str]) -> None:
+        self.backend.set(key, value, tags)
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        removed = self.backend.invalidate(tags)
+        with self._lock:
+            self._invalidations += removed
+
+    def generation_key(self, key: str, keyspace: str) -> str:
+        return f"{key}&generation={self.backend.generation(keyspace)}"
+
+    def bump_generations(self, keyspaces: Iterable[str]) -> None:
+        self.backend.bump_generations(keyspaces)
+
+    def stats(self) -> dict:
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                "backend": self.backend.name,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / requests, 4) if requests else 0.0,
+                "invalidations": self._invalidations,
+                **self.backend.stats(),
+            }
+
+
+def create_response_cache(
+    backend_name: str,
+    *,
+    ttl_seconds: int,
+    max_entries: int,
+    max_bytes: int,
+    redis_url: str | None = None,
+) -> ResponseCache | None:
+    if backend_name == "none":
+        return None
+
+    if backend_name == "local":
+        return ResponseCache(
+            LocalCacheBackend(
+                ttl_seconds=ttl_seconds, max_entries=max_entries, max_bytes=max_bytes
+            )
+        )
+
+    if backend_name == "shared":
+        if redis_url is None:
+            client = LocalSharedStore()
+        else:
+            try:
+                import redis
+            except ImportError as e:
+                raise RuntimeError(
+                    "RESPONSE_CACHE_REDIS_URL 을 사용하려면 redis 패키지가 필요합니다."
+                ) from e
+            client = redis.Redis.from_url(redis_url)
+
+        return ResponseCache(SharedCacheBackend(client, ttl_seconds=ttl_seconds))
+
+    raise ValueError(f"{backend_name} 는 지원하지 않는 응답 캐시입니다.")
@@ -1,6 +1,207 @@
-import uvicorn
+import argparse
+import sys
+from pathlib import Path
+
+from wanted_jjh import settings
+
+
+def serve(args: argparse.Namespace) -> None:
+    from wanted_jjh.server import prepare_database
+    from wanted_jjh.server import run_production_server
+
+    if args.workers > 1 or args.preload:
+        run_production_server(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            preload=args.preload is not False,
+            graceful_timeout=args.graceful_timeout,
+            pid_path=args.pid,
+            migrate=args.migrate,
+        )
+        return
+
+    import uvicorn
+
+    if args.migrate:
+        prepare_database()
+
+    from wanted_jjh.main import app
+
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+def reload(args: argparse.Namespace) -> None:
+    from wanted_jjh.server import reload_production_server
+
+    reload_production_server(args.pid)
+
+
+def import_companies(args: argparse.Namespace) -> None:
+    from wanted_jjh.db.migrations import upgrade
+    from wanted_jjh.db.session import DBBase
+    from wanted_jjh.importers.company_csv import DEFAULT_CHUNK_SIZE
+    from wanted_jjh.importers.company_csv import CompanyCsvImporter
+
+    engine = _get_engine(args.database_url)
+    checkpoint_path = args.checkpoint or args.csv_path.with_name(
+        f"{args.csv_path.name}.checkpoint.json"
+    )
+
+    if args.reset:
+        DBBase.metadata.drop_all(engine)
+        checkpoint_path.unlink(missing_ok=True)
+    upgrade(engine)
+
+    result = CompanyCsvImporter(
+        engine, chunk_size=args.chunk_size or DEFAULT_CHUNK_SIZE
+    ).run(args.csv_path, checkpoint_path=checkpoint_path)
+    print(
+        f"{result.rows} 행 적재 완료 ({result.skipped_rows} 행 건너뜀): "
+        f"{result.elapsed_seconds:.1f}초, {result.rows_per_second:,.0f} rows/sec"
+    )
+
+
+def migrate(args: argparse.Namespace) -> None:
+    from wanted_jjh.db.migrations import upgrade
+
+    upgrade(_get_engine(args.database_url))
+    print("DB 스키마를 최신 모델에 맞췄습니다.")
+
+
+def _get_engine(database_url: str | None):
+    from wanted_jjh.db.session import create_db_engine
+    from wanted_jjh.db.session import engine
+
+    return create_db_engine(database_url) if database_url else engine
+
+
+def rebuild_documents(args: argparse.Namespace) -> None:
+    from wanted_jjh.services.company_document import rebuild_company_documents
+
+    with _get_engine(args.database_url).connect() as conn:
+        company_count = rebuild_company_documents(conn, batch_size=args.batch_size)
+    print(f"{company_count} 개 회사의 문서를 다시 만들었습니다.")
+
+
+def check_documents(args: argparse.Namespace) -> None:
+    from wanted_jjh.services.company_document import check_company_documents
+
+    with _get_engine(args.database_url).connect() as conn:
+        mismatches = list(check_company_documents(conn, batch_size=args.batch_size))
+
+    for mismatch in mismatches[: args.max_reports]:
+        print(
+            f"company_id={mismatch.company_id} "
+            f"language_code={mismatch.language_code}: {mismatch.reason}"
+        )
+
+    if mismatches:
+        print(
+            f"{len(mismatches)} 개 문서가 일치하지 않습니다. (rebuild-documents 로 복구)"
+        )
+        sys.exit(1)
+    print("모든 회사 문서가 일치합니다.")
+
+
+def backfill_name_keys(args: argparse.Namespace) -> None:
+    from wanted_jjh.services.name_key import backfill_name_keys
+
+    with _get_engine(args.database_url).connect() as conn:
+        row_count = backfill_name_keys(conn, batch_size=args.batch_size)
+    print(f"{row_count} 개 회사명/태그명 번역의 정규화 키를 채웠습니다.")
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="wanted_jjh")
+    subparsers = parser.add_subparsers(required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="API 서버 실행")
+    serve_parser.add_argument("--host", default="0.0.0.0")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.WEB_CONCURRENCY,
+        help="워커 프로세스 수 (기본값: WEB_CONCURRENCY 설정, 2 이상이면 gunicorn 으로 실행)",
+    )
+    serve_parser.add_argument(
+        "--preload",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="마스터에서 앱과 검색 색인을 미리 로드한 뒤 fork 한다. (워커가 여러 개면 기본값)",
+    )
+    serve_parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=settings.GRACEFUL_TIMEOUT_SECONDS,
+        help="재시작/종료 시 워커가 처리 중인 요청을 마칠 때까지 기다리는 시간(초)",
+    )
+    serve_parser.add_argument("--pid", type=Path, help="gunicorn 마스터 pid 파일")
+    serve_parser.add_argument(
+        "--migrate",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="시작 전에 DB 스키마를 맞춘다. (migrate 명령을 따로 실행하면 --no-migrate)",
+    )
+    serve_parser.set_defaults(func=serve)
+
+    reload_parser = subparsers.add_parser(
+        "reload", help="실행 중인 멀티 워커 서버의 워커를 무중단으로 교체"
+    )
+    reload_parser.add_argument("--pid", type=Path, required=True)
+    reload_parser.set_defaults(func=reload)
+
+    migrate_parser = subparsers.add_parser(
+        "migrate", help="DB 스키마 생성/마이그레이션 (serve 도 시작 전에 실행한다)"
+    )
+    migrate_parser.add_argument("--database-url", help="기본값: DATABASE_URI 설정")
+    migrate_parser.set_defaults(func=migrate)
+
+    import_parser = subparsers.add_parser(
+        "import-companies", help="회사/태그 CSV 대량 적재"
+    )
+    import_parser.add_argument("csv_path", type=Path)
+    import_parser.add_argument(
+        "--chunk-size", type=int, help="한 트랜잭션에서 적재할 행 수 (기본값: 10,000)"
+    )
+    import_parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        help="이어서 적재하기 위한 checkpoint 파일 (기본값: <csv_path>.checkpoint.json)",
+    )
+    import_parser.add_argument(
+        "--reset", action="store_true", help="기존 테이블을 지우고 새로 적재한다."
+    )
+    import_parser.add_argument("--database-url", help="기본값: DATABASE_URI 설정")
+    import_parser.set_defaults(func=import_companies)
+
+    for name, func, help in [
+        ("rebuild-documents", rebuild_documents, "회사 문서 전체 재생성"),
+        ("check-documents", check_documents, "회사 문서 일관성 검사"),
+        (
+            "backfill-name-keys",
+            backfill_name_keys,
+            "회사명/태그명 정규화 키(name_key)가 비어 있는 번역 채우기",
+        ),
+    ]:
+        batch_parser = subparsers.add_parser(name, help=help)
+        batch_parser.add_argument("--batch-size", type=int, default=1000)
+        batch_parser.add_argument("--database-url", help="기본값: DATABASE_URI 설정")
+        batch_parser.set_defaults(func=func)
+    subparsers.choices["check-documents"].add_argument(
+        "--max-reports", type=int, default=100
+    )
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    # 인자 없이 실행하면 기존처럼 서버를 실행한다. (Docker ENTRYPOINT)
+    args = get_parser().parse_args(argv or ["serve"])
+    args.func(args)
 
-from wanted_jjh.main import app
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    main()
@@ -0,0 +1,27 @@
+from sqlalchemy import ColumnElement
+from sqlalchemy import and_
+from sqlalchemy import case
+from sqlalchemy import func
+
+
+def translated_name(
+    name_column: ColumnElement, language_code_column: ColumnElement, *language_codes
+) -> ColumnElement:
+    """
+    GROUP BY 로 묶인 번역 행 중 language_codes 순서대로 비어있지 않은 번역명을 고르는
+    집계 컬럼. 해당하는 번역이 없으면 빈 문자열이 된다.
+    """
+    return func.coalesce(
+        *(
+            func.max(
+                case(
+                    (
+                        and_(language_code_column == code, name_column != ""),
+                        name_column,
+                    )
+                )
+            )
+            for code in language_codes
+        ),
+        "",
+    )
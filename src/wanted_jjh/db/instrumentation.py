@@ -0,0 +1,118 @@
+import logging
+import threading
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import Engine
+from sqlalchemy import event
+
+from wanted_jjh import settings
+
+logger = logging.getLogger(__name__)
+
+# 라우트가 정해지지 않은 요청(404 등)의 라우트 이름
+UNMATCHED_ROUTE_NAME = "unmatched"
+
+
+class QueryStats:
+    """한 요청에서 실행된 SQL 문 수와 DB 시간"""
+
+    __slots__ = ("count", "scope", "seconds", "slow_count")
+
+    def __init__(self, scope: dict | None = None) -> None:
+        self.scope = scope
+        self.count = 0
+        self.seconds = 0.0
+        self.slow_count = 0
+
+    @property
+    def route_name(self) -> str:
+        # 라우팅 이후에는 ASGI scope 에 FastAPI 가 찾은 route 가 들어있다.
+        route = (self.scope or {}).get("route")
+        return getattr(route, "name", None) or UNMATCHED_ROUTE_NAME
+
+    def server_timing(self) -> str:
+        return f'db;desc="{self.count} queries";dur={self.seconds * 1000:.2f}'
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    engine 으로 실행되는 SQL 문마다 실행 시간을 재서 현재 요청의 QueryStats 에 더하고,
+    settings.SLOW_QUERY_MS 이상 걸린 SQL 문은 라우트 이름과 함께 로그로 남긴다.
+    (AsyncEngine 은 sync_engine 을 넘긴다.)
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - conn.info["query_started_at"].pop()
+    stats = current_query_stats.get()
+
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += seconds
+
+    if seconds * 1000 >= settings.SLOW_QUERY_MS:
+        if stats is not None:
+            stats.slow_count += 1
+        logger.warning(
+            "slow query %.1fms (%s): %s",
+            seconds * 1000,
+            stats.route_name if stats is not None else "-",
+            statement,
+        )
+
+
+class QueryMetrics:
+    """라우트 이름별 요청 수, SQL 문 수, DB 시간 누적 통계 (프로세스 단위)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: dict[str, dict] = {}
+
+    def record(self, stats: QueryStats) -> None:
+        milliseconds = stats.seconds * 1000
+        with self._lock:
+            route = self._routes.setdefault(
+                stats.route_name,
+                {
+                    "requests": 0,
+                    "queries": 0,
+                    "max_queries": 0,
+                    "db_ms": 0.0,
+                    "max_db_ms": 0.0,
+                    "slow_queries": 0,
+                },
+            )
+            route["requests"] += 1
+            route["queries"] += stats.count
+            route["max_queries"] = max(route["max_queries"], stats.count)
+            route["db_ms"] += milliseconds
+            route["max_db_ms"] = max(route["max_db_ms"], milliseconds)
+            route["slow_queries"] += stats.slow_count
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                route_name: {
+                    **route,
+                    "db_ms": round(route["db_ms"], 2),
+                    "max_db_ms": round(route["max_db_ms"], 2),
+                    "avg_queries": round(route["queries"] / route["requests"], 2),
+                    "avg_db_ms": round(route["db_ms"] / route["requests"], 2),
+                }
+                for route_name, route in sorted(self._routes.items())
+            }
@@ -0,0 +1,111 @@
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import Table
+from sqlalchemy import delete
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy import tuple_
+from sqlalchemy.schema import CreateColumn
+
+from wanted_jjh.db.session import DBBase
+from wanted_jjh.db.session import engine
+from wanted_jjh.models import company as company_models
+from wanted_jjh.models import full_text as full_text_models
+from wanted_jjh.models.company_document import CompanyDocument
+from wanted_jjh.models.company_tag import association_company_and_company_tag
+from wanted_jjh.services.company_document import rebuild_company_documents
+from wanted_jjh.services.full_text_search import sync_company_name_fts
+from wanted_jjh.services.full_text_search import sync_company_tag_name_fts
+from wanted_jjh.services.name_key import backfill_name_keys
+
+# 모델 모듈을 import 해야 DBBase.metadata 에 테이블이 등록된다.
+_MODEL_MODULES = (company_models, full_text_models)
+
+
+def upgrade(bind: Engine) -> None:
+    """
+    DB 스키마를 현재 모델 기준으로 맞춘다. 여러 번 실행해도 안전하다.
+
+    create_all 은 이미 존재하는 테이블에 새로 추가된 컬럼/인덱스를 만들지 않으므로,
+    기존 DB 파일(wanted_jjh.sqlite)을 위해 컬럼과 인덱스를 하나씩 확인하며 추가한다.
+    """
+    with bind.begin() as conn:
+        # 회사 문서 테이블이 없거나, 정렬된 태그명 컬럼이 추가되기 전의 문서는 다시 만든다.
+        has_current_documents = _has_column(
+            conn, CompanyDocument.__tablename__, CompanyDocument.sorted_tag_names.name
+        )
+        DBBase.metadata.create_all(conn)
+
+        for table in DBBase.metadata.sorted_tables:
+            _add_missing_columns(conn, table)
+            existing_indexes = {
+                index["name"] for index in inspect(conn).get_indexes(table.name)
+            }
+            for index in sorted(table.indexes, key=lambda index: index.name):
+                if index.name in existing_indexes:
+                    continue
+                if index.unique and table is association_company_and_company_tag:
+                    _deduplicate_company_tag_associations(conn)
+                index.create(conn)
+
+        # 전문 검색 테이블이 새로 만들어졌거나 색인되지 않은 번역이 있으면 채운다.
+        sync_company_name_fts(conn)
+        sync_company_tag_name_fts(conn)
+
+        # 새 인덱스를 쿼리 플래너가 활용할 수 있도록 통계를 갱신한다.
+        if conn.dialect.name == "sqlite":
+            conn.execute(text("ANALYZE"))
+
+    # name_key 컬럼이 새로 추가되었으면 기존 번역의 키를 채운다.
+    with bind.connect() as conn:
+        backfill_name_keys(conn)
+
+    # 회사 문서 테이블이 새로 만들어졌거나 형식이 바뀌었으면 기존 회사의 문서를 채운다.
+    if not has_current_documents:
+        with bind.connect() as conn:
+            rebuild_company_documents(conn)
+
+
+def _has_column(conn: Connection, table_name: str, column_name: str) -> bool:
+    inspector = inspect(conn)
+    return inspector.has_table(table_name) and any(
+        column["name"] == column_name for column in inspector.get_columns(table_name)
+    )
+
+
+def _add_missing_columns(conn: Connection, table: Table) -> None:
+    # 새로 추가된 컬럼은 server_default 가 있어야 기존 행에 값을 채울 수 있다.
+    existing_columns = {
+        column["name"] for column in inspect(conn).get_columns(table.name)
+    }
+    for column in table.columns:
+        if column.name not in existing_columns:
+            column_definition = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.execute(
+                text(f"ALTER TABLE {table.name} ADD COLUMN {column_definition}")
+            )
+
+
+def _deduplicate_company_tag_associations(conn: Connection) -> None:
+    # 유니크 인덱스를 만들기 전에 (company_id, company_tag_id) 중복 연결을 하나만 남긴다.
+    # (연결 테이블에는 행을 구분할 키가 없으므로, 중복된 쌍을 모두 지우고 하나씩 다시 넣는다.)
+    table = association_company_and_company_tag
+    pair = (table.c.company_id, table.c.company_tag_id)
+    duplicates = conn.execute(
+        select(*pair)
+        .where(*(column.is_not(None) for column in pair))
+        .group_by(*pair)
+        .having(func.count() > 1)
+    ).all()
+    if not duplicates:
+        return
+
+    conn.execute(delete(table).where(tuple_(*pair).in_(duplicates)))
+    conn.execute(insert(table), [row._asdict() for row in duplicates])
+
+
+if __name__ == "__main__":
+    upgrade(engine)
@@ -1,18 +1,108 @@
+from sqlalchemy import Engine
+from sqlalchemy import URL
 from sqlalchemy import create_engine
+from sqlalchemy import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
 
 from wanted_jjh import settings
+from wanted_jjh.db.instrumentation import instrument_engine
+from wanted_jjh.db.sqlite import apply_sqlite_pragmas
+from wanted_jjh.db.sqlite import get_sqlite_pragmas
 
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URL,
-    pool_pre_ping=True,
-    connect_args={"check_same_thread": False},
-)
+# DB 종류별 비동기 드라이버
+ASYNC_DRIVER_NAMES = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def to_async_database_url(database_url: str) -> str:
+    url = make_url(database_url)
+    drivername = ASYNC_DRIVER_NAMES.get(url.get_backend_name(), url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def _is_sqlite(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite"
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    return _is_sqlite(url) and url.database in (None, "", ":memory:")
+
+
+def _engine_options(url: URL) -> dict:
+    options = {"pool_pre_ping": True}
+
+    # in-memory SQLite 는 커넥션마다 DB 가 다르므로 풀 크기를 설정하지 않는다.
+    if not _is_memory_sqlite(url):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        )
+
+    return options
+
+
+def create_db_engine(database_url: str) -> Engine:
+    url = make_url(database_url)
+    options = _engine_options(url)
+
+    if _is_sqlite(url):
+        options["connect_args"] = {"check_same_thread": False}
+
+    engine = create_engine(url, **options)
+
+    if _is_sqlite(url):
+        apply_sqlite_pragmas(engine, get_sqlite_pragmas(settings.SQLITE_PROFILE))
+
+    if settings.DB_INSTRUMENTATION:
+        instrument_engine(engine)
+
+    return engine
+
+
+def create_async_db_engine(database_url: str) -> AsyncEngine:
+    url = make_url(to_async_database_url(database_url))
+    options = _engine_options(url)
+
+    # SQLAlchemy 2.0.38 미만의 aiosqlite 는 파일 DB 에 NullPool 을 사용하므로 풀을 직접 지정한다.
+    if _is_sqlite(url) and not _is_memory_sqlite(url):
+        options["poolclass"] = AsyncAdaptedQueuePool
+
+    async_engine = create_async_engine(url, **options)
+
+    if _is_sqlite(url):
+        apply_sqlite_pragmas(
+            async_engine.sync_engine, get_sqlite_pragmas(settings.SQLITE_PROFILE)
+        )
+
+    if settings.DB_INSTRUMENTATION:
+        instrument_engine(async_engine.sync_engine)
+
+    return async_engine
+
+
+engine = create_db_engine(settings.SQLALCHEMY_DATABASE_URL)
 
 db_session = scoped_session(
     sessionmaker(autocommit=False, autoflush=False, bind=engine)
 )
 Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 드라이버는 비동기 DB 모드에서만 import 하고 커넥션 풀을 만든다.
+async_engine = (
+    create_async_db_engine(settings.SQLALCHEMY_DATABASE_URL)
+    if settings.ASYNC_DB
+    else None
+)
+
+AsyncSessionLocal = async_sessionmaker(autoflush=False, bind=async_engine)
+
 DBBase = declarative_base()
@@ -0,0 +1,54 @@
+from sqlalchemy import Engine
+from sqlalchemy import event
+
+from wanted_jjh import settings
+from wanted_jjh.normalization import normalize_name
+
+
+def get_sqlite_pragmas(profile: str) -> dict[str, str | int]:
+    if profile == "default":
+        return {}
+
+    if profile == "production":
+        return {
+            # 읽기와 쓰기가 서로를 막지 않도록 WAL 모드를 사용한다.
+            "journal_mode": "WAL",
+            # WAL 모드에서는 NORMAL 로도 커밋된 데이터가 손상되지 않는다.
+            "synchronous": "NORMAL",
+            "mmap_size": settings.SQLITE_MMAP_SIZE,
+            # 음수는 페이지 수가 아닌 KiB 단위이다.
+            "cache_size": -settings.SQLITE_CACHE_SIZE_KIB,
+            # 쓰기 락을 기다리는 동안 "database is locked" 대신 대기한다.
+            "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+            "temp_store": "MEMORY",
+        }
+
+    raise ValueError(f"{profile} 는 지원하지 않는 SQLite 프로파일입니다.")
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: dict[str, str | int]) -> None:
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def _normalize_name(name: str | None) -> str | None:
+    return None if name is None else normalize_name(name)
+
+
+@event.listens_for(Engine, "connect")
+def _register_sqlite_functions(dbapi_connection, connection_record):
+    # 전문 검색 색인을 SQL 한 문장으로 채울 수 있도록 모든 SQLite 커넥션에 이름 정규화 함수를 등록한다.
+    # (aiosqlite 커넥션도 같은 create_function 을 제공한다.)
+    if not hasattr(dbapi_connection, "create_function"):
+        return
+
+    dbapi_connection.create_function(
+        "normalize_name", 1, _normalize_name, deterministic=True
+    )
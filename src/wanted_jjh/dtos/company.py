@@ -1,13 +1,19 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompanyDTO:
     name: str
-    tag_names: list[str] | None = None
+    tag_names: tuple[str, ...] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class CompanySearchResultDTO:
+    companies: list[CompanyDTO]
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
 class TagDTO:
     ko_name: str | None = None
     en_name: str | None = None
@@ -15,7 +21,7 @@ class TagDTO:
     tw_name: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateCompanyDTO:
     ko_name: str
     en_name: str
@@ -23,8 +29,17 @@ class CreateCompanyDTO:
     tags: list[TagDTO]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppendCompanyTagDTO:
     tag_ko_name: str
     tag_en_name: str
     tag_ja_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class CompanyExportDTO:
+    company_id: int
+    # language_code -> 회사명 (번역이 없는 언어는 제외)
+    names: dict[str, str]
+    # 태그마다 {language_code: 태그명} (태그 id 순서)
+    tags: list[dict[str, str]]
@@ -6,3 +6,12 @@ class LanguageCode(StrEnum):
     en = "en"
     ja = "ja"
     tw = "tw"
+
+
+class SearchMode(StrEnum):
+    # 회사명: 부분 문자열(ASCII 대소문자 무시), 태그명: 완전 일치
+    default = "default"
+    # SQLite FTS5 전문 검색 (대소문자/전각·반각 무시, BM25 순위)
+    fts = "fts"
+    # 한국어 회사명 자동완성: 초성(ㅇㅌㄷ)과 조합 중인 음절(원틷)까지 찾는다. (회사명 검색 전용)
+    jamo = "jamo"
@@ -0,0 +1,89 @@
+import unicodedata
+
+# 완성형 한글 음절(가~힣)은 (초성 * 21 + 중성) * 28 + 종성 순서로 배치되어 있다.
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_END = 0xD7A3
+_JUNG_COUNT = 21
+_JONG_COUNT = 28
+
+# 한글 호환 자모 (키보드로 입력하는 낱자)
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSUNG = ("",) + tuple("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+# 두 번에 나눠 입력하는 겹모음/겹받침은 입력 순서대로 나눈다.
+# (쌍자음은 한 번에 입력하므로 나누지 않는다.)
+_COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+}
+
+# 호환 자모 중 자음(ㄱ~ㅎ)과 전체(ㄱ~ㅣ) 범위
+_CONSONANT_RANGE = ("ㄱ", "ㅎ")
+_JAMO_RANGE = ("ㄱ", "ㅣ")
+
+
+def _is_syllable(char: str) -> bool:
+    return _SYLLABLE_BASE <= ord(char) <= _SYLLABLE_END
+
+
+def _is_jamo(char: str) -> bool:
+    return _JAMO_RANGE[0] <= char <= _JAMO_RANGE[1]
+
+
+def has_hangul(text: str) -> bool:
+    return any(_is_syllable(char) or _is_jamo(char) for char in text)
+
+
+def is_chosung_query(text: str) -> bool:
+    """공백을 제외하면 자음(ㄱ~ㅎ)으로만 이루어진 검색어인지 확인한다. (예: ㅇㅌㄷ)"""
+    chars = [char for char in text if not char.isspace()]
+    return bool(chars) and all(
+        _CONSONANT_RANGE[0] <= char <= _CONSONANT_RANGE[1] for char in chars
+    )
+
+
+def to_jamo(text: str) -> str:
+    """
+    한글 음절을 입력 순서대로 자모로 풀어쓴다. (예: 원티드 -> ㅇㅜㅓㄴㅌㅣㄷㅡ)
+    조합 중인 음절(원틷)도 풀어쓰면 완성된 이름(원티드)의 접두어가 된다.
+    한글이 아닌 글자는 그대로 둔다.
+    """
+    chars = []
+    for char in unicodedata.normalize("NFC", text):
+        if _is_syllable(char):
+            index = ord(char) - _SYLLABLE_BASE
+            chars.append(_CHOSUNG[index // (_JUNG_COUNT * _JONG_COUNT)])
+            jung = _JUNGSUNG[index // _JONG_COUNT % _JUNG_COUNT]
+            jong = _JONGSUNG[index % _JONG_COUNT]
+            chars.append(_COMPOUND_JAMO.get(jung, jung))
+            chars.append(_COMPOUND_JAMO.get(jong, jong))
+        else:
+            chars.append(_COMPOUND_JAMO.get(char, char))
+    return "".join(chars)
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 바꾼다. (예: 원티드 랩 -> ㅇㅌㄷ ㄹ) 한글이 아닌 글자는 그대로 둔다."""
+    return "".join(
+        _CHOSUNG[(ord(char) - _SYLLABLE_BASE) // (_JUNG_COUNT * _JONG_COUNT)]
+        if _is_syllable(char)
+        else char
+        for char in unicodedata.normalize("NFC", text)
+    )
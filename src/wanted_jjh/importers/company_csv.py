@@ -0,0 +1,280 @@
+import csv
+import json
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+from typing import NamedTuple
+from typing import TextIO
+
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import select
+
+from wanted_jjh.enums import LanguageCode
+from wanted_jjh.models.company import Company
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_tag import CompanyTag
+from wanted_jjh.models.company_tag import CompanyTagName
+from wanted_jjh.models.company_tag import association_company_and_company_tag
+from wanted_jjh.normalization import normalize_name
+from wanted_jjh.services.company_document import refresh_company_documents
+from wanted_jjh.services.full_text_search import sync_company_name_fts
+from wanted_jjh.services.full_text_search import sync_company_tag_name_fts
+
+# 한 트랜잭션에서 적재할 CSV 행 수
+DEFAULT_CHUNK_SIZE = 10_000
+
+# tag_ko / tag_en ... 컬럼 안에서 태그를 구분하는 문자
+TAG_SEPARATOR = "|"
+
+
+class CompanyRow(NamedTuple):
+    line_number: int
+    # language_code -> 회사명
+    names: dict[str, str]
+    # 태그마다 {language_code: 태그명}
+    tags: list[dict[str, str]]
+
+
+class ImportResult(NamedTuple):
+    rows: int
+    skipped_rows: int
+    elapsed_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def read_company_rows(file: TextIO) -> Iterator[CompanyRow]:
+    """
+    company_{언어} / tag_{언어} 컬럼으로 된 CSV 를 한 행씩 읽는다.
+    태그 컬럼은 "|" 로 구분하며, 값이 비어있는 언어는 태그명이 없는 것으로 본다.
+    """
+    reader = csv.DictReader(file)
+    fieldnames = reader.fieldnames or []
+    company_codes = [code for code in LanguageCode if f"company_{code}" in fieldnames]
+    tag_codes = [code for code in LanguageCode if f"tag_{code}" in fieldnames]
+
+    for row in reader:
+        names = {code: row[f"company_{code}"] or "" for code in company_codes}
+
+        tag_names = {
+            code: [name.strip() for name in row[f"tag_{code}"].split(TAG_SEPARATOR)]
+            for code in tag_codes
+            if row[f"tag_{code}"]
+        }
+        if len({len(names) for names in tag_names.values()}) > 1:
+            raise ValueError(
+                f"{reader.line_num} 번째 줄의 언어별 태그 수가 서로 다릅니다."
+            )
+
+        tag_count = max((len(names) for names in tag_names.values()), default=0)
+        tags = [
+            {code: names[i] for code, names in tag_names.items() if names[i]}
+            for i in range(tag_count)
+        ]
+
+        yield CompanyRow(
+            line_number=reader.line_num,
+            names=names,
+            tags=[tag for tag in tags if tag],
+        )
+
+
+class CompanyCsvImporter:
+    """
+    회사/태그 CSV 를 청크 단위로 읽어 Core executemany 로 적재한다.
+
+    - 청크마다 하나의 트랜잭션으로 회사, 회사명, 새 태그, 태그명, 회사-태그 연결을 INSERT 하고
+      전문 검색 색인과 회사 문서(company_documents)를 만든다.
+    - 회사/태그 id 는 적재 시작 시점의 최대 id 이후로 직접 부여하고,
+      태그는 (언어, 태그명) -> 태그 id 사전으로 메모리에서 중복을 제거한다.
+      (서비스의 태그 추가와 같이 한 언어라도 태그명이 같으면 같은 태그로 본다.)
+    - PostgreSQL 은 직접 부여한 id 로 serial 시퀀스가 움직이지 않으므로, 청크마다 회사/태그
+      id 시퀀스를 적재한 최대 id 로 옮긴다. (SQLite 는 최대 rowid 다음 값을 쓴다.)
+    - checkpoint 파일에는 이번 적재의 첫 회사 id 를 기록한다. 다시 실행하면 DB 에 커밋된
+      회사 수만큼 CSV 행을 건너뛰고 이어서 적재한다.
+      그러므로 적재하는 동안에는 API 등 다른 곳에서 회사를 추가하지 않아야 한다.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        report: Callable[[str], None] = print,
+    ) -> None:
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.report = report
+
+        self._first_company_id = 1
+        self._next_company_id = 1
+        self._next_tag_id = 1
+        self._tag_ids: dict[tuple[str, str], int] = {}
+
+    def run(
+        self, csv_path: Path, *, checkpoint_path: Path | None = None
+    ) -> ImportResult:
+        started_at = time.perf_counter()
+        self._load_state()
+
+        skipped_rows = 0
+        if checkpoint_path is not None:
+            skipped_rows = self._resume(csv_path, checkpoint_path)
+            if skipped_rows:
+                self.report(
+                    f"checkpoint 이후부터 적재합니다. ({skipped_rows} 행 건너뜀)"
+                )
+
+        rows = 0
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            company_rows = islice(read_company_rows(f), skipped_rows, None)
+
+            while chunk := list(islice(company_rows, self.chunk_size)):
+                with self.engine.begin() as conn:
+                    self._write_chunk(conn, chunk)
+
+                rows += len(chunk)
+                if checkpoint_path is not None:
+                    self._write_checkpoint(
+                        checkpoint_path, csv_path, rows=skipped_rows + rows
+                    )
+
+                elapsed = time.perf_counter() - started_at
+                self.report(
+                    f"{skipped_rows + rows} 행 적재 ({rows / elapsed:,.0f} rows/sec)"
+                )
+
+        return ImportResult(
+            rows=rows,
+            skipped_rows=skipped_rows,
+            elapsed_seconds=time.perf_counter() - started_at,
+        )
+
+    def _load_state(self) -> None:
+        with self.engine.connect() as conn:
+            self._next_company_id = (conn.scalar(select(func.max(Company.id))) or 0) + 1
+            self._next_tag_id = (conn.scalar(select(func.max(CompanyTag.id))) or 0) + 1
+
+            # 이미 저장된 태그도 같은 태그명이면 재사용한다. (서비스와 같이 가장 먼저 추가된 태그)
+            # 태그명은 서비스와 같이 대소문자/전각·반각을 무시하고(name_key) 비교한다.
+            self._tag_ids = {}
+            for language_code, name_key, tag_id in conn.execute(
+                select(
+                    CompanyTagName.language_code,
+                    CompanyTagName.name_key,
+                    CompanyTagName.tag_id,
+                )
+                .where(CompanyTagName.tag_id.is_not(None))
+                .order_by(CompanyTagName.tag_id)
+            ):
+                self._tag_ids.setdefault((language_code, name_key), tag_id)
+
+    def _resume(self, csv_path: Path, checkpoint_path: Path) -> int:
+        if not checkpoint_path.exists():
+            self._first_company_id = self._next_company_id
+            self._write_checkpoint(checkpoint_path, csv_path, rows=0)
+            return 0
+
+        checkpoint = json.loads(checkpoint_path.read_text())
+        if checkpoint["source"] != str(csv_path.resolve()):
+            raise ValueError(
+                f"{checkpoint_path} 는 {checkpoint['source']} 적재의 checkpoint 입니다."
+            )
+
+        # checkpoint 파일을 쓰기 전에 중단되었을 수 있으므로, 커밋된 회사 수를 기준으로 한다.
+        self._first_company_id = checkpoint["first_company_id"]
+        return self._next_company_id - self._first_company_id
+
+    def _write_checkpoint(
+        self, checkpoint_path: Path, csv_path: Path, *, rows: int
+    ) -> None:
+        checkpoint_path.write_text(
+            json.dumps(
+                {
+                    "source": str(csv_path.resolve()),
+                    "first_company_id": self._first_company_id,
+                    "rows": rows,
+                }
+            )
+        )
+
+    def _write_chunk(self, conn: Connection, chunk: list[CompanyRow]) -> None:
+        companies = []
+        company_names = []
+        tags = []
+        tag_names = []
+        links = []
+
+        for row in chunk:
+            company_id = self._next_company_id
+            self._next_company_id += 1
+
+            companies.append({"id": company_id})
+            company_names.extend(
+                {"company_id": company_id, "language_code": code, "name": name}
+                for code, name in row.names.items()
+            )
+
+            linked_tag_ids = set()
+            for names in row.tags:
+                keys = [(code, normalize_name(name)) for code, name in names.items()]
+                tag_id = next(
+                    (self._tag_ids[key] for key in keys if key in self._tag_ids), None
+                )
+
+                if tag_id is None:
+                    tag_id = self._next_tag_id
+                    self._next_tag_id += 1
+
+                    tags.append({"id": tag_id})
+                    tag_names.extend(
+                        {"tag_id": tag_id, "language_code": code, "name": name}
+                        for code, name in names.items()
+                    )
+                    for key in keys:
+                        self._tag_ids.setdefault(key, tag_id)
+
+                if tag_id not in linked_tag_ids:
+                    linked_tag_ids.add(tag_id)
+                    links.append({"company_id": company_id, "company_tag_id": tag_id})
+
+        for table, rows in [
+            (Company.__table__, companies),
+            (CompanyName.__table__, company_names),
+            (CompanyTag.__table__, tags),
+            (CompanyTagName.__table__, tag_names),
+            (association_company_and_company_tag, links),
+        ]:
+            if rows:
+                conn.execute(insert(table), rows)
+
+        sync_company_name_fts(conn)
+        if tag_names:
+            sync_company_tag_name_fts(conn)
+        refresh_company_documents(conn, [company["id"] for company in companies])
+        self._advance_id_sequences(conn)
+
+    def _advance_id_sequences(self, conn: Connection) -> None:
+        # 이후 API 로 추가하는 회사/태그가 적재한 id 와 겹치지 않게 한다.
+        if conn.dialect.name != "postgresql":
+            return
+
+        for table, next_id in [
+            (Company.__table__, self._next_company_id),
+            (CompanyTag.__table__, self._next_tag_id),
+        ]:
+            if next_id > 1:
+                conn.execute(
+                    select(
+                        func.setval(
+                            func.pg_get_serial_sequence(table.name, "id"), next_id - 1
+                        )
+                    )
+                )
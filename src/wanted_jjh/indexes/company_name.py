@@ -0,0 +1,332 @@
+import bisect
+import string
+import threading
+from array import array
+from collections.abc import Callable
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from wanted_jjh.enums import LanguageCode
+from wanted_jjh.enums import SearchMode
+from wanted_jjh.exceptions import BusinessException
+from wanted_jjh.hangul import has_hangul
+from wanted_jjh.hangul import is_chosung_query
+from wanted_jjh.hangul import to_chosung
+from wanted_jjh.hangul import to_jamo
+from wanted_jjh.models.company import CompanyName
+
+# 1~3 글자 n-gram 을 색인한다. 3글자 이하 검색어는 posting 을 그대로 사용하고,
+# 그보다 긴 검색어는 가장 짧은 trigram posting 을 따라가며 부분 문자열을 확인한다.
+MAX_GRAM_SIZE = 3
+
+# 한 번에 반영할 키가 이보다 많으면 insort 대신 posting 을 다시 정렬한다.
+_BULK_MERGE_THRESHOLD = 8
+
+# SQLite 의 LIKE 는 ASCII 문자에 한해 대소문자를 구분하지 않으므로 동일하게 맞춘다.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# 검색 순위 구분: 접두어 일치(완전 일치 포함) > 부분 문자열 일치
+PREFIX_TIER = 0
+SUBSTRING_TIER = 1
+
+
+def fold(text: str) -> str:
+    return text.translate(_ASCII_LOWER)
+
+
+def _to_key(length: int, name_id: int) -> int:
+    # posting 은 (회사명 길이, name_id) 순으로 정렬된 정수 배열이다.
+    return length << 32 | name_id
+
+
+class SearchCursor(NamedTuple):
+    """
+    검색 결과에서 마지막으로 반환한 회사명의 순위.
+    (tier, 회사명 길이, name_id) 순으로 비교하며,
+    다음 페이지는 이 순위 이후부터 시작한다.
+    """
+
+    tier: int
+    length: int
+    name_id: int
+
+    @property
+    def key(self) -> int:
+        return _to_key(self.length, self.name_id)
+
+    def encode(self) -> str:
+        return f"{self.tier}.{self.length}.{self.name_id}"
+
+    @classmethod
+    def decode(cls, value: str) -> "SearchCursor":
+        try:
+            tier, length, name_id = (int(part) for part in value.split("."))
+        except ValueError:
+            raise BusinessException(f"{value} 는 올바른 cursor 가 아닙니다.")
+
+        if tier not in (PREFIX_TIER, SUBSTRING_TIER) or length < 0 or name_id < 0:
+            raise BusinessException(f"{value} 는 올바른 cursor 가 아닙니다.")
+
+        return cls(tier, length, name_id)
+
+
+def rank_name(query: str, folded_name: str, name_id: int) -> SearchCursor | None:
+    if folded_name.startswith(query):
+        return SearchCursor(PREFIX_TIER, len(folded_name), name_id)
+    if query in folded_name:
+        return SearchCursor(SUBSTRING_TIER, len(folded_name), name_id)
+    return None
+
+
+class _NameField:
+    """
+    회사명을 한 가지 방식으로 변환한 문자열(키)에 대한 n-gram posting.
+    posting 이 순위 순으로 정렬되어 있으므로 전체 매칭 결과를 정렬하지 않고
+    cursor 위치부터 필요한 개수만큼만 읽는다.
+    posting 은 갱신할 때 새 배열로 교체하므로 검색은 lock 없이 읽는다.
+    """
+
+    def __init__(self) -> None:
+        # name_id -> (company_id, 변환한 회사명)
+        self.names: dict[int, tuple[int, str]] = {}
+        # company_id -> 회사명 name_id 목록
+        self.company_name_ids: dict[int, list[int]] = {}
+        # 전체 회사명 / n-gram / 1~3 글자 접두어 -> 정렬된 키 배열
+        self.all = array("Q")
+        self.postings: dict[str, array] = {}
+        self.prefix_postings: dict[str, array] = {}
+
+    def add(self, entries: list[tuple[int, int, str]]) -> None:
+        """(name_id, company_id, 변환한 회사명) 목록을 반영한다. 호출하는 쪽에서 lock 을 잡는다."""
+        new_keys: dict[str, list[int]] = {}
+        new_prefix_keys: dict[str, list[int]] = {}
+        new_all_keys: list[int] = []
+
+        for name_id, company_id, name in entries:
+            self.names[name_id] = (company_id, name)
+            self.company_name_ids.setdefault(company_id, []).append(name_id)
+
+            key = _to_key(len(name), name_id)
+            new_all_keys.append(key)
+            for gram in {
+                name[start : start + size]
+                for size in range(1, MAX_GRAM_SIZE + 1)
+                for start in range(len(name) - size + 1)
+            }:
+                new_keys.setdefault(gram, []).append(key)
+            for size in range(1, min(len(name), MAX_GRAM_SIZE) + 1):
+                new_prefix_keys.setdefault(name[:size], []).append(key)
+
+        if not new_all_keys:
+            return
+
+        self.all = _merge(self.all, new_all_keys)
+        for gram, keys in new_keys.items():
+            self.postings[gram] = _merge(self.postings.get(gram), keys)
+        for prefix, keys in new_prefix_keys.items():
+            self.prefix_postings[prefix] = _merge(
+                self.prefix_postings.get(prefix), keys
+            )
+
+    def iter_matches(
+        self, query: str, *, after: SearchCursor | None = None
+    ) -> Iterator[tuple[SearchCursor, int]]:
+        for tier, posting, predicate in self._streams(query):
+            if after is not None and tier < after.tier:
+                continue
+
+            start = 0
+            if after is not None and tier == after.tier:
+                start = bisect.bisect_right(posting, after.key)
+
+            for index in range(start, len(posting)):
+                name_id = posting[index] & 0xFFFFFFFF
+                company_id, name = self.names[name_id]
+
+                if predicate is not None and not predicate(name):
+                    continue
+
+                rank = SearchCursor(tier, len(name), name_id)
+                if rank == self._best_rank(query, company_id):
+                    yield rank, company_id
+
+    def _streams(
+        self, query: str
+    ) -> list[tuple[int, array, Callable[[str], bool] | None]]:
+        if not query:
+            return [(PREFIX_TIER, self.all, None)]
+
+        if len(query) <= MAX_GRAM_SIZE:
+            return [
+                (PREFIX_TIER, self.prefix_postings.get(query, array("Q")), None),
+                (
+                    SUBSTRING_TIER,
+                    self.postings.get(query, array("Q")),
+                    lambda name: not name.startswith(query),
+                ),
+            ]
+
+        trigram_postings = []
+        for start in range(len(query) - MAX_GRAM_SIZE + 1):
+            posting = self.postings.get(query[start : start + MAX_GRAM_SIZE])
+            if posting is None:
+                return []
+            trigram_postings.append(posting)
+
+        return [
+            (
+                PREFIX_TIER,
+                self.prefix_postings.get(query[:MAX_GRAM_SIZE], array("Q")),
+                lambda name: name.startswith(query),
+            ),
+            (
+                SUBSTRING_TIER,
+                min(trigram_postings, key=len),
+                lambda name: query in name and not name.startswith(query),
+            ),
+        ]
+
+    def _best_rank(self, query: str, company_id: int) -> SearchCursor | None:
+        ranks = [
+            rank
+            for name_id in self.company_name_ids[company_id]
+            if (rank := rank_name(query, self.names[name_id][1], name_id)) is not None
+        ]
+        return min(ranks, default=None)
+
+
+class CompanyNameIndex:
+    """
+    회사명 번역(company_name_translations) 전체에 대한 인메모리 n-gram 색인.
+    `CompanyName.name.like('%query%')` 와 같은 회사를 DB 조회 없이 찾고,
+    완전 일치 > 접두어 일치 > 부분 문자열 일치 > 짧은 회사명 순으로 돌려준다.
+
+    한국어 회사명은 자모로 풀어쓴 이름과 초성만 남긴 이름도 따로 색인해 두고,
+    mode=jamo 검색에서 초성 검색어(ㅇㅌㄷ)와 조합 중인 검색어(원틷)를 같은 방식으로 찾는다.
+
+    색인은 마지막으로 반영한 CompanyName.id 를 기억하고, `sync` 호출 시 그 이후에
+    추가된 번역만 읽어온다. (회사명 번역은 추가만 되고 수정/삭제되지 않는다.)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_name_id = 0
+        # company_id -> {language_code: 회사명}
+        self._company_names: dict[int, dict[str, str]] = {}
+        # 소문자화한 회사명 / 자모로 풀어쓴 한국어 회사명 / 초성만 남긴 한국어 회사명
+        self._folded = _NameField()
+        self._jamo = _NameField()
+        self._chosung = _NameField()
+
+    def __len__(self) -> int:
+        return len(self._folded.names)
+
+    def sync(self, db_session: Session) -> None:
+        # AsyncSession.run_sync 안에서는 DB 조회 중 이벤트 루프로 제어가 넘어가므로,
+        # 조회는 lock 밖에서 하고 반영할 때만 lock 을 잡는다.
+        rows = db_session.execute(
+            select(
+                CompanyName.id,
+                CompanyName.company_id,
+                CompanyName.language_code,
+                CompanyName.name,
+            )
+            .where(CompanyName.id > self._last_name_id)
+            .order_by(CompanyName.id)
+        ).all()
+
+        if not rows:
+            return
+
+        with self._lock:
+            # 다른 요청이 먼저 반영한 번역은 건너뛴다.
+            rows = [row for row in rows if row.id > self._last_name_id]
+
+            folded_entries = []
+            jamo_entries = []
+            chosung_entries = []
+
+            for name_id, company_id, language_code, name in rows:
+                self._last_name_id = name_id
+
+                if company_id is None:
+                    continue
+
+                # Company.get_name 과 동일하게 언어별로 먼저 저장된 번역을 사용한다.
+                self._company_names.setdefault(company_id, {}).setdefault(
+                    language_code, name
+                )
+
+                # LIKE 는 NULL 과 매칭되지 않는다.
+                if name is None:
+                    continue
+
+                folded_name = fold(name)
+                folded_entries.append((name_id, company_id, folded_name))
+
+                if language_code == LanguageCode.ko and has_hangul(folded_name):
+                    jamo_entries.append((name_id, company_id, to_jamo(folded_name)))
+                    chosung_entries.append(
+                        (name_id, company_id, to_chosung(folded_name))
+                    )
+
+            self._folded.add(folded_entries)
+            self._jamo.add(jamo_entries)
+            self._chosung.add(chosung_entries)
+
+    def get_name(self, company_id: int, language_code: str) -> str:
+        return self._company_names.get(company_id, {}).get(language_code, "")
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int | None = None,
+        after: SearchCursor | None = None,
+        mode: SearchMode = SearchMode.default,
+    ) -> list[int]:
+        company_ids = []
+        for _, company_id in self.iter_matches(query, after=after, mode=mode):
+            if limit is not None and len(company_ids) >= limit:
+                break
+            company_ids.append(company_id)
+        return company_ids
+
+    def iter_matches(
+        self,
+        query: str,
+        *,
+        after: SearchCursor | None = None,
+        mode: SearchMode = SearchMode.default,
+    ) -> Iterator[tuple[SearchCursor, int]]:
+        """
+        query 를 포함하는 회사를 순위 순으로 (순위, company_id) 로 돌려준다.
+        회사는 여러 언어의 회사명 중 가장 순위가 높은 회사명의 위치에서 한 번만 나온다.
+
+        mode=jamo 에서 자음으로만 이루어진 검색어는 한국어 회사명의 초성에서,
+        그 밖의 한글 검색어는 자모로 풀어쓴 한국어 회사명에서 찾는다.
+        (순위의 회사명 길이도 풀어쓴 이름의 길이이다.)
+        """
+        query = fold(query)
+
+        if mode == SearchMode.jamo and is_chosung_query(query):
+            return self._chosung.iter_matches(query, after=after)
+        if mode == SearchMode.jamo and has_hangul(query):
+            return self._jamo.iter_matches(to_jamo(query), after=after)
+        return self._folded.iter_matches(query, after=after)
+
+
+def _merge(posting: array | None, keys: list[int]) -> array:
+    if not posting:
+        return array("Q", sorted(keys))
+
+    if len(keys) > _BULK_MERGE_THRESHOLD:
+        return array("Q", sorted(posting + array("Q", keys)))
+
+    posting = array("Q", posting)
+    for key in keys:
+        bisect.insort(posting, key)
+    return posting
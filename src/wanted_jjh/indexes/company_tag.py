@@ -0,0 +1,375 @@
+import bisect
+import threading
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from wanted_jjh.enums import LanguageCode
+from wanted_jjh.models.company_document import CompanyDocument
+from wanted_jjh.models.company_tag import CompanyTagName
+from wanted_jjh.models.company_tag import association_company_and_company_tag
+from wanted_jjh.normalization import normalize_name
+
+# 두 posting 의 길이 차이가 이보다 크면 짧은 쪽 원소마다 긴 쪽을 이진 탐색하고,
+# 비슷하면 set 연산으로 한 번에 계산한다.
+_GALLOP_RATIO = 16
+
+# 한 번에 반영할 회사가 이보다 많으면 insort 대신 posting 을 다시 정렬한다.
+_BULK_MERGE_THRESHOLD = 8
+
+_EMPTY = array("I")
+
+# 갱신된 회사/태그를 IN 으로 읽을 때 한 쿼리에 넣을 id 수
+_SYNC_BATCH_SIZE = 500
+
+_LANGUAGE_POSITIONS = {code: position for position, code in enumerate(LanguageCode)}
+
+
+class CompanyTagIndex:
+    """
+    태그 -> 태그가 연결된 company_id 정렬 배열(array('I'))의 인메모리 역색인.
+    태그명(모든 언어, 대소문자/전각·반각 무시)으로 태그를 찾고, 여러 태그의 AND/OR/NOT 조합을 posting 의
+    교집합/합집합/차집합으로 계산한다. 결과 회사명도 색인에 저장된 언어별 회사명으로 만든다.
+
+    처음 `sync` 할 때 회사-태그 연결 전체를 읽고, 이후에는 마지막으로 반영한 회사 문서
+    (company_documents) revision 이후에 갱신된 회사의 연결만 다시 읽는다.
+    posting 은 갱신할 때 새 배열로 교체하므로 검색은 lock 없이 읽는다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_revision: int | None = None
+        # company_id -> LanguageCode 순서의 회사명
+        self._company_names: dict[int, tuple[str, ...]] = {}
+        # company_id -> 연결된 태그 id
+        self._company_tag_ids: dict[int, frozenset[int]] = {}
+        # 태그 id -> 정렬된 company_id 배열 (회사가 연결된 태그만)
+        self._tag_postings: dict[int, array] = {}
+        # 태그 id -> 모든 언어의 정규화한 태그명 (name_key)
+        self._tag_names: dict[int, frozenset[str]] = {}
+        # 정규화한 태그명 -> 태그 id (회사가 연결된 태그만, 같은 이름의 태그가 여러 개일 수 있다.)
+        self._name_tag_ids: dict[str, frozenset[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tag_postings)
+
+    def __contains__(self, tag_name: str) -> bool:
+        return normalize_name(tag_name) in self._name_tag_ids
+
+    def sync(self, db_session: Session) -> None:
+        # AsyncSession.run_sync 안에서는 DB 조회 중 이벤트 루프로 제어가 넘어가므로,
+        # 조회는 lock 밖에서 하고 반영할 때만 lock 을 잡는다.
+        last_revision = self._last_revision
+        if last_revision is None:
+            self._load(db_session)
+        else:
+            self._update(db_session, last_revision)
+
+    def _load(self, db_session: Session) -> None:
+        # 행이 많으므로 ORM 결과 처리를 거치지 않도록 Core 연결로 읽는다.
+        conn = db_session.connection()
+
+        revision = conn.scalar(select(func.max(CompanyDocument.revision))) or 0
+        company_names = _group_company_names(
+            conn.execute(
+                select(
+                    CompanyDocument.company_id,
+                    CompanyDocument.language_code,
+                    CompanyDocument.name,
+                ).where(CompanyDocument.name != "")
+            ).all()
+        )
+
+        company_tag_ids: dict[int, set[int]] = {}
+        tag_company_ids: dict[int, list[int]] = {}
+        for company_id, tag_id in conn.execute(
+            select(
+                association_company_and_company_tag.c.company_id,
+                association_company_and_company_tag.c.company_tag_id,
+            )
+        ).all():
+            company_tag_ids.setdefault(company_id, set()).add(tag_id)
+            tag_company_ids.setdefault(tag_id, []).append(company_id)
+
+        tag_names = _group_tag_names(
+            conn.execute(
+                select(CompanyTagName.tag_id, CompanyTagName.name_key).where(
+                    CompanyTagName.tag_id.is_not(None), CompanyTagName.name_key != ""
+                )
+            ).all()
+        )
+
+        with self._lock:
+            if self._last_revision is not None:
+                # 다른 요청이 먼저 읽어왔다.
+                return
+
+            self._company_names = company_names
+            self._company_tag_ids = {
+                company_id: frozenset(tag_ids)
+                for company_id, tag_ids in company_tag_ids.items()
+            }
+            self._tag_postings = {
+                tag_id: array("I", sorted(set(company_ids)))
+                for tag_id, company_ids in tag_company_ids.items()
+            }
+            self._tag_names = {}
+            self._name_tag_ids = {}
+            self._set_tag_names(
+                {
+                    tag_id: names
+                    for tag_id, names in tag_names.items()
+                    if tag_id in self._tag_postings
+                }
+            )
+            self._last_revision = revision
+
+    def _update(self, db_session: Session, last_revision: int) -> None:
+        name_rows = db_session.execute(
+            select(
+                CompanyDocument.company_id,
+                CompanyDocument.language_code,
+                CompanyDocument.name,
+                CompanyDocument.revision,
+            ).where(CompanyDocument.revision > last_revision)
+        ).all()
+        if not name_rows:
+            return
+
+        # 바뀐 회사의 연결과, 그 회사에 연결된 태그의 태그명을 다시 읽는다.
+        # (태그명이 바뀌어도 연결된 회사의 문서가 갱신된다.)
+        link_rows = []
+        for company_ids in _batched({row.company_id for row in name_rows}):
+            link_rows.extend(
+                db_session.execute(
+                    select(
+                        association_company_and_company_tag.c.company_id,
+                        association_company_and_company_tag.c.company_tag_id,
+                    ).where(
+                        association_company_and_company_tag.c.company_id.in_(
+                            company_ids
+                        )
+                    )
+                )
+            )
+
+        tag_name_rows = []
+        for tag_ids in _batched({tag_id for _, tag_id in link_rows}):
+            tag_name_rows.extend(
+                db_session.execute(
+                    select(CompanyTagName.tag_id, CompanyTagName.name_key).where(
+                        CompanyTagName.tag_id.in_(tag_ids),
+                        CompanyTagName.name_key != "",
+                    )
+                )
+            )
+        tag_names = _group_tag_names(tag_name_rows)
+
+        company_names = _group_company_names(
+            (company_id, language_code, name)
+            for company_id, language_code, name, _ in name_rows
+        )
+        company_tag_ids: dict[int, set[int]] = {
+            company_id: set() for company_id in company_names
+        }
+        for company_id, tag_id in link_rows:
+            company_tag_ids.setdefault(company_id, set()).add(tag_id)
+
+        with self._lock:
+            if self._last_revision != last_revision:
+                # 다른 요청이 먼저 반영했다. 그 사이에 더 바뀐 내용은 다음 sync 에서 읽는다.
+                return
+
+            self._company_names.update(company_names)
+
+            removed: dict[int, list[int]] = {}
+            added: dict[int, list[int]] = {}
+            for company_id, tag_ids in company_tag_ids.items():
+                old_tag_ids = self._company_tag_ids.get(company_id, frozenset())
+                for tag_id in old_tag_ids - tag_ids:
+                    removed.setdefault(tag_id, []).append(company_id)
+                for tag_id in tag_ids - old_tag_ids:
+                    added.setdefault(tag_id, []).append(company_id)
+
+                if tag_ids:
+                    self._company_tag_ids[company_id] = frozenset(tag_ids)
+                else:
+                    self._company_tag_ids.pop(company_id, None)
+
+            for tag_id, company_ids in added.items():
+                self._tag_postings[tag_id] = _insert(
+                    self._tag_postings.get(tag_id), company_ids
+                )
+            unlinked_tag_ids = []
+            for tag_id, company_ids in removed.items():
+                posting = _remove(self._tag_postings[tag_id], company_ids)
+                if posting:
+                    self._tag_postings[tag_id] = posting
+                else:
+                    del self._tag_postings[tag_id]
+                    unlinked_tag_ids.append(tag_id)
+
+            self._set_tag_names(
+                {
+                    tag_id: names
+                    for tag_id, names in tag_names.items()
+                    if tag_id in self._tag_postings
+                }
+            )
+            self._set_tag_names({tag_id: frozenset() for tag_id in unlinked_tag_ids})
+            self._last_revision = max(row.revision for row in name_rows)
+
+    def _set_tag_names(self, tag_names: dict[int, frozenset[str]]) -> None:
+        for tag_id, names in tag_names.items():
+            old_names = self._tag_names.get(tag_id, frozenset())
+            if names == old_names:
+                continue
+
+            for name in old_names - names:
+                tag_ids = self._name_tag_ids[name] - {tag_id}
+                if tag_ids:
+                    self._name_tag_ids[name] = tag_ids
+                else:
+                    del self._name_tag_ids[name]
+            for name in names - old_names:
+                self._name_tag_ids[name] = self._name_tag_ids.get(name, frozenset()) | {
+                    tag_id
+                }
+
+            if names:
+                self._tag_names[tag_id] = names
+            else:
+                self._tag_names.pop(tag_id, None)
+
+    def get_name(self, company_id: int, language_codes: Sequence[str]) -> str:
+        # language_codes 순서대로 비어있지 않은 회사명을 고른다.
+        names = self._company_names.get(company_id)
+        if names is None:
+            return ""
+        return next(
+            (
+                name
+                for code in language_codes
+                if (name := names[_LANGUAGE_POSITIONS[code]])
+            ),
+            "",
+        )
+
+    def search(
+        self,
+        tag_names: Iterable[str] = (),
+        *,
+        any_tag_names: Iterable[str] = (),
+        exclude_tag_names: Iterable[str] = (),
+    ) -> array:
+        """
+        tag_names 가 모두 연결되어 있고(AND), any_tag_names 중 하나 이상이 연결되어 있으며(OR),
+        exclude_tag_names 는 하나도 연결되지 않은(NOT) 회사의 id 를 오름차순으로 돌려준다.
+        """
+        postings = [self._posting(tag_name) for tag_name in tag_names]
+
+        any_tag_names = list(any_tag_names)
+        if any_tag_names:
+            postings.append(union([self._posting(name) for name in any_tag_names]))
+
+        if not postings:
+            return _EMPTY
+
+        company_ids = intersect(postings)
+        for tag_name in exclude_tag_names:
+            company_ids = difference(company_ids, self._posting(tag_name))
+        return company_ids
+
+    def _posting(self, tag_name: str) -> array:
+        return union(
+            [
+                self._tag_postings.get(tag_id, _EMPTY)
+                for tag_id in self._name_tag_ids.get(normalize_name(tag_name), ())
+            ]
+        )
+
+
+def _batched(ids: set[int]) -> Iterator[list[int]]:
+    ids = sorted(ids)
+    for start in range(0, len(ids), _SYNC_BATCH_SIZE):
+        yield ids[start : start + _SYNC_BATCH_SIZE]
+
+
+def _group_company_names(rows: Iterable[tuple]) -> dict[int, tuple[str, ...]]:
+    company_names: dict[int, list[str]] = {}
+    for company_id, language_code, name in rows:
+        names = company_names.get(company_id)
+        if names is None:
+            names = company_names[company_id] = [""] * len(_LANGUAGE_POSITIONS)
+        names[_LANGUAGE_POSITIONS[language_code]] = name
+    return {company_id: tuple(names) for company_id, names in company_names.items()}
+
+
+def _group_tag_names(rows: Iterable[tuple]) -> dict[int, frozenset[str]]:
+    tag_names: dict[int, set[str]] = {}
+    for tag_id, name in rows:
+        tag_names.setdefault(tag_id, set()).add(name)
+    return {tag_id: frozenset(names) for tag_id, names in tag_names.items()}
+
+
+def _contains(posting: array, company_id: int) -> bool:
+    index = bisect.bisect_left(posting, company_id)
+    return index < len(posting) and posting[index] == company_id
+
+
+def intersect(postings: Sequence[array]) -> array:
+    postings = sorted(postings, key=len)
+    result = postings[0]
+    for posting in postings[1:]:
+        if not result:
+            break
+        if len(result) * _GALLOP_RATIO < len(posting):
+            result = array("I", (i for i in result if _contains(posting, i)))
+        else:
+            result = array("I", sorted(set(result).intersection(posting)))
+    return result
+
+
+def union(postings: Sequence[array]) -> array:
+    postings = [posting for posting in postings if posting]
+    if len(postings) <= 1:
+        return postings[0] if postings else _EMPTY
+    return array("I", sorted(set().union(*postings)))
+
+
+def difference(posting: array, excluded: array) -> array:
+    if not posting or not excluded:
+        return posting
+    if len(posting) * _GALLOP_RATIO < len(excluded):
+        return array("I", (i for i in posting if not _contains(excluded, i)))
+    return array("I", sorted(set(posting).difference(excluded)))
+
+
+def _insert(posting: array | None, company_ids: list[int]) -> array:
+    if not posting:
+        return array("I", sorted(company_ids))
+
+    if len(company_ids) > _BULK_MERGE_THRESHOLD:
+        return array("I", sorted(posting + array("I", company_ids)))
+
+    posting = array("I", posting)
+    for company_id in company_ids:
+        bisect.insort(posting, company_id)
+    return posting
+
+
+def _remove(posting: array, company_ids: list[int]) -> array:
+    if len(company_ids) > _BULK_MERGE_THRESHOLD:
+        return difference(posting, array("I", sorted(company_ids)))
+
+    posting = array("I", posting)
+    for company_id in company_ids:
+        index = bisect.bisect_left(posting, company_id)
+        if index < len(posting) and posting[index] == company_id:
+            del posting[index]
+    return posting
@@ -1,30 +1,54 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from wanted_jjh.caches.response import create_response_cache
+from wanted_jjh.db.instrumentation import QueryMetrics
+from wanted_jjh.indexes.company_name import CompanyNameIndex
+from wanted_jjh.indexes.company_tag import CompanyTagIndex
+from wanted_jjh.middlewares.query_stats import QueryStatsMiddleware
 from wanted_jjh.routes import router
 from wanted_jjh import settings
-from wanted_jjh.db.session import DBBase
 from wanted_jjh.db.session import Session
-from wanted_jjh.db.session import engine
-from starlette.requests import Request
 
-DBBase.metadata.create_all(engine)
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    if settings.SEARCH_INDEX_WARMUP:
+        with Session() as db_session:
+            application.state.company_name_index.sync(db_session)
+            application.state.company_tag_index.sync(db_session)
+
+    yield
 
 
 def get_application() -> FastAPI:
     application = FastAPI(
-        title=settings.PROJECT_NAME, debug=settings.DEBUG, version=settings.VERSION
+        title=settings.PROJECT_NAME,
+        debug=settings.DEBUG,
+        version=settings.VERSION,
+        lifespan=lifespan,
     )
     application.include_router(router)
 
-    return application
+    application.state.company_name_index = CompanyNameIndex()
+    application.state.company_tag_index = CompanyTagIndex()
+    application.state.response_cache = create_response_cache(
+        settings.RESPONSE_CACHE_BACKEND,
+        ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+        max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+        redis_url=settings.RESPONSE_CACHE_REDIS_URL,
+    )
 
+    application.state.query_metrics = None
+    if settings.DB_INSTRUMENTATION:
+        application.state.query_metrics = QueryMetrics()
+        application.add_middleware(
+            QueryStatsMiddleware, metrics=application.state.query_metrics
+        )
 
-app = get_application()
+    return application
 
 
-@app.middleware("http")
-async def db_session_middleware(request: Request, call_next):
-    request.state.db = Session()
-    response = await call_next(request)
-    request.state.db.close()
-    return response
+app = get_application()
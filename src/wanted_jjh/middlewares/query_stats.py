@@ -0,0 +1,45 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from wanted_jjh.db.instrumentation import QueryMetrics
+from wanted_jjh.db.instrumentation import QueryStats
+from wanted_jjh.db.instrumentation import current_query_stats
+
+
+class QueryStatsMiddleware:
+    """
+    요청마다 QueryStats 를 만들어 그 요청에서 실행된 SQL 문 수와 DB 시간을 모으고,
+    응답의 Server-Timing 헤더로 보낸 뒤 응답이 끝나면 라우트별 통계(QueryMetrics)에 더한다.
+
+    StreamingResponse 는 헤더를 보낸 뒤에 본문을 만들며 DB 를 읽으므로, 헤더에는
+    헤더를 보낼 때까지의 값이, 통계에는 본문까지 포함한 값이 들어간다.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: QueryMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+        token = current_query_stats.set(stats)
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(
+                    "server-timing", stats.server_timing()
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            current_query_stats.reset(token)
+            self.metrics.record(stats)
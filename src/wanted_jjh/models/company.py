@@ -1,9 +1,11 @@
 from sqlalchemy import Column, Integer, String
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy.orm import relationship
 
 from wanted_jjh.db.session import DBBase
 from wanted_jjh.models.company_tag import association_company_and_company_tag
+from wanted_jjh.normalization import name_key_default
 
 
 class Company(DBBase):
@@ -33,10 +35,19 @@ class Company(DBBase):
 
 class CompanyName(DBBase):
     __tablename__ = "company_name_translations"
+    __table_args__ = (
+        Index(
+            "ix_company_name_translations_language_code_name",
+            "language_code",
+            "name",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    company_id = Column(Integer, ForeignKey("companies.id"))
+    company_id = Column(Integer, ForeignKey("companies.id"), index=True)
     language_code = Column(String(2))  # e.g., 'ko', 'en', 'ja'
-    name = Column(String(100))
+    name = Column(String(100), index=True)
+    # 대소문자/전각·반각을 무시하는 완전 일치 조회용 키 (normalize_name(name))
+    name_key = Column(String(100), default=name_key_default, index=True)
 
     company = relationship("Company", back_populates="names")
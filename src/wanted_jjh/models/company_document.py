@@ -0,0 +1,28 @@
+from sqlalchemy import JSON
+from sqlalchemy import Column
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import String
+
+from wanted_jjh.db.session import DBBase
+
+
+class CompanyDocument(DBBase):
+    """
+    회사 조회 응답을 언어별로 미리 계산해 둔 읽기 모델.
+    회사/회사명/태그/태그명이 바뀌면 services.company_document 가 갱신한다.
+    """
+
+    __tablename__ = "company_documents"
+
+    company_id = Column(Integer, ForeignKey("companies.id"), primary_key=True)
+    language_code = Column(String(2), primary_key=True)
+    # 해당 언어의 회사명 (없으면 빈 문자열)
+    name = Column(String(100), nullable=False)
+    # 해당 언어의 태그명 목록 (태그 id 순서, 번역이 없으면 빈 문자열)
+    tag_names = Column(JSON, nullable=False)
+    # tag_names 를 태그명 순으로 정렬한 목록 (회사 추가/태그 변경 응답의 순서)
+    sorted_tag_names = Column(JSON, nullable=False, server_default="[]")
+    tag_count = Column(Integer, nullable=False)
+    # 문서를 갱신할 때마다 증가하는 번호. 인메모리 색인은 마지막으로 읽은 번호 이후의 문서만 읽는다.
+    revision = Column(Integer, nullable=False, server_default="0", index=True)
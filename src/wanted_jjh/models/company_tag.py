@@ -1,17 +1,26 @@
 from sqlalchemy import Column
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
+from sqlalchemy import Table
 from sqlalchemy.orm import relationship
-from sqlalchemy.testing.schema import Table
 
 from wanted_jjh.db.session import DBBase
+from wanted_jjh.normalization import name_key_default
 
 association_company_and_company_tag = Table(
     "association_company_and_company_tag",
     DBBase.metadata,
     Column("company_id", Integer, ForeignKey("companies.id")),
-    Column("company_tag_id", Integer, ForeignKey("company_tags.id")),
+    Column("company_tag_id", Integer, ForeignKey("company_tags.id"), index=True),
+    # 같은 회사에 같은 태그가 두 번 연결되지 않도록 한다.
+    Index(
+        "ux_association_company_and_company_tag_company_id_company_tag_id",
+        "company_id",
+        "company_tag_id",
+        unique=True,
+    ),
 )
 
 
@@ -37,10 +46,19 @@ class CompanyTag(DBBase):
 
 class CompanyTagName(DBBase):
     __tablename__ = "company_tag_name_translations"
+    __table_args__ = (
+        Index(
+            "ix_company_tag_name_translations_language_code_name",
+            "language_code",
+            "name",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    tag_id = Column(Integer, ForeignKey("company_tags.id"))
+    tag_id = Column(Integer, ForeignKey("company_tags.id"), index=True)
     language_code = Column(String(2))  # e.g., 'ko', 'en', 'ja'
-    name = Column(String(100))
+    name = Column(String(100), index=True)
+    # 대소문자/전각·반각을 무시하는 완전 일치 조회용 키 (normalize_name(name))
+    name_key = Column(String(100), default=name_key_default, index=True)
 
     tag = relationship("CompanyTag", back_populates="names")
@@ -0,0 +1,42 @@
+from sqlalchemy import DDL
+from sqlalchemy import TableClause
+from sqlalchemy import column
+from sqlalchemy import event
+from sqlalchemy import table
+
+from wanted_jjh import settings
+from wanted_jjh.db.session import DBBase
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_tag import CompanyTagName
+
+
+def _full_text_table(name: str) -> TableClause:
+    """
+    번역 테이블의 rowid(번역 id)와 정규화한 이름(normalize_name)을 담는 FTS5 가상 테이블.
+    trigram 토크나이저는 언어와 상관없이 3글자 이상 부분 문자열을 색인으로 찾는다.
+    rank 는 MATCH 검색의 BM25 점수이다. (작을수록 관련도가 높다.)
+
+    가상 테이블은 모델로 선언할 수 없으므로 DBBase.metadata 를 만들고 지울 때 같이 만들고 지운다.
+    """
+    event.listen(
+        DBBase.metadata,
+        "after_create",
+        DDL(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} "
+            "USING fts5(name, tokenize='trigram')"
+        ).execute_if(
+            dialect="sqlite",
+            callable_=lambda *args, **kwargs: settings.FULL_TEXT_SEARCH,
+        ),
+    )
+    event.listen(
+        DBBase.metadata,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {name}").execute_if(dialect="sqlite"),
+    )
+
+    return table(name, column("rowid"), column("name"), column("rank"))
+
+
+company_name_fts = _full_text_table(f"{CompanyName.__tablename__}_fts")
+company_tag_name_fts = _full_text_table(f"{CompanyTagName.__tablename__}_fts")
@@ -0,0 +1,19 @@
+import unicodedata
+
+
+def normalize_name(name: str) -> str:
+    """
+    대소문자와 전각/반각 차이를 무시하고 비교하기 위한 이름.
+    NFKC 로 호환 문자(전각 영숫자, 반각 가나 등)를 통일한 뒤 casefold 한다.
+    (casefold 결과가 다시 조합될 수 있으므로 한 번 더 NFKC 정규화한다.)
+    """
+    return unicodedata.normalize("NFKC", unicodedata.normalize("NFKC", name).casefold())
+
+
+def name_key_default(context) -> str | None:
+    """
+    번역 테이블 name_key 컬럼의 INSERT 기본값. 같은 행의 name 을 정규화해 채운다.
+    (여러 행을 한 번에 추가해도 행마다 계산되는 SQLAlchemy context-sensitive default)
+    """
+    name = context.get_current_parameters().get("name")
+    return None if name is None else normalize_name(name)
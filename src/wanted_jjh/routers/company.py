@@ -1,24 +1,93 @@
+import csv
+import io
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager
+from contextlib import ExitStack
+from tempfile import SpooledTemporaryFile
+from typing import Literal
+
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Header
+from fastapi import Query
+from fastapi import Request
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from wanted_jjh.caches.response import FULL_TEXT_TAG_SEARCH_TAG
+from wanted_jjh.caches.response import ResponseCache
+from wanted_jjh.caches.response import company_name_tag
+from wanted_jjh.caches.response import make_cache_key
+from wanted_jjh.caches.response import search_keyspace
+from wanted_jjh.caches.response import tag_name_tag
+from wanted_jjh.dtos.company import CompanyExportDTO
 from wanted_jjh.dtos.company import CreateCompanyDTO
 from wanted_jjh.dtos.company import TagDTO
 from wanted_jjh.enums import LanguageCode
+from wanted_jjh.enums import SearchMode
 from wanted_jjh.exceptions import BusinessException
 from wanted_jjh.exceptions import CompanyNotFound
 from wanted_jjh.exceptions import TagNotFound
+from wanted_jjh.importers.company_csv import TAG_SEPARATOR
+from wanted_jjh.indexes.company_name import CompanyNameIndex
+from wanted_jjh.indexes.company_tag import CompanyTagIndex
+from wanted_jjh.routers.utils.caches import get_response_cache
+from wanted_jjh.routers.utils.caches import read_through
 from wanted_jjh.routers.utils.db import get_db
+from wanted_jjh.routers.utils.db import get_db_opener
+from wanted_jjh.routers.utils.indexes import get_company_name_index
+from wanted_jjh.routers.utils.indexes import get_company_tag_index
+from wanted_jjh.routers.utils.json_stream import JsonItem
+from wanted_jjh.routers.utils.json_stream import iter_json_items
+from wanted_jjh.routers.utils.responses import json_response
+from wanted_jjh.schemas.company import BATCH_CREATE_DEFAULT_CHUNK_SIZE
+from wanted_jjh.schemas.company import BATCH_CREATE_MAX_CHUNK_SIZE
+from wanted_jjh.schemas.company import CompanyBatchCreateResultSchema
+from wanted_jjh.schemas.company import CompanyBatchGetResponseSchema
+from wanted_jjh.schemas.company import CompanyBatchGetSchema
 from wanted_jjh.schemas.company import CompanyCreateSchema
+from wanted_jjh.schemas.company import CompanyExportSchema
 from wanted_jjh.schemas.company import CompanySchema
 from wanted_jjh.schemas.company import CompanySearchSchema
 from wanted_jjh.schemas.company import CompanyTagUpdateSchema
-from wanted_jjh.services import company as company_services
+from wanted_jjh.schemas.company import LanguageCodeSchema
+from wanted_jjh.schemas.company import Tag
+from wanted_jjh.services import company_async as company_async_services
 
 router = APIRouter()
 
+# 대량 추가 결과를 메모리에 쌓아둘 최대 크기 (넘으면 임시 파일로 옮긴다)
+BATCH_CREATE_RESULT_SPOOL_BYTES = 4 * 1024 * 1024
+
+
+def _to_create_company_dto(
+    company_create_request_dto: CompanyCreateSchema,
+) -> CreateCompanyDTO:
+    return CreateCompanyDTO(
+        ko_name=company_create_request_dto.company_name.ko,
+        en_name=company_create_request_dto.company_name.en,
+        tw_name=company_create_request_dto.company_name.tw,
+        tags=[
+            TagDTO(
+                ko_name=tag_requsst_dto.tag_name.ko,
+                en_name=tag_requsst_dto.tag_name.en,
+                ja_name=tag_requsst_dto.tag_name.ja,
+                tw_name=tag_requsst_dto.tag_name.tw,
+            )
+            for tag_requsst_dto in company_create_request_dto.tags
+        ],
+    )
+
 
 @router.get(
     "/search",
@@ -26,21 +95,63 @@ router = APIRouter()
     name="company:search-by-name",
     summary="회사명 자동완성을 위한 회사명 검색",
 )
-def search_company_by_name(
+async def search_company_by_name(
     query: str,
+    limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = None,
+    mode: SearchMode = Query(
+        SearchMode.default,
+        description=(
+            "fts: 대소문자/전각·반각을 무시하는 전문 검색 (BM25 순위), "
+            "jamo: 한국어 회사명의 초성(ㅇㅌㄷ)과 조합 중인 음절(원틷) 검색"
+        ),
+    ),
     x_wanted_language: LanguageCode = Header(LanguageCode.en),
-    db_session: Session = Depends(get_db),
-) -> list[CompanySearchSchema]:
-    company_dtos = company_services.search_companies_by_name(
-        db_session=db_session, name=query, language_code=x_wanted_language
-    )
+    db_session: Session | AsyncSession = Depends(get_db),
+    name_index: CompanyNameIndex = Depends(get_company_name_index),
+    response_cache: ResponseCache | None = Depends(get_response_cache),
+) -> Response:
+    async def build_response() -> Response:
+        try:
+            search_result_dto = await company_async_services.search_companies_by_name(
+                db_session=db_session,
+                name=query,
+                language_code=x_wanted_language,
+                name_index=name_index,
+                limit=limit,
+                cursor=cursor,
+                mode=mode,
+            )
+        except BusinessException as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        response = json_response(
+            [
+                {"company_name": company_dto.name}
+                for company_dto in search_result_dto.companies
+            ],
+            response_model=list[CompanySearchSchema],
+        )
+
+        # 다음 페이지가 있으면 x-next-cursor 헤더로 cursor 를 전달한다.
+        if search_result_dto.next_cursor:
+            response.headers["x-next-cursor"] = search_result_dto.next_cursor
 
-    response_data = [
-        CompanySearchSchema(company_name=company_dto.name)
-        for company_dto in company_dtos
-    ]
+        return response
 
-    return response_data
+    return await read_through(
+        response_cache,
+        key=make_cache_key(
+            "company:search-by-name",
+            query=query,
+            limit=limit,
+            cursor=cursor or "",
+            mode=mode,
+            language_code=x_wanted_language,
+        ),
+        keyspace=search_keyspace(query, mode),
+        build=build_response,
+    )
 
 
 @router.get(
@@ -49,24 +160,164 @@ def search_company_by_name(
     name="company:search-by-tag",
     summary="태그명으로 회사 검색",
 )
-def search_company_by_tag(
-    query: str,
+async def search_company_by_tag(
+    query: list[str] = Query([], description="모두 연결되어 있어야 하는 태그명 (AND)"),
+    any_query: list[str] = Query(
+        [], alias="any", description="하나 이상 연결되어 있어야 하는 태그명 (OR)"
+    ),
+    exclude: list[str] = Query(
+        [], description="연결되어 있지 않아야 하는 태그명 (NOT)"
+    ),
+    mode: SearchMode = Query(
+        SearchMode.default,
+        description="fts: 태그명이 검색어를 포함하는 태그로 검색 (BM25 순위)",
+    ),
     x_wanted_language: LanguageCode = Header(LanguageCode.en),
-    db_session: Session = Depends(get_db),
-):
-    try:
-        company_dtos = company_services.search_company_by_tag(
-            db_session=db_session, tag_name=query, language_code=x_wanted_language
+    db_session: Session | AsyncSession = Depends(get_db),
+    tag_index: CompanyTagIndex = Depends(get_company_tag_index),
+    response_cache: ResponseCache | None = Depends(get_response_cache),
+) -> Response:
+    async def build_response() -> Response:
+        try:
+            company_dtos = await company_async_services.search_company_by_tag(
+                db_session=db_session,
+                tag_names=query,
+                any_tag_names=any_query,
+                exclude_tag_names=exclude,
+                language_code=x_wanted_language,
+                tag_index=tag_index,
+                mode=mode,
+            )
+        except TagNotFound:
+            raise HTTPException(status_code=404, detail="Tag not found")
+        except BusinessException as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        return json_response(
+            [{"company_name": company_dto.name} for company_dto in company_dtos],
+            response_model=list[CompanySearchSchema],
         )
-    except TagNotFound:
-        raise HTTPException(status_code=404, detail="Tag not found")
 
-    response_data = [
-        CompanySearchSchema(company_name=company_dto.name)
-        for company_dto in company_dtos
-    ]
+    return await read_through(
+        response_cache,
+        key=make_cache_key(
+            "company:search-by-tag",
+            query=query,
+            any=any_query,
+            exclude=exclude,
+            mode=mode,
+            language_code=x_wanted_language,
+        ),
+        tags=(
+            [FULL_TEXT_TAG_SEARCH_TAG]
+            if mode == SearchMode.fts
+            else [tag_name_tag(tag_name) for tag_name in {*query, *any_query, *exclude}]
+        ),
+        build=build_response,
+    )
+
+
+def _to_ndjson(
+    company_export_dtos: list[CompanyExportDTO], language_codes: Sequence[LanguageCode]
+) -> bytes:
+    return b"".join(
+        CompanyExportSchema(
+            company_id=company_export_dto.company_id,
+            company_name=LanguageCodeSchema(**company_export_dto.names),
+            tags=[
+                Tag(tag_name=LanguageCodeSchema(**tag))
+                for tag in company_export_dto.tags
+            ],
+        )
+        .model_dump_json(exclude_none=True)
+        .encode()
+        + b"\n"
+        for company_export_dto in company_export_dtos
+    )
+
+
+def _to_csv_header(language_codes: Sequence[LanguageCode]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(
+        [
+            "company_id",
+            *(f"company_{code}" for code in language_codes),
+            *(f"tag_{code}" for code in language_codes),
+        ]
+    )
+    return buffer.getvalue().encode()
+
 
-    return response_data
+def _to_csv(
+    company_export_dtos: list[CompanyExportDTO], language_codes: Sequence[LanguageCode]
+) -> bytes:
+    # import-companies 로 다시 적재할 수 있도록 같은 컬럼과 태그 구분자("|")를 사용한다.
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        [
+            company_export_dto.company_id,
+            *(company_export_dto.names.get(code, "") for code in language_codes),
+            *(
+                TAG_SEPARATOR.join(tag.get(code, "") for tag in company_export_dto.tags)
+                for code in language_codes
+            ),
+        ]
+        for company_export_dto in company_export_dtos
+    )
+    return buffer.getvalue().encode()
+
+
+@router.get(
+    "/companies/export",
+    response_class=StreamingResponse,
+    name="company:export-companies",
+    summary="전체 회사 목록 내보내기 (NDJSON / CSV)",
+    responses={
+        200: {
+            "description": "NDJSON 은 한 줄에 CompanyExportSchema 하나",
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        }
+    },
+)
+async def export_companies(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    language: list[LanguageCode] = Query(
+        [], description="내보낼 언어 (기본값: 모든 언어)"
+    ),
+    since_id: int = Query(0, ge=0, description="이 회사 id 보다 큰 회사만 내보낸다."),
+    open_db: Callable[[], AbstractAsyncContextManager[Session | AsyncSession]] = (
+        Depends(get_db_opener)
+    ),
+) -> StreamingResponse:
+    """
+    회사 문서를 company_id 순으로 서버 측 커서로 읽으면서 바로 내보내므로,
+    회사 수와 상관없이 메모리 사용량이 일정하다.
+
+    - ndjson: POST /companies 요청과 같은 형식에 company_id 를 더한 회사가 한 줄에 하나
+    - csv: import-companies 로 다시 적재할 수 있는 company_{언어}, tag_{언어} 컬럼
+    마지막으로 받은 company_id 를 다음 요청의 since_id 로 넘기면 그 뒤에 추가된 회사만 받는다.
+    """
+    language_codes = tuple(dict.fromkeys(language)) or tuple(LanguageCode)
+    encode = _to_csv if export_format == "csv" else _to_ndjson
+
+    async def iter_body() -> AsyncIterator[bytes]:
+        if export_format == "csv":
+            yield _to_csv_header(language_codes)
+
+        async with open_db() as db_session:
+            async for (
+                company_export_dtos
+            ) in company_async_services.iter_company_export_batches(
+                db_session=db_session,
+                since_id=since_id,
+                language_codes=language_codes,
+            ):
+                yield encode(company_export_dtos, language_codes)
+
+    return StreamingResponse(
+        iter_body(),
+        media_type="text/csv" if export_format == "csv" else "application/x-ndjson",
+    )
 
 
 @router.get(
@@ -75,21 +326,79 @@ def search_company_by_tag(
     name="company:get-company",
     summary="회사 이름으로 회사 검색",
 )
-def get_company(
+async def get_company(
     company_name: str,
     x_wanted_language: LanguageCode = Header(LanguageCode.en),
-    db_session: Session = Depends(get_db),
-) -> CompanySchema:
-    try:
-        company_dto = company_services.get_company_by_name(
-            db_session=db_session,
+    db_session: Session | AsyncSession = Depends(get_db),
+    response_cache: ResponseCache | None = Depends(get_response_cache),
+) -> Response:
+    async def build_response() -> Response:
+        try:
+            company_dto = await company_async_services.get_company_by_name(
+                db_session=db_session,
+                company_name=company_name,
+                language_code=x_wanted_language,
+            )
+        except CompanyNotFound:
+            raise HTTPException(status_code=404, detail="Company not found")
+
+        response_data = CompanySchema(
+            company_name=company_dto.name, tags=company_dto.tag_names
+        )
+
+        return JSONResponse(jsonable_encoder(response_data))
+
+    return await read_through(
+        response_cache,
+        key=make_cache_key(
+            "company:get-company",
             company_name=company_name,
             language_code=x_wanted_language,
-        )
-    except CompanyNotFound:
-        raise HTTPException(status_code=404, detail="Company not found")
+        ),
+        tags=[company_name_tag(company_name)],
+        build=build_response,
+    )
 
-    return CompanySchema(company_name=company_dto.name, tags=company_dto.tag_names)
+
+@router.post(
+    "/companies:batchGet",
+    response_model=CompanyBatchGetResponseSchema,
+    name="company:batch-get-companies",
+    summary="회사명 목록으로 회사 일괄 조회",
+)
+async def batch_get_companies(
+    batch_get_request: CompanyBatchGetSchema,
+    x_wanted_language: LanguageCode = Header(LanguageCode.en),
+    db_session: Session | AsyncSession = Depends(get_db),
+) -> Response:
+    company_dtos = await company_async_services.get_companies_by_names(
+        db_session=db_session,
+        company_names=batch_get_request.company_names,
+        language_code=x_wanted_language,
+    )
+
+    return json_response(
+        {
+            "results": [
+                {
+                    "company_name": company_name,
+                    "found": company_dto is not None,
+                    "company": (
+                        {
+                            "company_name": company_dto.name,
+                            "tags": company_dto.tag_names,
+                        }
+                        if company_dto is not None
+                        else None
+                    ),
+                }
+                for company_name, company_dto in zip(
+                    batch_get_request.company_names, company_dtos
+                )
+            ]
+        },
+        response_model=CompanyBatchGetResponseSchema,
+    )
 
 
 @router.post(
@@ -98,47 +407,154 @@ def get_company(
     name="company:add-company",
     summary="새로운 회사 추가",
 )
-def add_company(
+async def add_company(
     company_create_request_dto: CompanyCreateSchema,
     x_wanted_language: LanguageCode = Header(LanguageCode.en),
-    db_session: Session = Depends(get_db),
+    db_session: Session | AsyncSession = Depends(get_db),
+    name_index: CompanyNameIndex = Depends(get_company_name_index),
+    response_cache: ResponseCache | None = Depends(get_response_cache),
 ):
-    company_dto = company_services.add_company(
+    company_dto = await company_async_services.add_company(
         db_session=db_session,
-        create_dto=CreateCompanyDTO(
-            ko_name=company_create_request_dto.company_name.ko,
-            en_name=company_create_request_dto.company_name.en,
-            tw_name=company_create_request_dto.company_name.tw,
-            tags=[
-                TagDTO(
-                    ko_name=tag_requsst_dto.tag_name.ko,
-                    en_name=tag_requsst_dto.tag_name.en,
-                    ja_name=tag_requsst_dto.tag_name.ja,
-                    tw_name=tag_requsst_dto.tag_name.tw,
-                )
-                for tag_requsst_dto in company_create_request_dto.tags
-            ],
-        ),
+        create_dto=_to_create_company_dto(company_create_request_dto),
         language_code=x_wanted_language,
+        name_index=name_index,
+        response_cache=response_cache,
     )
 
     return CompanySchema(company_name=company_dto.name, tags=company_dto.tag_names)
 
 
+def _parse_batch_create_item(
+    item: JsonItem,
+) -> CreateCompanyDTO | CompanyBatchCreateResultSchema:
+    # 추가할 수 없는 항목은 invalid 결과를 돌려준다.
+    if item.error is not None:
+        return CompanyBatchCreateResultSchema(
+            index=item.index, status="invalid", detail=item.error
+        )
+
+    try:
+        return _to_create_company_dto(CompanyCreateSchema.model_validate(item.value))
+    except ValidationError as e:
+        return CompanyBatchCreateResultSchema(
+            index=item.index,
+            status="invalid",
+            detail=e.errors(
+                include_url=False, include_context=False, include_input=False
+            ),
+        )
+
+
+@router.post(
+    "/companies:batchCreate",
+    response_class=StreamingResponse,
+    name="company:batch-create-companies",
+    summary="NDJSON / JSON 배열로 회사 대량 추가",
+    responses={
+        200: {
+            "description": "항목마다 CompanyBatchCreateResultSchema 한 줄 (NDJSON)",
+            "content": {"application/x-ndjson": {}},
+        }
+    },
+)
+async def batch_create_companies(
+    request: Request,
+    chunk_size: int = Query(
+        BATCH_CREATE_DEFAULT_CHUNK_SIZE, ge=1, le=BATCH_CREATE_MAX_CHUNK_SIZE
+    ),
+    x_wanted_language: LanguageCode = Header(LanguageCode.en),
+    db_session: Session | AsyncSession = Depends(get_db),
+    name_index: CompanyNameIndex = Depends(get_company_name_index),
+    response_cache: ResponseCache | None = Depends(get_response_cache),
+) -> StreamingResponse:
+    """
+    요청 본문(NDJSON 또는 JSON 배열, 원소는 POST /companies 의 요청과 같다)을 받는 대로 읽어
+    chunk_size 개씩 한 트랜잭션으로 추가하고, 항목마다 결과를 요청 순서대로 NDJSON 으로 돌려준다.
+    태그는 요청 전체에서 한 번만 조회/추가한다.
+
+    응답을 보내기 시작하면 Starlette 가 연결 종료를 기다리며 요청 본문을 소비하므로,
+    본문을 끝까지 처리한 뒤에 결과를 보낸다. 결과는 일정 크기를 넘으면 임시 파일에 쌓아둔다.
+    """
+    tag_ids_cache: dict[tuple[str, str], int] = {}
+
+    async def add_chunk(
+        chunk: list[tuple[int, CreateCompanyDTO | CompanyBatchCreateResultSchema]],
+    ) -> None:
+        create_dtos = [item for _, item in chunk if isinstance(item, CreateCompanyDTO)]
+        try:
+            company_dtos = iter(
+                await company_async_services.add_companies(
+                    db_session=db_session,
+                    create_dtos=create_dtos,
+                    language_code=x_wanted_language,
+                    name_index=name_index,
+                    response_cache=response_cache,
+                    tag_ids_cache=tag_ids_cache,
+                )
+            )
+        except SQLAlchemyError:
+            # 다음 청크를 같은 세션으로 추가할 수 있도록 되돌린다.
+            await company_async_services.run_service(
+                lambda db_session: db_session.rollback(), db_session=db_session
+            )
+            company_dtos = None
+
+        for index, item in chunk:
+            if isinstance(item, CompanyBatchCreateResultSchema):
+                result = item
+            elif company_dtos is None:
+                result = CompanyBatchCreateResultSchema(
+                    index=index, status="failed", detail="회사를 저장하지 못했습니다."
+                )
+            else:
+                company_dto = next(company_dtos)
+                result = CompanyBatchCreateResultSchema(
+                    index=index,
+                    status="created",
+                    company=CompanySchema(
+                        company_name=company_dto.name, tags=company_dto.tag_names
+                    ),
+                )
+            results.write(result.model_dump_json(exclude_none=True).encode() + b"\n")
+
+    with ExitStack() as stack:
+        results = stack.enter_context(
+            SpooledTemporaryFile(max_size=BATCH_CREATE_RESULT_SPOOL_BYTES)
+        )
+        chunk = []
+        async for item in iter_json_items(request.stream()):
+            chunk.append((item.index, _parse_batch_create_item(item)))
+            if len(chunk) >= chunk_size:
+                await add_chunk(chunk)
+                chunk = []
+        await add_chunk(chunk)
+        # 처리 중 오류가 나면 여기서 닫고, 그렇지 않으면 결과를 모두 보낸 뒤에 닫는다.
+        close_results = stack.pop_all()
+
+    def iter_results() -> Iterator[bytes]:
+        with close_results:
+            results.seek(0)
+            yield from iter(lambda: results.read(64 * 1024), b"")
+
+    return StreamingResponse(iter_results(), media_type="application/x-ndjson")
+
+
 @router.put(
     "/companies/{company_name}/tags",
     response_model=CompanySchema,
     name="company:update-company-tags",
     summary="회사 태그 정보 추가",
 )
-def update_company_tags(
+async def update_company_tags(
     company_name: str,
     tags: list[CompanyTagUpdateSchema],
     x_wanted_language: LanguageCode = Header(LanguageCode.en),
-    db_session: Session = Depends(get_db),
+    db_session: Session | AsyncSession = Depends(get_db),
+    response_cache: ResponseCache | None = Depends(get_response_cache),
 ):
     try:
-        company_dto = company_services.append_company_tags(
+        company_dto = await company_async_services.append_company_tags(
             db_session=db_session,
             company_name=company_name,
             tags=[
@@ -151,6 +567,7 @@ def update_company_tags(
                 for tag in tags
             ],
             language_code=x_wanted_language,
+            response_cache=response_cache,
         )
     except CompanyNotFound:
         raise HTTPException(status_code=404, detail="Company not found")
@@ -164,18 +581,20 @@ def update_company_tags(
     name="company:delete-company-tag",
     summary="회사 태그 정보 삭제",
 )
-def delete_company_tag(
+async def delete_company_tag(
     company_name: str,
     tag_name: str,
     x_wanted_language: LanguageCode = Header(LanguageCode.en),
-    db_session: Session = Depends(get_db),
+    db_session: Session | AsyncSession = Depends(get_db),
+    response_cache: ResponseCache | None = Depends(get_response_cache),
 ) -> CompanySchema:
     try:
-        company_dto = company_services.delete_company_tag(
+        company_dto = await company_async_services.delete_company_tag(
             db_session=db_session,
             company_name=company_name,
             delete_tag_name=tag_name,
             language_code=x_wanted_language,
+            response_cache=response_cache,
         )
     except CompanyNotFound:
         raise HTTPException(status_code=404, detail="Company not found")
@@ -0,0 +1,42 @@
+from fastapi import APIRouter
+from fastapi import Depends
+
+from wanted_jjh import settings
+from wanted_jjh.caches.response import ResponseCache
+from wanted_jjh.db.instrumentation import QueryMetrics
+from wanted_jjh.routers.utils.caches import get_response_cache
+from wanted_jjh.routers.utils.db import get_query_metrics
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics/response-cache",
+    name="metrics:response-cache",
+    summary="응답 캐시 적중/미스 통계",
+)
+async def get_response_cache_metrics(
+    response_cache: ResponseCache | None = Depends(get_response_cache),
+) -> dict:
+    if response_cache is None:
+        return {"enabled": False}
+
+    return {"enabled": True, **response_cache.stats()}
+
+
+@router.get(
+    "/metrics/db",
+    name="metrics:db",
+    summary="라우트별 SQL 문 수/DB 시간 통계",
+)
+async def get_db_metrics(
+    query_metrics: QueryMetrics | None = Depends(get_query_metrics),
+) -> dict:
+    if query_metrics is None:
+        return {"enabled": False}
+
+    return {
+        "enabled": True,
+        "slow_query_ms": settings.SLOW_QUERY_MS,
+        "routes": query_metrics.stats(),
+    }
@@ -0,0 +1,45 @@
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from wanted_jjh.caches.response import CachedResponse
+from wanted_jjh.caches.response import ResponseCache
+
+
+def get_response_cache(request: Request) -> ResponseCache | None:
+    return request.app.state.response_cache
+
+
+async def read_through(
+    response_cache: ResponseCache | None,
+    *,
+    key: str,
+    tags: Iterable[str] = (),
+    keyspace: str | None = None,
+    build: Callable[[], Awaitable[Response]],
+) -> Response:
+    """
+    캐시된 응답이 있으면 그대로 돌려주고, 없으면 build 로 응답을 만들어 캐시한다.
+    오류(HTTPException)는 캐시하지 않는다.
+    keyspace 를 주면 keyspace 의 현재 세대 번호를 key 에 붙인다. 응답을 만드는 동안
+    세대 번호가 올라가도 이전 세대의 key 로 저장되므로 다시 읽히지 않는다.
+    """
+    if response_cache is None:
+        return await build()
+
+    if keyspace is not None:
+        key = response_cache.generation_key(key, keyspace)
+
+    cached = response_cache.get(key)
+    if cached is not None:
+        response = cached.to_response()
+        response.headers["x-cache"] = "hit"
+        return response
+
+    response = await build()
+    response_cache.set(key, CachedResponse.from_response(response), tags=tags)
+    response.headers["x-cache"] = "miss"
+    return response
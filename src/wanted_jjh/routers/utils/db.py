@@ -1,5 +1,56 @@
-from starlette.requests import Request
+from collections.abc import AsyncGenerator
+from collections.abc import Callable
+from collections.abc import Generator
+from contextlib import AbstractAsyncContextManager
+from contextlib import asynccontextmanager
 
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session as SessionType
 
-def get_db(request: Request):
-    return request.state.db
+from wanted_jjh import settings
+from wanted_jjh.db.instrumentation import QueryMetrics
+from wanted_jjh.db.session import AsyncSessionLocal
+from wanted_jjh.db.session import Session
+
+
+def get_sync_db() -> Generator[SessionType, None, None]:
+    # DB 를 사용하는 요청에서만 세션을 만들고, 핸들러가 예외를 던져도 반드시 반납한다.
+    # (Session 은 첫 쿼리 시점에 커넥션 풀에서 커넥션을 가져온다.)
+    db_session = Session()
+    try:
+        yield db_session
+    finally:
+        db_session.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db_session:
+        yield db_session
+
+
+# settings.ASYNC_DB 에 따라 동기 Session / AsyncSession 중 하나를 주입한다.
+get_db = get_async_db if settings.ASYNC_DB else get_sync_db
+
+
+@asynccontextmanager
+async def open_sync_db() -> AsyncGenerator[SessionType, None]:
+    db_session = Session()
+    try:
+        yield db_session
+    finally:
+        db_session.close()
+
+
+def get_db_opener() -> Callable[
+    [], AbstractAsyncContextManager[SessionType | AsyncSession]
+]:
+    """
+    StreamingResponse 의 본문은 get_db 가 세션을 반납한 뒤에 만들어지므로,
+    본문을 만들면서 DB 를 읽는 핸들러는 이 함수로 세션을 직접 열고 닫는다.
+    """
+    return AsyncSessionLocal if settings.ASYNC_DB else open_sync_db
+
+
+def get_query_metrics(request: Request) -> QueryMetrics | None:
+    return request.app.state.query_metrics
@@ -0,0 +1,12 @@
+from starlette.requests import Request
+
+from wanted_jjh.indexes.company_name import CompanyNameIndex
+from wanted_jjh.indexes.company_tag import CompanyTagIndex
+
+
+def get_company_name_index(request: Request) -> CompanyNameIndex:
+    return request.app.state.company_name_index
+
+
+def get_company_tag_index(request: Request) -> CompanyTagIndex:
+    return request.app.state.company_tag_index
@@ -0,0 +1,168 @@
+import codecs
+import json
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from typing import Any
+from typing import NamedTuple
+
+# 항목 하나(NDJSON 한 줄, JSON 배열의 원소 하나)의 최대 크기
+MAX_ITEM_CHARS = 1024 * 1024
+
+_WHITESPACE = " \t\r\n"
+
+
+class JsonItem(NamedTuple):
+    # 요청 본문에서 몇 번째 항목인지 (0부터)
+    index: int
+    value: Any = None
+    # 항목을 읽지 못했으면 그 이유
+    error: str | None = None
+
+
+async def iter_json_items(chunks: AsyncIterable[bytes]) -> AsyncIterator[JsonItem]:
+    """
+    요청 본문을 받는 대로 읽으면서 JSON 값을 하나씩 돌려준다.
+
+    본문이 "[" 로 시작하면 JSON 배열의 원소를, 아니면 NDJSON (한 줄에 JSON 값 하나)을 읽는다.
+    - NDJSON 은 읽지 못한 줄을 오류 항목으로 돌려주고 다음 줄부터 계속 읽는다. (빈 줄은 무시)
+    - JSON 배열은 문법 오류 이후의 원소를 구분할 수 없으므로, 오류 항목을 돌려주고 멈춘다.
+    """
+    texts = _iter_texts(chunks)
+
+    buffer = ""
+    async for text in texts:
+        buffer += text
+        if buffer.lstrip(_WHITESPACE):
+            break
+
+    if buffer.lstrip(_WHITESPACE).startswith("["):
+        items = _iter_array_items(buffer, texts)
+    else:
+        items = _iter_ndjson_items(buffer, texts)
+
+    async for item in items:
+        yield item
+
+
+async def _iter_texts(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    # 여러 바이트로 된 UTF-8 문자가 청크 경계에서 잘려도 이어서 디코딩한다.
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    async for chunk in chunks:
+        if text := decoder.decode(chunk):
+            yield text
+    if text := decoder.decode(b"", final=True):
+        yield text
+
+
+async def _iter_ndjson_items(
+    buffer: str, texts: AsyncIterator[str]
+) -> AsyncIterator[JsonItem]:
+    index = 0
+    # 너무 긴 줄은 오류 항목으로 돌려주고 다음 줄바꿈까지 버린다.
+    skipping = False
+    final = False
+
+    while not final:
+        text = await anext(texts, None)
+        final = text is None
+
+        *lines, buffer = (buffer + (text or "")).split("\n")
+        if final:
+            lines.append(buffer)
+            buffer = ""
+
+        for line in lines:
+            if skipping:
+                skipping = False
+                continue
+            if not line.strip(_WHITESPACE):
+                continue
+
+            yield _decode_line(index, line)
+            index += 1
+
+        if len(buffer) > MAX_ITEM_CHARS:
+            if not skipping:
+                yield JsonItem(index, error="항목이 너무 큽니다.")
+                index += 1
+                skipping = True
+            buffer = ""
+
+
+def _decode_line(index: int, line: str) -> JsonItem:
+    if len(line) > MAX_ITEM_CHARS:
+        return JsonItem(index, error="항목이 너무 큽니다.")
+
+    try:
+        return JsonItem(index, value=json.loads(line))
+    except json.JSONDecodeError as e:
+        return JsonItem(index, error=f"JSON 형식이 아닙니다. ({e.msg})")
+
+
+async def _iter_array_items(
+    buffer: str, texts: AsyncIterator[str]
+) -> AsyncIterator[JsonItem]:
+    decoder = json.JSONDecoder()
+    index = 0
+    # "[" 다음의 첫 원소는 "," 없이 시작한다.
+    pos = buffer.index("[") + 1
+    expect_comma = False
+    final = False
+
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+
+        # 값 뒤에 구분자가 와야 값이 끝났다고 볼 수 있으므로, 남은 문자가 없으면 더 읽는다.
+        if pos >= len(buffer) and not final:
+            text = await anext(texts, None)
+            buffer, pos = buffer[pos:] + (text or ""), 0
+            final = text is None
+            continue
+
+        if pos >= len(buffer):
+            yield JsonItem(index, error="JSON 배열이 끝나지 않았습니다.")
+            return
+        if buffer[pos] == "]":
+            return
+
+        if expect_comma:
+            if buffer[pos] != ",":
+                yield JsonItem(index, error="JSON 배열의 원소 사이에 , 가 없습니다.")
+                return
+            pos = _skip_whitespace(buffer, pos + 1)
+            expect_comma = False
+            continue
+
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            error = e.msg
+        else:
+            # 숫자처럼 본문 끝에서 잘렸을 수도 있는 값은 다음 문자를 확인한 뒤에 돌려준다.
+            if end < len(buffer) or final:
+                yield JsonItem(index, value=value)
+                index += 1
+                pos = end
+                expect_comma = True
+                continue
+            error = None
+
+        if final or len(buffer) - pos > MAX_ITEM_CHARS:
+            yield JsonItem(
+                index,
+                error=f"JSON 형식이 아닙니다. ({error})"
+                if error
+                else "항목이 너무 큽니다.",
+            )
+            return
+
+        # 원소가 아직 다 도착하지 않았으면 더 읽어서 다시 시도한다.
+        text = await anext(texts, None)
+        buffer, pos = buffer[pos:] + (text or ""), 0
+        final = text is None
+
+
+def _skip_whitespace(buffer: str, pos: int) -> int:
+    while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+        pos += 1
+    return pos
@@ -0,0 +1,38 @@
+from functools import lru_cache
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from wanted_jjh import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# orjson 이 없으면 Starlette 의 JSONResponse(표준 json 모듈)로 인코딩한다.
+FastJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+
+@lru_cache
+def _get_type_adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def json_response(content: Any, *, response_model: Any) -> JSONResponse:
+    """
+    DTO 로 만든 dict/list 를 JSON 응답으로 만든다.
+
+    settings.FAST_JSON_RESPONSE 이면 검증/변환 없이 바로 인코딩하고(orjson 이 있으면 orjson),
+    아니면 response_model 로 한 번 검증한 뒤 jsonable_encoder 로 변환해서 인코딩한다.
+    두 경로의 응답 본문은 같다.
+    """
+    if settings.FAST_JSON_RESPONSE:
+        return FastJSONResponse(content)
+
+    return JSONResponse(
+        jsonable_encoder(_get_type_adapter(response_model).validate_python(content))
+    )
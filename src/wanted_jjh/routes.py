@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 
 from wanted_jjh.routers import company
+from wanted_jjh.routers import metrics
 
 router = APIRouter()
 router.include_router(company.router, tags=["company"])
+router.include_router(metrics.router, tags=["metrics"])
@@ -1,4 +1,15 @@
+from typing import Any
+from typing import Literal
+
 from pydantic import BaseModel
+from pydantic import Field
+
+# POST /companies:batchGet 으로 한 번에 조회할 수 있는 회사명 수
+BATCH_GET_MAX_COMPANY_NAMES = 500
+
+# POST /companies:batchCreate 에서 한 트랜잭션으로 추가할 회사 수
+BATCH_CREATE_DEFAULT_CHUNK_SIZE = 500
+BATCH_CREATE_MAX_CHUNK_SIZE = 5000
 
 
 class CompanySearchSchema(BaseModel):
@@ -10,6 +21,24 @@ class CompanySchema(BaseModel):
     tags: list[str]
 
 
+class CompanyBatchGetSchema(BaseModel):
+    company_names: list[str] = Field(
+        min_length=1, max_length=BATCH_GET_MAX_COMPANY_NAMES
+    )
+
+
+class CompanyBatchGetResultSchema(BaseModel):
+    # 요청한 회사명
+    company_name: str
+    found: bool
+    company: CompanySchema | None = None
+
+
+class CompanyBatchGetResponseSchema(BaseModel):
+    # 요청한 회사명 순서
+    results: list[CompanyBatchGetResultSchema]
+
+
 class LanguageCodeSchema(BaseModel):
     ko: str | None = None
     en: str | None = None
@@ -26,5 +55,21 @@ class CompanyCreateSchema(BaseModel):
     tags: list[Tag]
 
 
+class CompanyBatchCreateResultSchema(BaseModel):
+    # 요청 본문에서 몇 번째 항목인지 (0부터)
+    index: int
+    # created: 추가됨, invalid: 항목 형식 오류, failed: 항목이 포함된 청크의 저장 실패
+    status: Literal["created", "invalid", "failed"]
+    company: CompanySchema | None = None
+    detail: Any = None
+
+
+class CompanyExportSchema(BaseModel):
+    # POST /companies, /companies:batchCreate 의 요청과 같은 형식에 회사 id 를 더한다.
+    company_id: int
+    company_name: LanguageCodeSchema
+    tags: list[Tag]
+
+
 class CompanyTagUpdateSchema(BaseModel):
     tag_name: LanguageCodeSchema
@@ -0,0 +1,116 @@
+import os
+import signal
+from pathlib import Path
+
+from wanted_jjh import settings
+
+
+def prepare_database() -> None:
+    """
+    워커를 띄우기 전에 마스터 프로세스에서 한 번만 스키마를 맞춘다.
+    (여러 워커가 동시에 마이그레이션하지 않도록 앱 import 와 분리한다.)
+    """
+    from wanted_jjh.db.migrations import upgrade
+    from wanted_jjh.db.session import engine
+
+    upgrade(engine)
+    # fork 하기 전에 마스터가 연 커넥션을 닫아 워커가 같은 커넥션을 공유하지 않게 한다.
+    engine.dispose()
+
+
+def _load_app():
+    from wanted_jjh.db.session import Session
+    from wanted_jjh.db.session import engine
+    from wanted_jjh.main import app
+
+    # 색인을 fork 전에 구축하면 워커는 copy-on-write 로 공유하고, 시작할 때 이후 변경분만 읽는다.
+    if settings.SEARCH_INDEX_WARMUP:
+        with Session() as db_session:
+            app.state.company_name_index.sync(db_session)
+            app.state.company_tag_index.sync(db_session)
+    engine.dispose()
+
+    return app
+
+
+def _post_fork(server, worker) -> None:
+    # 마스터에서 만든 엔진의 커넥션 풀을 워커에서 새로 만든다.
+    # close=False: 부모 프로세스가 가진 커넥션은 닫지 않고 버리기만 한다.
+    from wanted_jjh.db.session import async_engine
+    from wanted_jjh.db.session import engine
+
+    engine.dispose(close=False)
+    if async_engine is not None:
+        async_engine.sync_engine.dispose(close=False)
+
+
+def _check_response_cache(workers: int) -> None:
+    # 프로세스 메모리 캐시는 쓰기를 처리한 워커에서만 무효화되므로,
+    # 다른 워커는 TTL 동안 이전 응답을 돌려준다.
+    is_process_local = settings.RESPONSE_CACHE_BACKEND == "local" or (
+        settings.RESPONSE_CACHE_BACKEND == "shared"
+        and not settings.RESPONSE_CACHE_REDIS_URL
+    )
+    if workers > 1 and is_process_local:
+        raise SystemExit(
+            "여러 워커로 실행하려면 응답 캐시를 워커끼리 공유해야 합니다. "
+            "RESPONSE_CACHE_BACKEND=shared 와 RESPONSE_CACHE_REDIS_URL 을 설정하거나, "
+            "RESPONSE_CACHE_BACKEND=none 으로 캐시를 끄세요."
+        )
+
+
+def run_production_server(
+    *,
+    host: str,
+    port: int,
+    workers: int,
+    preload: bool = True,
+    graceful_timeout: int = 30,
+    pid_path: Path | None = None,
+    migrate: bool = True,
+) -> None:
+    """
+    gunicorn 마스터 프로세스가 UvicornWorker 워커 여러 개를 관리한다.
+
+    - preload: 마스터에서 앱을 import 하고 검색 색인을 구축한 뒤 fork 한다.
+    - 워커마다 fork 직후 DB 커넥션 풀을 새로 만든다.
+    - 워커가 2개 이상이면 프로세스 메모리 응답 캐시는 사용할 수 없다.
+    - SIGHUP: 새 워커를 띄운 뒤 기존 워커를 graceful_timeout 안에 처리 중인 요청을 마치고 종료시킨다.
+      (preload 모드에서는 코드가 다시 로드되지 않으므로, 코드 배포는 SIGUSR2 로 새 마스터를 띄운 뒤
+      기존 마스터에 SIGQUIT 을 보낸다.)
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise SystemExit("여러 워커로 실행하려면 gunicorn 패키지가 필요합니다.")
+
+    _check_response_cache(workers)
+
+    if migrate:
+        prepare_database()
+
+    options = {
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": preload,
+        "graceful_timeout": graceful_timeout,
+        "post_fork": _post_fork,
+        "pidfile": str(pid_path) if pid_path else None,
+    }
+
+    class Application(BaseApplication):
+        def load_config(self) -> None:
+            for key, value in options.items():
+                if value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            return _load_app()
+
+    Application().run()
+
+
+def reload_production_server(pid_path: Path) -> None:
+    # 실행 중인 gunicorn 마스터에 SIGHUP 을 보내 워커를 무중단으로 교체한다.
+    os.kill(int(pid_path.read_text().strip()), signal.SIGHUP)
@@ -1,167 +1,867 @@
-from sqlalchemy import and_
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from itertools import islice
 
+from sqlalchemy import and_
+from sqlalchemy import case
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import literal
+from sqlalchemy import Select
+from sqlalchemy import select
+from sqlalchemy import union_all
+
+from wanted_jjh.caches.response import FULL_TEXT_TAG_SEARCH_TAG
+from wanted_jjh.caches.response import ResponseCache
+from wanted_jjh.caches.response import company_name_tag
+from wanted_jjh.caches.response import search_keyspaces_for_name
+from wanted_jjh.caches.response import tag_name_tag
+from wanted_jjh.db.expressions import translated_name
 from wanted_jjh.db.session import Session
 from wanted_jjh.dtos.company import CompanyDTO
+from wanted_jjh.dtos.company import CompanySearchResultDTO
 from wanted_jjh.dtos.company import CreateCompanyDTO
 from wanted_jjh.dtos.company import TagDTO
 from wanted_jjh.enums import LanguageCode
+from wanted_jjh.enums import SearchMode
 from wanted_jjh.exceptions import BusinessException
 from wanted_jjh.exceptions import CompanyNotFound
 from wanted_jjh.exceptions import TagNotFound
+from wanted_jjh.indexes.company_name import PREFIX_TIER
+from wanted_jjh.indexes.company_name import SUBSTRING_TIER
+from wanted_jjh.indexes.company_name import CompanyNameIndex
+from wanted_jjh.indexes.company_name import SearchCursor
+from wanted_jjh.indexes.company_name import fold
+from wanted_jjh.indexes.company_name import rank_name
+from wanted_jjh.indexes.company_tag import CompanyTagIndex
 from wanted_jjh.models.company import Company
 from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_document import CompanyDocument
 from wanted_jjh.models.company_tag import CompanyTag
 from wanted_jjh.models.company_tag import CompanyTagName
+from wanted_jjh.models.company_tag import association_company_and_company_tag
+from wanted_jjh.models.full_text import company_name_fts
+from wanted_jjh.models.full_text import company_tag_name_fts
+from wanted_jjh.normalization import normalize_name
+from wanted_jjh.services.company_document import refresh_company_documents
+from wanted_jjh.services.full_text_search import MATCH_MIN_LENGTH
+from wanted_jjh.services.full_text_search import check_full_text_search_enabled
+from wanted_jjh.services.full_text_search import full_text_condition
+from wanted_jjh.services.full_text_search import sync_company_name_fts
+from wanted_jjh.services.full_text_search import sync_company_tag_name_fts
+from wanted_jjh.services.full_text_search import to_phrase
+
+# 요청 언어의 회사명이 없을 때 노출할 언어 순서
+FALLBACK_LANGUAGE_CODES = (
+    LanguageCode.ko,
+    LanguageCode.en,
+    LanguageCode.ja,
+    LanguageCode.tw,
+)
 
 
 def search_companies_by_name(
-    *, db_session: Session, name: str, language_code: LanguageCode = LanguageCode.ko
-) -> list[CompanyDTO]:
-    companies = (
-        db_session.query(Company)
-        .join(CompanyName)
+    *,
+    db_session: Session,
+    name: str,
+    language_code: LanguageCode = LanguageCode.ko,
+    name_index: CompanyNameIndex | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+    mode: SearchMode = SearchMode.default,
+) -> CompanySearchResultDTO:
+    if mode == SearchMode.fts:
+        return _search_companies_by_full_text(
+            db_session=db_session,
+            name=name,
+            language_code=language_code,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    # 초성/자모 검색은 미리 풀어쓴 이름을 가진 인메모리 색인으로만 찾는다.
+    if mode == SearchMode.jamo and name_index is None:
+        raise BusinessException("mode=jamo 검색에는 회사명 색인이 필요합니다.")
+
+    after = SearchCursor.decode(cursor) if cursor else None
+
+    if name_index is not None:
+        name_index.sync(db_session)
+        matches = name_index.iter_matches(name, after=after, mode=mode)
+    else:
+        matches = _iter_like_matches(db_session=db_session, name=name, after=after)
+
+    # 다음 페이지 존재 여부를 알기 위해 limit 보다 하나 더 읽는다.
+    page = list(matches if limit is None else islice(matches, limit + 1))
+
+    next_cursor = None
+    if limit is not None and len(page) > limit:
+        page = page[:limit]
+        next_cursor = page[-1][0].encode()
+
+    company_ids = [company_id for _, company_id in page]
+
+    if name_index is not None:
+        company_names = {
+            company_id: name_index.get_name(company_id, language_code)
+            for company_id in company_ids
+        }
+    else:
+        company_names = _get_company_names(
+            db_session=db_session,
+            company_ids=company_ids,
+            language_code=language_code,
+        )
+
+    return CompanySearchResultDTO(
+        companies=[
+            CompanyDTO(name=company_names[company_id]) for company_id in company_ids
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+def _get_company_names(
+    *, db_session: Session, company_ids: list[int], language_code: LanguageCode
+) -> dict[int, str]:
+    return dict(
+        db_session.execute(
+            select(
+                CompanyName.company_id,
+                translated_name(
+                    CompanyName.name, CompanyName.language_code, language_code
+                ),
+            )
+            .where(CompanyName.company_id.in_(company_ids))
+            .group_by(CompanyName.company_id)
+        ).all()
+    )
+
+
+def _search_companies_by_full_text(
+    *,
+    db_session: Session,
+    name: str,
+    language_code: LanguageCode,
+    limit: int | None,
+    cursor: str | None,
+) -> CompanySearchResultDTO:
+    """
+    회사명 전문 검색 색인에서 정규화한 검색어를 포함하는 회사를 찾는다.
+    BM25 점수 > 접두어 일치 > 짧은 회사명 순이며, 3글자보다 짧은 검색어는 BM25 점수 없이 정렬한다.
+    cursor 는 다음 페이지의 시작 위치(offset)이다.
+    """
+    check_full_text_search_enabled(db_session)
+    offset = _decode_offset_cursor(cursor) if cursor else 0
+    query = normalize_name(name)
+
+    statement = (
+        select(CompanyName.company_id)
+        .select_from(company_name_fts)
+        .join(CompanyName, CompanyName.id == company_name_fts.c.rowid)
+        .where(
+            full_text_condition(company_name_fts, query),
+            CompanyName.company_id.is_not(None),
+        )
+        .group_by(CompanyName.company_id)
+        .order_by(
+            func.min(company_name_fts.c.rank),
+            func.min(
+                case(
+                    (func.instr(company_name_fts.c.name, query) == 1, PREFIX_TIER),
+                    else_=SUBSTRING_TIER,
+                )
+            ),
+            func.min(func.length(company_name_fts.c.name)),
+            CompanyName.company_id,
+        )
+        .offset(offset)
+    )
+    if limit is not None:
+        # 다음 페이지 존재 여부를 알기 위해 limit 보다 하나 더 읽는다.
+        statement = statement.limit(limit + 1)
+
+    company_ids = list(db_session.scalars(statement))
+
+    next_cursor = None
+    if limit is not None and len(company_ids) > limit:
+        company_ids = company_ids[:limit]
+        next_cursor = str(offset + limit)
+
+    company_names = _get_company_names(
+        db_session=db_session, company_ids=company_ids, language_code=language_code
+    )
+
+    return CompanySearchResultDTO(
+        companies=[
+            CompanyDTO(name=company_names[company_id]) for company_id in company_ids
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+def _decode_offset_cursor(value: str) -> int:
+    if not value.isdigit():
+        raise BusinessException(f"{value} 는 올바른 cursor 가 아닙니다.")
+    return int(value)
+
+
+def _iter_like_matches(
+    *, db_session: Session, name: str, after: SearchCursor | None
+) -> Iterator[tuple[SearchCursor, int]]:
+    rows = db_session.execute(
+        select(CompanyName.id, CompanyName.company_id, CompanyName.name)
+        .join(Company)
         .filter(CompanyName.name.like(f"%{name}%"))
-        .all()
+        .order_by(
+            case(
+                (CompanyName.name.like(f"{name}%"), PREFIX_TIER),
+                else_=SUBSTRING_TIER,
+            ),
+            func.length(CompanyName.name),
+            CompanyName.id,
+        )
     )
 
-    company_dtos = [
-        CompanyDTO(name=company.get_name(language_code=language_code))
-        for company in companies
-    ]
+    seen_company_ids = set()
+    for name_id, company_id, company_name in rows:
+        if company_id in seen_company_ids:
+            continue
+        seen_company_ids.add(company_id)
 
-    return company_dtos
+        rank = rank_name(fold(name), fold(company_name), name_id)
+        if after is None or rank > after:
+            yield rank, company_id
 
 
 def search_company_by_tag(
-    *, db_session: Session, tag_name: str, language_code: LanguageCode = LanguageCode.ko
+    *,
+    db_session: Session,
+    tag_names: Sequence[str] = (),
+    any_tag_names: Sequence[str] = (),
+    exclude_tag_names: Sequence[str] = (),
+    language_code: LanguageCode = LanguageCode.ko,
+    tag_index: CompanyTagIndex | None = None,
+    mode: SearchMode = SearchMode.default,
 ) -> list[CompanyDTO]:
-    tag = (
-        db_session.query(CompanyTag)
-        .join(CompanyTag.names)
-        .filter(CompanyTagName.name == tag_name)
-        .first()
+    """
+    tag_names 가 모두 연결되어 있고(AND), any_tag_names 중 하나 이상이 연결되어 있으며(OR),
+    exclude_tag_names 는 하나도 연결되지 않은(NOT) 회사를 company_id 순으로 돌려준다.
+    태그명은 언어에 관계없이 같은 이름의 태그를 모두 포함하며, 대소문자/전각·반각은 구분하지 않는다.
+
+    mode=fts 이면 태그명이 검색어를 포함하는 태그로 찾고(_search_company_by_tag_full_text),
+    없는 태그명도 오류 없이 빈 결과가 된다.
+    """
+    if not tag_names and not any_tag_names:
+        raise BusinessException("검색할 태그명이 없습니다.")
+    if mode == SearchMode.jamo:
+        raise BusinessException("mode=jamo 는 회사명 검색에서만 사용할 수 있습니다.")
+
+    # 요청 언어 -> ko -> en -> ja -> tw 순서로 회사명을 결정한다.
+    language_codes = (language_code, *FALLBACK_LANGUAGE_CODES)
+
+    if mode == SearchMode.fts:
+        return _search_company_by_tag_full_text(
+            db_session=db_session,
+            tag_names=tag_names,
+            any_tag_names=any_tag_names,
+            exclude_tag_names=exclude_tag_names,
+            language_codes=language_codes,
+        )
+
+    if tag_index is not None:
+        tag_index.sync(db_session)
+        _check_tag_names_exist(
+            db_session=db_session,
+            tag_names=[
+                tag_name
+                for tag_name in (*tag_names, *any_tag_names)
+                if tag_name not in tag_index
+            ],
+        )
+
+        return [
+            CompanyDTO(name=tag_index.get_name(company_id, language_codes))
+            for company_id in tag_index.search(
+                tag_names,
+                any_tag_names=any_tag_names,
+                exclude_tag_names=exclude_tag_names,
+            )
+        ]
+
+    _check_tag_names_exist(
+        db_session=db_session, tag_names=[*tag_names, *any_tag_names]
     )
 
-    if not tag:
-        raise TagNotFound(f"{tag_name} 태그가 존재하지 않습니다.")
+    conditions = [Company.id.in_(_tagged_company_ids([name])) for name in tag_names]
+    if any_tag_names:
+        conditions.append(Company.id.in_(_tagged_company_ids(any_tag_names)))
+    if exclude_tag_names:
+        conditions.append(Company.id.not_in(_tagged_company_ids(exclude_tag_names)))
+
+    rows = db_session.execute(
+        select(
+            Company.id,
+            translated_name(
+                CompanyName.name, CompanyName.language_code, *language_codes
+            ),
+        )
+        .outerjoin(CompanyName)
+        .where(*conditions)
+        .group_by(Company.id)
+        .order_by(Company.id)
+    )
+
+    return [CompanyDTO(name=company_name) for _, company_name in rows]
+
 
-    companies = tag.companies
-    unique_companies = {company.id: company for company in companies}.values()
+def _tagged_company_ids(tag_names: Sequence[str]) -> Select:
+    return (
+        select(association_company_and_company_tag.c.company_id)
+        .join(
+            CompanyTagName,
+            CompanyTagName.tag_id
+            == association_company_and_company_tag.c.company_tag_id,
+        )
+        .where(
+            CompanyTagName.name_key.in_({normalize_name(name) for name in tag_names})
+        )
+    )
 
-    sorted_companies = sorted(unique_companies, key=lambda x: x.id)
 
-    company_dtos = []
-    for company in sorted_companies:
-        company_name = company.get_name(language_code)
+def _search_company_by_tag_full_text(
+    *,
+    db_session: Session,
+    tag_names: Sequence[str],
+    any_tag_names: Sequence[str],
+    exclude_tag_names: Sequence[str],
+    language_codes: tuple[LanguageCode, ...],
+) -> list[CompanyDTO]:
+    """
+    태그명 전문 검색 색인으로 검색어마다 태그명이 검색어를 포함하는 태그를 찾아 AND/OR/NOT 을 적용한다.
+    tag_names / any_tag_names 중 3글자 이상인 검색어와 가장 잘 맞는 태그의 BM25 점수 순,
+    같으면 company_id 순으로 돌려준다.
+    """
+    check_full_text_search_enabled(db_session)
+
+    conditions = [
+        Company.id.in_(_full_text_tagged_company_ids([name])) for name in tag_names
+    ]
+    if any_tag_names:
+        conditions.append(Company.id.in_(_full_text_tagged_company_ids(any_tag_names)))
+    if exclude_tag_names:
+        conditions.append(
+            Company.id.not_in(_full_text_tagged_company_ids(exclude_tag_names))
+        )
 
-        if not company_name:
-            for lan_code in [
-                LanguageCode.ko,
-                LanguageCode.en,
-                LanguageCode.ja,
-                LanguageCode.tw,
-            ]:
-                company_name = company.get_name(lan_code)
-                if company_name:
-                    break
+    statement = (
+        select(
+            Company.id,
+            translated_name(
+                CompanyName.name, CompanyName.language_code, *language_codes
+            ),
+        )
+        .outerjoin(CompanyName)
+        .where(*conditions)
+        .group_by(Company.id)
+    )
 
-        company_dtos.append(CompanyDTO(name=company_name))
+    # MATCH 는 OR 조건 안에서 쓸 수 없으므로 FTS5 의 OR 연산자로 한 번에 검색한다.
+    phrases = {
+        to_phrase(query)
+        for name in (*tag_names, *any_tag_names)
+        if len(query := normalize_name(name)) >= MATCH_MIN_LENGTH
+    }
+    if phrases:
+        scores = (
+            select(
+                association_company_and_company_tag.c.company_id,
+                func.min(company_tag_name_fts.c.rank).label("score"),
+            )
+            .select_from(company_tag_name_fts)
+            .join(CompanyTagName, CompanyTagName.id == company_tag_name_fts.c.rowid)
+            .join(
+                association_company_and_company_tag,
+                association_company_and_company_tag.c.company_tag_id
+                == CompanyTagName.tag_id,
+            )
+            .where(company_tag_name_fts.c.name.match(" OR ".join(sorted(phrases))))
+            .group_by(association_company_and_company_tag.c.company_id)
+            .subquery()
+        )
+        # BM25 점수는 음수이므로 점수가 없는 회사(짧은 검색어로만 찾은 회사)는 0 으로 뒤에 둔다.
+        statement = statement.outerjoin(
+            scores, scores.c.company_id == Company.id
+        ).order_by(func.coalesce(func.min(scores.c.score), 0))
 
-    return company_dtos
+    rows = db_session.execute(statement.order_by(Company.id))
 
+    return [CompanyDTO(name=company_name) for _, company_name in rows]
 
-def to_company_dto(company: Company, language_code: LanguageCode) -> CompanyDTO:
-    translated_company_name = company.get_name(language_code)
-    translated_tags = [tag.get_name(language_code) for tag in company.tags]
-    sorted_tags = sorted(translated_tags)
 
-    return CompanyDTO(
-        name=translated_company_name,
-        tag_names=sorted_tags,
+def _full_text_tagged_company_ids(tag_names: Sequence[str]) -> Select:
+    # MATCH 는 OR 조건 안에서 쓸 수 없으므로 검색어마다 조회해 합친다.
+    return union_all(
+        *(
+            select(association_company_and_company_tag.c.company_id)
+            .join(
+                CompanyTagName,
+                CompanyTagName.tag_id
+                == association_company_and_company_tag.c.company_tag_id,
+            )
+            .join(
+                company_tag_name_fts, company_tag_name_fts.c.rowid == CompanyTagName.id
+            )
+            .where(full_text_condition(company_tag_name_fts, name))
+            for name in tag_names
+        )
     )
 
 
+def _check_tag_names_exist(*, db_session: Session, tag_names: list[str]) -> None:
+    # 회사가 연결되지 않은 태그도 존재하는 태그이므로 태그명 테이블에서 확인한다.
+    if not tag_names:
+        return
+
+    existing_tag_keys = set(
+        db_session.scalars(
+            select(CompanyTagName.name_key).where(
+                CompanyTagName.name_key.in_(
+                    {normalize_name(name) for name in tag_names}
+                ),
+                CompanyTagName.tag_id.is_not(None),
+            )
+        )
+    )
+    for tag_name in tag_names:
+        if normalize_name(tag_name) not in existing_tag_keys:
+            raise TagNotFound(f"{tag_name} 태그가 존재하지 않습니다.")
+
+
+def to_company_dto(
+    *, db_session: Session, company_id: int, language_code: LanguageCode
+) -> CompanyDTO:
+    document = db_session.execute(
+        select(CompanyDocument.name, CompanyDocument.sorted_tag_names).where(
+            CompanyDocument.company_id == company_id,
+            CompanyDocument.language_code == language_code,
+        )
+    ).first()
+
+    if document is None:
+        return CompanyDTO(name="", tag_names=())
+
+    return CompanyDTO(name=document.name, tag_names=tuple(document.sorted_tag_names))
+
+
+def to_company_dtos(
+    *, db_session: Session, company_ids: list[int], language_code: LanguageCode
+) -> list[CompanyDTO]:
+    documents = {
+        company_id: CompanyDTO(name=name, tag_names=tuple(tag_names))
+        for company_id, name, tag_names in db_session.execute(
+            select(
+                CompanyDocument.company_id,
+                CompanyDocument.name,
+                CompanyDocument.sorted_tag_names,
+            ).where(
+                CompanyDocument.company_id.in_(company_ids),
+                CompanyDocument.language_code == language_code,
+            )
+        )
+    }
+
+    return [
+        documents.get(company_id, CompanyDTO(name="", tag_names=()))
+        for company_id in company_ids
+    ]
+
+
 def get_company_by_name(
     *,
     db_session: Session,
     company_name: str,
     language_code: LanguageCode = LanguageCode.ko,
 ) -> CompanyDTO:
-    company = (
-        db_session.query(Company)
-        .join(CompanyName)
-        .join(Company.tags)
-        .filter(CompanyName.name == company_name)
-        .first()
-    )
+    # 정규화한 회사명(name_key) 인덱스로 회사를 찾고, 미리 계산된 언어별 문서를 기본키로 읽는다.
+    # 회사명의 대소문자/전각·반각은 구분하지 않으며, 정규화한 회사명이 같은 회사가 여럿이면
+    # 먼저 추가된 회사명의 회사를 돌려준다. (batchGet 과 같은 기준)
+    document = db_session.execute(
+        select(CompanyDocument.name, CompanyDocument.tag_names)
+        .select_from(CompanyName)
+        .join(
+            CompanyDocument,
+            and_(
+                CompanyDocument.company_id == CompanyName.company_id,
+                CompanyDocument.language_code == language_code,
+            ),
+        )
+        .where(
+            CompanyName.name_key == normalize_name(company_name),
+            CompanyDocument.tag_count > 0,
+        )
+        .order_by(CompanyName.id)
+        .limit(1)
+    ).first()
 
-    if not company:
+    if document is None:
         raise CompanyNotFound(f"{company_name} 회사가 존재하지 않습니다.")
 
-    return CompanyDTO(
-        name=company.get_name(language_code),
-        tag_names=[tag.get_name(language_code) for tag in company.tags],
-    )
+    return CompanyDTO(name=document.name, tag_names=tuple(document.tag_names))
 
 
-def add_company(
+def get_companies_by_names(
     *,
     db_session: Session,
-    create_dto: CreateCompanyDTO,
+    company_names: Sequence[str],
     language_code: LanguageCode = LanguageCode.ko,
-) -> CompanyDTO:
-    new_company = Company()
-    new_company.names.extend(
+) -> list[CompanyDTO | None]:
+    """
+    회사명 목록을 한 번의 IN 쿼리로 조회해 요청 순서대로 돌려준다. 없는 회사는 None 이다.
+    태그는 회사 문서에 함께 저장되어 있으므로 같은 쿼리에서 읽는다.
+    """
+    company_dtos: dict[str, CompanyDTO] = {}
+    rows = db_session.execute(
+        select(CompanyName.name_key, CompanyDocument.name, CompanyDocument.tag_names)
+        .select_from(CompanyName)
+        .join(
+            CompanyDocument,
+            and_(
+                CompanyDocument.company_id == CompanyName.company_id,
+                CompanyDocument.language_code == language_code,
+            ),
+        )
+        .where(
+            CompanyName.name_key.in_({normalize_name(name) for name in company_names}),
+            CompanyDocument.tag_count > 0,
+        )
+        .order_by(CompanyName.id)
+    )
+    for name_key, name, tag_names in rows:
+        # 같은 회사명의 회사가 여러 개면 get_company_by_name 과 같이 먼저 추가된 회사명을 사용한다.
+        company_dtos.setdefault(
+            name_key, CompanyDTO(name=name, tag_names=tuple(tag_names))
+        )
+
+    return [
+        company_dtos.get(normalize_name(company_name)) for company_name in company_names
+    ]
+
+
+def _resolve_tag_ids(
+    *,
+    db_session: Session,
+    tag_dtos: list[TagDTO],
+    language_codes: tuple[LanguageCode, ...],
+) -> list[int]:
+    """
+    태그 DTO 목록을 태그 id 목록으로 바꾼다. (요청 순서 유지, 중복 제거)
+
+    language_codes 의 번역명 중 하나라도 일치하는 기존 태그를 사용하고,
+    없으면 새 태그를 추가한다. 값이 None 인 번역명은 조회/저장하지 않는다.
+    """
+    tag_id_lists, _ = _resolve_tag_id_lists(
+        db_session=db_session, tag_dto_lists=[tag_dtos], language_codes=language_codes
+    )
+    return tag_id_lists[0]
+
+
+def _resolve_tag_id_lists(
+    *,
+    db_session: Session,
+    tag_dto_lists: Sequence[list[TagDTO]],
+    language_codes: tuple[LanguageCode, ...],
+    known_tag_ids: Mapping[tuple[str, str], int] | None = None,
+) -> tuple[list[list[int]], dict[tuple[str, str], int]]:
+    """
+    여러 회사의 태그 DTO 목록을 한 번에 태그 id 목록으로 바꾼다. (_resolve_tag_ids 참고)
+    회사가 몇 개든 언어별 조회 1번, 새 태그 추가 2번으로 처리하고, 새 태그는 회사 사이에서도 공유한다.
+
+    태그명은 대소문자/전각·반각을 무시하고(name_key) 비교한다.
+    known_tag_ids 에 있는 (언어, 정규화한 태그명) 은 DB 에서 다시 조회하지 않는다.
+    이번에 DB 에서 찾았거나 새로 추가한 (언어, 정규화한 태그명) -> 태그 id 를 함께 돌려준다.
+    """
+    known_tag_ids = known_tag_ids or {}
+
+    tag_name_lists = [
         [
-            CompanyName(language_code=LanguageCode.ko, name=create_dto.ko_name),
-            CompanyName(language_code=LanguageCode.en, name=create_dto.en_name),
-            CompanyName(language_code=LanguageCode.tw, name=create_dto.tw_name),
+            names
+            for tag_dto in tag_dtos
+            # 번역명이 하나도 없는 태그는 식별할 수 없으므로 무시한다.
+            if (
+                names := {
+                    language_code: name
+                    for language_code in language_codes
+                    if (name := getattr(tag_dto, f"{language_code}_name")) is not None
+                }
+            )
         ]
-    )
+        for tag_dtos in tag_dto_lists
+    ]
 
-    db_session.add(new_company)
-    db_session.commit()
-    db_session.refresh(new_company)
-
-    # 태그 처리 (기존 태그 확인 후 연결)
-    for tag_dto in create_dto.tags:
-        tag = (
-            db_session.query(CompanyTag)
-            .join(CompanyTagName)
-            .filter(
-                and_(
-                    CompanyTagName.language_code == LanguageCode.ko,
-                    CompanyTagName.name == tag_dto.ko_name,
-                )
-                | and_(
-                    CompanyTagName.language_code == LanguageCode.en,
-                    CompanyTagName.name == tag_dto.en_name,
-                )
-                | and_(
-                    CompanyTagName.language_code == LanguageCode.tw,
-                    CompanyTagName.name == tag_dto.tw_name,
-                )
+    # 언어별로 IN 쿼리 한 번씩 기존 태그를 찾는다.
+    found_tag_ids: dict[tuple[str, str], int] = {}
+    existing_tag_ids: dict[tuple[str, str], int] = {}
+    for language_code in language_codes:
+        name_keys = {
+            normalize_name(names[language_code])
+            for tag_names in tag_name_lists
+            for names in tag_names
+            if language_code in names
+        }
+        for name_key in name_keys:
+            if (language_code, name_key) in known_tag_ids:
+                existing_tag_ids[language_code, name_key] = known_tag_ids[
+                    language_code, name_key
+                ]
+        name_keys = {
+            name_key
+            for name_key in name_keys
+            if (language_code, name_key) not in known_tag_ids
+        }
+        if not name_keys:
+            continue
+
+        rows = db_session.execute(
+            select(CompanyTagName.name_key, func.min(CompanyTagName.tag_id))
+            .where(
+                CompanyTagName.language_code == language_code,
+                CompanyTagName.name_key.in_(name_keys),
+                CompanyTagName.tag_id.is_not(None),
             )
-            .first()
+            .group_by(CompanyTagName.name_key)
+        )
+        found_tag_ids.update(
+            ((language_code, name_key), tag_id) for name_key, tag_id in rows
+        )
+    existing_tag_ids.update(found_tag_ids)
+
+    # 기존 태그는 태그 id, 새로 추가할 태그는 new_tag_names 의 위치를 음수로 기록한다.
+    tag_ref_lists: list[list[int]] = []
+    new_tag_names: list[list[tuple[str, str]]] = []
+    new_tag_positions: dict[tuple[str, str], int] = {}
+    for tag_names in tag_name_lists:
+        tag_refs = []
+        for names in tag_names:
+            keys = [(code, normalize_name(name)) for code, name in names.items()]
+
+            tag_ref = next(
+                (existing_tag_ids[key] for key in keys if key in existing_tag_ids),
+                None,
+            )
+            # 같은 요청 안에서 새로 추가할 태그가 중복되면 하나만 추가한다.
+            if tag_ref is None:
+                tag_ref = next(
+                    (
+                        ~new_tag_positions[key]
+                        for key in keys
+                        if key in new_tag_positions
+                    ),
+                    None,
+                )
+            if tag_ref is None:
+                for key in keys:
+                    new_tag_positions.setdefault(key, len(new_tag_names))
+                tag_ref = ~len(new_tag_names)
+                new_tag_names.append(list(names.items()))
+
+            tag_refs.append(tag_ref)
+        tag_ref_lists.append(tag_refs)
+
+    if new_tag_names:
+        new_tag_ids = _insert_id_rows(
+            db_session=db_session, model=CompanyTag, count=len(new_tag_names)
+        )
+        db_session.execute(
+            insert(CompanyTagName),
+            [
+                {"tag_id": tag_id, "language_code": language_code, "name": name}
+                for tag_id, names in zip(new_tag_ids, new_tag_names)
+                for language_code, name in names
+            ],
+        )
+        sync_company_tag_name_fts(db_session)
+        tag_ref_lists = [
+            [tag_ref if tag_ref >= 0 else new_tag_ids[~tag_ref] for tag_ref in tag_refs]
+            for tag_refs in tag_ref_lists
+        ]
+        found_tag_ids.update(
+            (key, new_tag_ids[position]) for key, position in new_tag_positions.items()
         )
 
-        # 태그가 없으면 새로 추가
-        if not tag:
-            tag = CompanyTag()
-            tag.names.extend(
-                [
-                    CompanyTagName(language_code=LanguageCode.ko, name=tag_dto.ko_name),
-                    CompanyTagName(language_code=LanguageCode.en, name=tag_dto.en_name),
-                    CompanyTagName(language_code=LanguageCode.tw, name=tag_dto.tw_name),
-                ]
+    return [list(dict.fromkeys(tag_refs)) for tag_refs in tag_ref_lists], found_tag_ids
+
+
+def _insert_id_rows(
+    *, db_session: Session, model: type[Company] | type[CompanyTag], count: int
+) -> list[int]:
+    """
+    id 외의 컬럼이 없는 회사/태그 행을 count 개 추가하고, 추가한 순서대로 id 를 돌려준다.
+    """
+    if db_session.get_bind().dialect.name == "sqlite":
+        # SQLite 는 값이 없는 행을 executemany 로 묶지 못해 행마다 INSERT 하므로,
+        # id 를 NULL 로 한 문장에 추가한다. 한 문장의 행은 순서대로 rowid 를 받는다.
+        return sorted(
+            db_session.scalars(
+                insert(model).values([{"id": None}] * count).returning(model.id)
             )
-            db_session.add(tag)
+        )
+
+    # PostgreSQL 등은 VALUES (DEFAULT) 로 추가하고, 받은 id 를 요청한 행 순서로 맞춘다.
+    return db_session.scalars(
+        insert(model).returning(model.id, sort_by_parameter_order=True),
+        [{}] * count,
+    ).all()
+
+
+def _link_company_tags(
+    *, db_session: Session, company_id: int, tag_ids: list[int]
+) -> None:
+    if not tag_ids:
+        return
+
+    db_session.execute(
+        insert(association_company_and_company_tag),
+        [{"company_id": company_id, "company_tag_id": tag_id} for tag_id in tag_ids],
+    )
+
+
+def _invalidate_responses(
+    *,
+    db_session: Session,
+    response_cache: ResponseCache | None,
+    company_ids: list[int],
+    tag_ids: list[int],
+    is_new_company: bool = False,
+) -> None:
+    """
+    회사들의 태그가 바뀌었을 때 영향을 받는 캐시 응답을 무효화한다.
+
+    - 회사 조회: 회사의 모든 언어 회사명
+    - 태그로 회사 검색: 추가/삭제된 태그의 모든 언어 태그명
+    - 회사명 검색: 새 회사가 있으면 회사명 검색 keyspace 의 세대 번호를 올린다.
+      (회사명은 수정되지 않는다.)
+    - 태그명 전문 검색: 태그 연결이 바뀌면 모두
+    """
+    if response_cache is None:
+        return
+
+    rows = db_session.execute(
+        union_all(
+            select(literal("company"), CompanyName.name).where(
+                CompanyName.company_id.in_(company_ids), CompanyName.name.is_not(None)
+            ),
+            select(literal("tag"), CompanyTagName.name).where(
+                CompanyTagName.tag_id.in_(tag_ids), CompanyTagName.name.is_not(None)
+            ),
+        )
+    )
+
+    tags = {FULL_TEXT_TAG_SEARCH_TAG} if tag_ids else set()
+    keyspaces = set()
+    for kind, name in rows:
+        if kind == "tag":
+            tags.add(tag_name_tag(name))
+            continue
 
-        new_company.tags.append(tag)
+        tags.add(company_name_tag(name))
+        if is_new_company:
+            keyspaces.update(search_keyspaces_for_name(name))
 
+    response_cache.invalidate(tags)
+    if keyspaces:
+        response_cache.bump_generations(keyspaces)
+
+
+def add_company(
+    *,
+    db_session: Session,
+    create_dto: CreateCompanyDTO,
+    language_code: LanguageCode = LanguageCode.ko,
+    name_index: CompanyNameIndex | None = None,
+    response_cache: ResponseCache | None = None,
+) -> CompanyDTO:
+    return add_companies(
+        db_session=db_session,
+        create_dtos=[create_dto],
+        language_code=language_code,
+        name_index=name_index,
+        response_cache=response_cache,
+    )[0]
+
+
+def add_companies(
+    *,
+    db_session: Session,
+    create_dtos: Sequence[CreateCompanyDTO],
+    language_code: LanguageCode = LanguageCode.ko,
+    name_index: CompanyNameIndex | None = None,
+    response_cache: ResponseCache | None = None,
+    tag_ids_cache: dict[tuple[str, str], int] | None = None,
+) -> list[CompanyDTO]:
+    """
+    여러 회사를 한 트랜잭션으로 추가하고 요청 순서대로 돌려준다.
+    회사 수와 상관없이 같은 수의 SQL 문으로 처리하며, 커밋은 한 번이다.
+
+    tag_ids_cache 를 넘기면 커밋한 뒤 (언어, 정규화한 태그명) -> 태그 id 를 기록해 두고,
+    다음 호출에서는 기록된 태그를 DB 에서 다시 조회하지 않는다. (대량 추가를 나눠서 호출할 때)
+    """
+    if not create_dtos:
+        return []
+
+    tag_id_lists, found_tag_ids = _resolve_tag_id_lists(
+        db_session=db_session,
+        tag_dto_lists=[create_dto.tags for create_dto in create_dtos],
+        language_codes=(LanguageCode.ko, LanguageCode.en, LanguageCode.tw),
+        known_tag_ids=tag_ids_cache,
+    )
+
+    company_ids = _insert_id_rows(
+        db_session=db_session, model=Company, count=len(create_dtos)
+    )
+    # 값이 없는 회사명도 NULL 로 넣어야 행마다 컬럼이 같아 한 번의 executemany 로 실행된다.
+    db_session.execute(
+        insert(CompanyName).execution_options(render_nulls=True),
+        [
+            {"company_id": company_id, "language_code": code, "name": name}
+            for company_id, create_dto in zip(company_ids, create_dtos)
+            for code, name in (
+                (LanguageCode.ko, create_dto.ko_name),
+                (LanguageCode.en, create_dto.en_name),
+                (LanguageCode.tw, create_dto.tw_name),
+            )
+        ],
+    )
+    sync_company_name_fts(db_session)
+    links = [
+        {"company_id": company_id, "company_tag_id": tag_id}
+        for company_id, tag_ids in zip(company_ids, tag_id_lists)
+        for tag_id in tag_ids
+    ]
+    if links:
+        db_session.execute(insert(association_company_and_company_tag), links)
+    refresh_company_documents(db_session, company_ids)
     db_session.commit()
 
-    return to_company_dto(new_company, language_code)
+    # 롤백된 태그 id 가 남지 않도록 커밋한 뒤에 기록한다.
+    if tag_ids_cache is not None:
+        tag_ids_cache.update(found_tag_ids)
+
+    if name_index is not None:
+        name_index.sync(db_session)
+
+    _invalidate_responses(
+        db_session=db_session,
+        response_cache=response_cache,
+        company_ids=company_ids,
+        tag_ids=list({tag_id for tag_ids in tag_id_lists for tag_id in tag_ids}),
+        is_new_company=True,
+    )
+
+    return to_company_dtos(
+        db_session=db_session, company_ids=company_ids, language_code=language_code
+    )
 
 
 def append_company_tags(
@@ -170,57 +870,56 @@ def append_company_tags(
     company_name: str,
     tags: list[TagDTO],
     language_code: LanguageCode = LanguageCode.ko,
-):
-    company = (
-        db_session.query(Company)
-        .join(Company.names)
-        .join(Company.tags)
-        .filter(CompanyName.name == company_name)
-        .first()
+    response_cache: ResponseCache | None = None,
+) -> CompanyDTO:
+    company_id = db_session.scalar(
+        select(CompanyName.company_id)
+        .join(
+            association_company_and_company_tag,
+            association_company_and_company_tag.c.company_id == CompanyName.company_id,
+        )
+        .where(CompanyName.name_key == normalize_name(company_name))
+        .order_by(CompanyName.id)
+        .limit(1)
     )
 
-    if not company:
+    if company_id is None:
         raise CompanyNotFound(f"{company_name} 회사가 존재하지 않습니다.")
 
-    for tag_dto in tags:
-        # 태그 존재 여부 확인
-        tag = (
-            db_session.query(CompanyTag)
-            .join(CompanyTag.names)
-            .filter(
-                and_(
-                    CompanyTagName.language_code == LanguageCode.ko,
-                    CompanyTagName.name == tag_dto.ko_name,
-                )
-                | and_(
-                    CompanyTagName.language_code == LanguageCode.en,
-                    CompanyTagName.name == tag_dto.en_name,
-                )
-                | and_(
-                    CompanyTagName.language_code == LanguageCode.ja,
-                    CompanyTagName.name == tag_dto.ja_name,
-                )
-            )
-            .first()
-        )
+    tag_ids = _resolve_tag_ids(
+        db_session=db_session,
+        tag_dtos=tags,
+        language_codes=(LanguageCode.ko, LanguageCode.en, LanguageCode.ja),
+    )
 
-        # 태그가 없으면 새로 추가
-        if not tag:
-            tag = CompanyTag()
-            tag.names.extend(
-                [
-                    CompanyTagName(language_code=LanguageCode.ko, name=tag_dto.ko_name),
-                    CompanyTagName(language_code=LanguageCode.ja, name=tag_dto.ja_name),
-                    CompanyTagName(language_code=LanguageCode.en, name=tag_dto.en_name),
-                ]
+    # 이미 연결된 태그는 다시 연결하지 않는다.
+    linked_tag_ids = set(
+        db_session.scalars(
+            select(association_company_and_company_tag.c.company_tag_id).where(
+                association_company_and_company_tag.c.company_id == company_id,
+                association_company_and_company_tag.c.company_tag_id.in_(tag_ids),
             )
-            db_session.add(tag)
-
-        company.tags.append(tag)
-
+        )
+    )
+    new_tag_ids = [tag_id for tag_id in tag_ids if tag_id not in linked_tag_ids]
+    _link_company_tags(
+        db_session=db_session, company_id=company_id, tag_ids=new_tag_ids
+    )
+    if new_tag_ids:
+        refresh_company_documents(db_session, [company_id])
     db_session.commit()
 
-    return to_company_dto(company, language_code)
+    if new_tag_ids:
+        _invalidate_responses(
+            db_session=db_session,
+            response_cache=response_cache,
+            company_ids=[company_id],
+            tag_ids=new_tag_ids,
+        )
+
+    return to_company_dto(
+        db_session=db_session, company_id=company_id, language_code=language_code
+    )
 
 
 def delete_company_tag(
@@ -229,12 +928,14 @@ def delete_company_tag(
     company_name: str,
     delete_tag_name: str,
     language_code: LanguageCode = LanguageCode.ko,
+    response_cache: ResponseCache | None = None,
 ) -> CompanyDTO:
     company = (
         db_session.query(Company)
         .join(CompanyName)
         .join(Company.tags)
-        .filter(CompanyName.name == company_name)
+        .filter(CompanyName.name_key == normalize_name(company_name))
+        .order_by(CompanyName.id)
         .first()
     )
 
@@ -244,7 +945,8 @@ def delete_company_tag(
     tag_to_remove = (
         db_session.query(CompanyTag)
         .join(CompanyTag.names)
-        .filter(CompanyTagName.name == delete_tag_name)
+        .filter(CompanyTagName.name_key == normalize_name(delete_tag_name))
+        .order_by(CompanyTagName.id)
         .first()
     )
 
@@ -256,6 +958,17 @@ def delete_company_tag(
     else:
         raise BusinessException("Tag not associated with this company")
 
+    # 커밋 후에는 ORM 객체가 만료되므로 id 를 미리 꺼내둔다.
+    company_id, tag_id = company.id, tag_to_remove.id
     db_session.commit()
 
-    return to_company_dto(company, language_code)
+    _invalidate_responses(
+        db_session=db_session,
+        response_cache=response_cache,
+        company_ids=[company_id],
+        tag_ids=[tag_id],
+    )
+
+    return to_company_dto(
+        db_session=db_session, company_id=company_id, language_code=language_code
+    )
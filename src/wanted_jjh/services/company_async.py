@@ -0,0 +1,134 @@
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Sequence
+from typing import TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import iterate_in_threadpool
+from starlette.concurrency import run_in_threadpool
+
+from wanted_jjh.dtos.company import CompanyDTO
+from wanted_jjh.dtos.company import CompanyExportDTO
+from wanted_jjh.dtos.company import CompanySearchResultDTO
+from wanted_jjh.enums import LanguageCode
+from wanted_jjh.services import company as company_services
+from wanted_jjh.services import company_export as company_export_services
+
+T = TypeVar("T")
+
+
+async def run_service(
+    service: Callable[..., T], /, *, db_session: Session | AsyncSession, **kwargs
+) -> T:
+    """
+    services.company 의 동기 서비스 함수를 비동기로 실행한다.
+
+    AsyncSession 이면 run_sync 로 이벤트 루프 위에서 비동기 드라이버로 실행하고,
+    동기 Session 이면 기존처럼 스레드풀에서 실행한다.
+    """
+    if isinstance(db_session, AsyncSession):
+        return await db_session.run_sync(
+            lambda session: service(db_session=session, **kwargs)
+        )
+
+    return await run_in_threadpool(service, db_session=db_session, **kwargs)
+
+
+async def search_companies_by_name(
+    *, db_session: Session | AsyncSession, **kwargs
+) -> CompanySearchResultDTO:
+    return await run_service(
+        company_services.search_companies_by_name, db_session=db_session, **kwargs
+    )
+
+
+async def search_company_by_tag(
+    *, db_session: Session | AsyncSession, **kwargs
+) -> list[CompanyDTO]:
+    return await run_service(
+        company_services.search_company_by_tag, db_session=db_session, **kwargs
+    )
+
+
+async def get_company_by_name(
+    *, db_session: Session | AsyncSession, **kwargs
+) -> CompanyDTO:
+    return await run_service(
+        company_services.get_company_by_name, db_session=db_session, **kwargs
+    )
+
+
+async def get_companies_by_names(
+    *, db_session: Session | AsyncSession, **kwargs
+) -> list[CompanyDTO | None]:
+    return await run_service(
+        company_services.get_companies_by_names, db_session=db_session, **kwargs
+    )
+
+
+async def add_company(*, db_session: Session | AsyncSession, **kwargs) -> CompanyDTO:
+    return await run_service(
+        company_services.add_company, db_session=db_session, **kwargs
+    )
+
+
+async def add_companies(
+    *, db_session: Session | AsyncSession, **kwargs
+) -> list[CompanyDTO]:
+    return await run_service(
+        company_services.add_companies, db_session=db_session, **kwargs
+    )
+
+
+async def append_company_tags(
+    *, db_session: Session | AsyncSession, **kwargs
+) -> CompanyDTO:
+    return await run_service(
+        company_services.append_company_tags, db_session=db_session, **kwargs
+    )
+
+
+async def delete_company_tag(
+    *, db_session: Session | AsyncSession, **kwargs
+) -> CompanyDTO:
+    return await run_service(
+        company_services.delete_company_tag, db_session=db_session, **kwargs
+    )
+
+
+async def iter_company_export_batches(
+    *,
+    db_session: Session | AsyncSession,
+    since_id: int = 0,
+    language_codes: Sequence[LanguageCode] = tuple(LanguageCode),
+    batch_size: int = company_export_services.DEFAULT_EXPORT_BATCH_SIZE,
+) -> AsyncIterator[list[CompanyExportDTO]]:
+    """
+    services.company_export.iter_company_export_batches 를 비동기로 순회한다.
+
+    AsyncSession 이면 stream 으로 서버 측 커서를 열어 이벤트 루프 위에서 읽고,
+    동기 Session 이면 배치마다 스레드풀에서 읽는다.
+    """
+    if isinstance(db_session, AsyncSession):
+        rows = await db_session.stream(
+            company_export_services.company_export_statement(
+                since_id=since_id, language_codes=language_codes
+            ).execution_options(yield_per=batch_size)
+        )
+        async for partition in rows.partitions():
+            yield [
+                company_export_services.to_company_export_dto(row, language_codes)
+                for row in partition
+            ]
+        return
+
+    async for company_export_dtos in iterate_in_threadpool(
+        company_export_services.iter_company_export_batches(
+            db_session=db_session,
+            since_id=since_id,
+            language_codes=language_codes,
+            batch_size=batch_size,
+        )
+    ):
+        yield company_export_dtos
@@ -0,0 +1,244 @@
+from collections.abc import Iterable
+from collections.abc import Iterator
+from itertools import chain
+from typing import NamedTuple
+
+from sqlalchemy import Connection
+from sqlalchemy import delete
+from sqlalchemy import event
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from wanted_jjh.db.expressions import translated_name
+from wanted_jjh.enums import LanguageCode
+from wanted_jjh.models.company import Company
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_document import CompanyDocument
+from wanted_jjh.models.company_tag import CompanyTag
+from wanted_jjh.models.company_tag import CompanyTagName
+from wanted_jjh.models.company_tag import association_company_and_company_tag
+
+# 한 번에 다시 계산할 회사 수
+DEFAULT_BATCH_SIZE = 1000
+
+
+class CompanyDocumentMismatch(NamedTuple):
+    company_id: int
+    language_code: str
+    # missing: 문서 없음, stale: 내용이 다름, orphan: 회사명이 없는 회사의 문서
+    reason: str
+
+
+def build_company_documents(
+    conn: Connection | Session, company_ids: Iterable[int]
+) -> dict[tuple[int, str], dict]:
+    """
+    회사명/태그 테이블로부터 회사들의 언어별 문서를 계산한다.
+    태그명은 응답마다 보여줄 순서(태그 id 순, 태그명 순)대로 저장해 두므로 읽을 때 정렬하지 않는다.
+    회사명이 하나도 없는 회사는 회사명으로 조회할 수 없으므로 문서를 만들지 않는다.
+    """
+    company_ids = list(company_ids)
+
+    name_rows = conn.execute(
+        select(
+            CompanyName.company_id,
+            *(
+                translated_name(CompanyName.name, CompanyName.language_code, code)
+                for code in LanguageCode
+            ),
+        )
+        .where(CompanyName.company_id.in_(company_ids))
+        .group_by(CompanyName.company_id)
+    )
+    documents = {
+        (company_id, code): {
+            "company_id": company_id,
+            "language_code": code,
+            "name": name,
+            "tag_names": [],
+            "tag_count": 0,
+        }
+        for company_id, *names in name_rows
+        for code, name in zip(LanguageCode, names)
+    }
+
+    tag_rows = conn.execute(
+        select(
+            association_company_and_company_tag.c.company_id,
+            *(
+                translated_name(CompanyTagName.name, CompanyTagName.language_code, code)
+                for code in LanguageCode
+            ),
+        )
+        .select_from(association_company_and_company_tag)
+        .outerjoin(
+            CompanyTagName,
+            CompanyTagName.tag_id
+            == association_company_and_company_tag.c.company_tag_id,
+        )
+        .where(association_company_and_company_tag.c.company_id.in_(company_ids))
+        .group_by(
+            association_company_and_company_tag.c.company_id,
+            association_company_and_company_tag.c.company_tag_id,
+        )
+        .order_by(
+            association_company_and_company_tag.c.company_id,
+            association_company_and_company_tag.c.company_tag_id,
+        )
+    )
+    for company_id, *tag_names in tag_rows:
+        for code, tag_name in zip(LanguageCode, tag_names):
+            document = documents.get((company_id, code))
+            if document is not None:
+                document["tag_names"].append(tag_name)
+                document["tag_count"] += 1
+
+    for document in documents.values():
+        document["sorted_tag_names"] = sorted(document["tag_names"])
+
+    return documents
+
+
+def refresh_company_documents(
+    conn: Connection | Session, company_ids: Iterable[int]
+) -> None:
+    """
+    회사들의 문서를 다시 계산해 교체한다. 쓰기와 같은 트랜잭션 안에서 호출한다.
+    """
+    company_ids = list(set(company_ids))
+    if not company_ids:
+        return
+
+    documents = build_company_documents(conn, company_ids)
+    # 가장 최근 문서를 교체할 때도 번호가 줄어들지 않도록 DELETE 전에 읽는다.
+    revision = (conn.scalar(select(func.max(CompanyDocument.revision))) or 0) + 1
+
+    conn.execute(
+        delete(CompanyDocument).where(CompanyDocument.company_id.in_(company_ids))
+    )
+    if documents:
+        conn.execute(
+            insert(CompanyDocument),
+            [{**document, "revision": revision} for document in documents.values()],
+        )
+
+
+def _iter_company_id_batches(
+    conn: Connection | Session, batch_size: int
+) -> Iterator[list[int]]:
+    last_company_id = 0
+    while company_ids := list(
+        conn.scalars(
+            select(Company.id)
+            .where(Company.id > last_company_id)
+            .order_by(Company.id)
+            .limit(batch_size)
+        )
+    ):
+        yield company_ids
+        last_company_id = company_ids[-1]
+
+
+def rebuild_company_documents(
+    conn: Connection, *, batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """
+    전체 회사의 문서를 batch_size 개씩 다시 만들고 배치마다 커밋한다.
+    다시 만든 회사 수를 돌려준다.
+    """
+    conn.execute(
+        delete(CompanyDocument).where(
+            CompanyDocument.company_id.not_in(select(Company.id))
+        )
+    )
+    conn.commit()
+
+    company_count = 0
+    for company_ids in _iter_company_id_batches(conn, batch_size):
+        refresh_company_documents(conn, company_ids)
+        conn.commit()
+        company_count += len(company_ids)
+
+    return company_count
+
+
+def check_company_documents(
+    conn: Connection | Session, *, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[CompanyDocumentMismatch]:
+    """
+    저장된 문서를 회사명/태그 테이블로부터 다시 계산한 문서와 비교해 다른 문서를 돌려준다.
+    """
+    for company_id, language_code in conn.execute(
+        select(CompanyDocument.company_id, CompanyDocument.language_code).where(
+            CompanyDocument.company_id.not_in(select(Company.id))
+        )
+    ):
+        yield CompanyDocumentMismatch(company_id, language_code, "orphan")
+
+    for company_ids in _iter_company_id_batches(conn, batch_size):
+        expected = build_company_documents(conn, company_ids)
+        stored = {
+            (row["company_id"], row["language_code"]): dict(row)
+            for row in conn.execute(
+                select(
+                    CompanyDocument.company_id,
+                    CompanyDocument.language_code,
+                    CompanyDocument.name,
+                    CompanyDocument.tag_names,
+                    CompanyDocument.sorted_tag_names,
+                    CompanyDocument.tag_count,
+                ).where(CompanyDocument.company_id.in_(company_ids))
+            ).mappings()
+        }
+
+        for key in sorted(expected.keys() | stored.keys()):
+            if key not in stored:
+                yield CompanyDocumentMismatch(*key, "missing")
+            elif key not in expected:
+                yield CompanyDocumentMismatch(*key, "orphan")
+            elif stored[key] != expected[key]:
+                yield CompanyDocumentMismatch(*key, "stale")
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_documents_after_flush(session: Session, flush_context) -> None:
+    # ORM 으로 회사/회사명/태그/태그명/회사-태그 연결을 바꾸면 같은 트랜잭션에서 문서를 갱신한다.
+    # (Core INSERT 로 쓰는 서비스와 대량 적재는 refresh_company_documents 를 직접 호출한다.)
+    company_ids = set()
+    tag_ids = set()
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, Company):
+            company_ids.add(instance.id)
+        elif isinstance(instance, CompanyName):
+            company_ids.add(instance.company_id)
+        elif isinstance(instance, CompanyTag):
+            if instance in session.deleted:
+                tag_ids.add(instance.id)
+            else:
+                # 태그 쪽에서 회사 연결을 바꾼 경우 바뀐 회사만 갱신한다.
+                history = inspect(instance).attrs.companies.history
+                company_ids.update(
+                    company.id for company in chain(history.added, history.deleted)
+                )
+        elif isinstance(instance, CompanyTagName):
+            tag_ids.add(instance.tag_id)
+
+    tag_ids.discard(None)
+    if not company_ids and not tag_ids:
+        return
+
+    conn = session.connection()
+    if tag_ids:
+        company_ids.update(
+            conn.scalars(
+                select(association_company_and_company_tag.c.company_id).where(
+                    association_company_and_company_tag.c.company_tag_id.in_(tag_ids)
+                )
+            )
+        )
+
+    company_ids.discard(None)
+    refresh_company_documents(conn, company_ids)
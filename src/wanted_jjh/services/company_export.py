@@ -0,0 +1,104 @@
+from collections.abc import Iterator
+from collections.abc import Sequence
+
+from sqlalchemy import JSON
+from sqlalchemy import Row
+from sqlalchemy import Select
+from sqlalchemy import case
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import type_coerce
+from sqlalchemy.orm import Session
+
+from wanted_jjh.dtos.company import CompanyExportDTO
+from wanted_jjh.enums import LanguageCode
+from wanted_jjh.models.company_document import CompanyDocument
+
+# 서버 측 커서에서 한 번에 가져올 회사 수
+DEFAULT_EXPORT_BATCH_SIZE = 1000
+
+
+def company_export_statement(
+    *, since_id: int = 0, language_codes: Sequence[LanguageCode] = tuple(LanguageCode)
+) -> Select:
+    """
+    company_id 가 since_id 보다 큰 회사를 company_id 순으로 한 행씩 읽는 쿼리.
+
+    회사 문서의 기본키(company_id, language_code) 순서대로 읽으면서 회사마다 언어별 문서를
+    한 행으로 모으므로, 정렬/그룹을 위한 임시 테이블 없이 읽은 만큼 바로 돌려준다.
+    회사명이 하나도 없는 회사는 문서가 없으므로 내보내지 않는다.
+    """
+    return (
+        select(
+            CompanyDocument.company_id,
+            *(
+                func.max(
+                    case((CompanyDocument.language_code == code, CompanyDocument.name))
+                )
+                for code in language_codes
+            ),
+            *(
+                type_coerce(
+                    func.max(
+                        case(
+                            (
+                                CompanyDocument.language_code == code,
+                                CompanyDocument.tag_names,
+                            )
+                        )
+                    ),
+                    JSON,
+                )
+                for code in language_codes
+            ),
+        )
+        .where(
+            CompanyDocument.company_id > since_id,
+            CompanyDocument.language_code.in_(language_codes),
+        )
+        .group_by(CompanyDocument.company_id)
+        .order_by(CompanyDocument.company_id)
+    )
+
+
+def to_company_export_dto(
+    row: Row, language_codes: Sequence[LanguageCode]
+) -> CompanyExportDTO:
+    company_id, *columns = row
+    names = columns[: len(language_codes)]
+    tag_name_lists = [tag_names or [] for tag_names in columns[len(language_codes) :]]
+
+    # 언어별 태그명 목록은 모두 태그 id 순서이고, 번역이 없는 태그는 빈 문자열이다.
+    return CompanyExportDTO(
+        company_id=company_id,
+        names={code: name for code, name in zip(language_codes, names) if name},
+        # 선택한 언어의 번역이 하나도 없는 태그는 제외한다.
+        tags=[
+            tag
+            for tag_names in zip(*tag_name_lists)
+            if (
+                tag := {
+                    code: name for code, name in zip(language_codes, tag_names) if name
+                }
+            )
+        ],
+    )
+
+
+def iter_company_export_batches(
+    *,
+    db_session: Session,
+    since_id: int = 0,
+    language_codes: Sequence[LanguageCode] = tuple(LanguageCode),
+    batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+) -> Iterator[list[CompanyExportDTO]]:
+    """
+    서버 측 커서(yield_per)로 batch_size 개씩 읽으므로, 회사 수와 상관없이 메모리 사용량이 일정하다.
+    """
+    rows = db_session.execute(
+        company_export_statement(
+            since_id=since_id, language_codes=language_codes
+        ).execution_options(yield_per=batch_size)
+    )
+    for partition in rows.partitions():
+        yield [to_company_export_dto(row, language_codes) for row in partition]
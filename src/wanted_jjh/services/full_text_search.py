@@ -0,0 +1,85 @@
+from sqlalchemy import ColumnElement
+from sqlalchemy import Connection
+from sqlalchemy import TableClause
+from sqlalchemy import event
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from wanted_jjh import settings
+from wanted_jjh.exceptions import BusinessException
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_tag import CompanyTagName
+from wanted_jjh.models.full_text import company_name_fts
+from wanted_jjh.models.full_text import company_tag_name_fts
+from wanted_jjh.normalization import normalize_name
+
+# trigram 토크나이저는 3글자 이상의 검색어만 MATCH 로 찾을 수 있다.
+MATCH_MIN_LENGTH = 3
+
+
+def is_full_text_search_enabled(conn: Connection | Session) -> bool:
+    # FTS5 는 SQLite 에서만 사용한다.
+    bind = conn.get_bind() if isinstance(conn, Session) else conn
+    return settings.FULL_TEXT_SEARCH and bind.dialect.name == "sqlite"
+
+
+def _sync(conn: Connection | Session, fts: TableClause, translation) -> None:
+    # 번역은 추가만 되고 수정/삭제되지 않으므로, 색인의 마지막 rowid 이후에 추가된 번역만 채운다.
+    last_rowid = (
+        select(fts.c.rowid).order_by(fts.c.rowid.desc()).limit(1).scalar_subquery()
+    )
+    conn.execute(
+        insert(fts).from_select(
+            ["rowid", "name"],
+            select(translation.id, func.normalize_name(translation.name)).where(
+                translation.id > func.coalesce(last_rowid, 0),
+                translation.name.is_not(None),
+                translation.name != "",
+            ),
+        )
+    )
+
+
+def sync_company_name_fts(conn: Connection | Session) -> None:
+    """회사명 전문 검색 색인에 새 회사명 번역을 추가한다. 쓰기와 같은 트랜잭션 안에서 호출한다."""
+    if is_full_text_search_enabled(conn):
+        _sync(conn, company_name_fts, CompanyName)
+
+
+def sync_company_tag_name_fts(conn: Connection | Session) -> None:
+    """태그명 전문 검색 색인에 새 태그명 번역을 추가한다. 쓰기와 같은 트랜잭션 안에서 호출한다."""
+    if is_full_text_search_enabled(conn):
+        _sync(conn, company_tag_name_fts, CompanyTagName)
+
+
+def full_text_condition(fts: TableClause, query: str) -> ColumnElement[bool]:
+    """
+    정규화한 이름에 정규화한 query 가 포함되는 행의 조건.
+    3글자 이상이면 trigram 색인으로 찾고(MATCH), 더 짧으면 색인의 이름을 순서대로 확인한다.
+    """
+    query = normalize_name(query)
+    if len(query) >= MATCH_MIN_LENGTH:
+        return fts.c.name.match(to_phrase(query))
+    return func.instr(fts.c.name, query) > 0
+
+
+def to_phrase(query: str) -> str:
+    # FTS5 문법의 연산자/특수 문자가 그대로 검색되도록 큰따옴표로 감싼다.
+    return '"' + query.replace('"', '""') + '"'
+
+
+def check_full_text_search_enabled(conn: Connection | Session) -> None:
+    if not is_full_text_search_enabled(conn):
+        raise BusinessException("전문 검색(mode=fts)을 사용할 수 없습니다.")
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_after_flush(session: Session, flush_context) -> None:
+    # ORM 으로 추가한 번역도 같은 트랜잭션에서 색인한다.
+    # (Core INSERT 로 쓰는 서비스와 대량 적재는 sync_* 를 직접 호출한다.)
+    if any(isinstance(instance, CompanyName) for instance in session.new):
+        sync_company_name_fts(session.connection())
+    if any(isinstance(instance, CompanyTagName) for instance in session.new):
+        sync_company_tag_name_fts(session.connection())
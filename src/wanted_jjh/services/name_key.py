@@ -0,0 +1,39 @@
+from sqlalchemy import Connection
+from sqlalchemy import bindparam
+from sqlalchemy import select
+from sqlalchemy import update
+
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_tag import CompanyTagName
+from wanted_jjh.normalization import normalize_name
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def backfill_name_keys(
+    conn: Connection, *, batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """
+    name_key 컬럼이 추가되기 전에 저장된 회사명/태그명 번역의 name_key 를
+    batch_size 개씩 채우고 배치마다 커밋한다. 채운 번역 수를 돌려준다.
+    """
+    row_count = 0
+    for translation in (CompanyName.__table__, CompanyTagName.__table__):
+        while rows := conn.execute(
+            select(translation.c.id, translation.c.name)
+            .where(translation.c.name_key.is_(None), translation.c.name.is_not(None))
+            .limit(batch_size)
+        ).all():
+            conn.execute(
+                update(translation)
+                .where(translation.c.id == bindparam("translation_id"))
+                .values(name_key=bindparam("key")),
+                [
+                    {"translation_id": translation_id, "key": normalize_name(name)}
+                    for translation_id, name in rows
+                ],
+            )
+            conn.commit()
+            row_count += len(rows)
+
+    return row_count
@@ -1,5 +1,10 @@
 import os
 
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
 BASE_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 PROJECT_NAME: str = "wanted_jjh"
@@ -9,3 +14,52 @@ DEBUG: bool = False
 SQLALCHEMY_DATABASE_URL: str = os.getenv(
     "DATABASE_URI", f"sqlite:///{BASE_DIR}/wanted_jjh.sqlite"
 )
+
+# SQLite 커넥션마다 적용할 PRAGMA 프로파일
+# - production: WAL, synchronous=NORMAL, mmap, cache, busy_timeout, temp_store=MEMORY
+# - default: SQLite 기본값 그대로 사용
+SQLITE_PROFILE: str = os.getenv("SQLITE_PROFILE", "production")
+SQLITE_MMAP_SIZE: int = _env_int("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)
+SQLITE_CACHE_SIZE_KIB: int = _env_int("SQLITE_CACHE_SIZE_KIB", 64 * 1024)
+SQLITE_BUSY_TIMEOUT_MS: int = _env_int("SQLITE_BUSY_TIMEOUT_MS", 5000)
+
+# 커넥션 풀 설정 (in-memory SQLite 에는 적용하지 않는다)
+DB_POOL_SIZE: int = _env_int("DB_POOL_SIZE", 16)
+DB_MAX_OVERFLOW: int = _env_int("DB_MAX_OVERFLOW", 16)
+DB_POOL_TIMEOUT_SECONDS: int = _env_int("DB_POOL_TIMEOUT_SECONDS", 10)
+DB_POOL_RECYCLE_SECONDS: int = _env_int("DB_POOL_RECYCLE_SECONDS", 3600)
+
+# true 이면 create_async_engine 기반의 AsyncSession 으로 요청을 처리한다.
+# (sqlite 는 aiosqlite, postgresql 은 asyncpg 드라이버를 사용)
+ASYNC_DB: bool = os.getenv("ASYNC_DB", "false").lower() == "true"
+
+# true 이면 목록 응답(/search, /tags, /companies:batchGet)을 Pydantic 검증 없이 DTO 에서 바로 인코딩한다.
+# (orjson 패키지가 설치되어 있으면 orjson 으로 인코딩)
+FAST_JSON_RESPONSE: bool = os.getenv("FAST_JSON_RESPONSE", "false").lower() == "true"
+
+# cli serve 의 워커 프로세스 수 (2 이상이면 gunicorn + UvicornWorker 로 실행)
+WEB_CONCURRENCY: int = _env_int("WEB_CONCURRENCY", 1)
+# 재시작(SIGHUP)/종료 시 워커가 처리 중인 요청을 마칠 때까지 기다리는 시간(초)
+GRACEFUL_TIMEOUT_SECONDS: int = _env_int("GRACEFUL_TIMEOUT_SECONDS", 30)
+
+# 요청별 SQL 문 수/DB 시간 측정 (Server-Timing 헤더, GET /metrics/db)
+DB_INSTRUMENTATION: bool = os.getenv("DB_INSTRUMENTATION", "true").lower() == "true"
+# 이 시간(ms) 이상 걸린 SQL 문은 라우트 이름과 함께 경고 로그로 남긴다.
+SLOW_QUERY_MS: float = float(os.getenv("SLOW_QUERY_MS", "100"))
+
+# 서버 시작 시 회사명 검색 색인을 DB 로부터 미리 구축할지 여부
+SEARCH_INDEX_WARMUP: bool = os.getenv("SEARCH_INDEX_WARMUP", "true").lower() == "true"
+
+# true 이면 회사명/태그명 번역을 SQLite FTS5(trigram) 전문 검색 테이블에도 색인한다.
+# (/search, /tags 의 mode=fts 검색에 사용하며, FTS5 를 지원하지 않는 SQLite 라면 끈다.)
+FULL_TEXT_SEARCH: bool = os.getenv("FULL_TEXT_SEARCH", "true").lower() == "true"
+
+# GET 응답 캐시
+# - local: 프로세스 메모리 LRU (항목 수/응답 크기 합계 한도, TTL)
+# - shared: Redis 호환 공유 저장소 (RESPONSE_CACHE_REDIS_URL 이 없으면 프로세스 메모리로 대체)
+# - none: 캐시하지 않음
+RESPONSE_CACHE_BACKEND: str = os.getenv("RESPONSE_CACHE_BACKEND", "local")
+RESPONSE_CACHE_TTL_SECONDS: int = _env_int("RESPONSE_CACHE_TTL_SECONDS", 60)
+RESPONSE_CACHE_MAX_ENTRIES: int = _env_int("RESPONSE_CACHE_MAX_ENTRIES", 10_000)
+RESPONSE_CACHE_MAX_BYTES: int = _env_int("RESPONSE_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+RESPONSE_CACHE_REDIS_URL: str | None = os.getenv("RESPONSE_CACHE_REDIS_URL")
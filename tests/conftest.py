@@ -1,24 +1,43 @@
 import os
+from collections.abc import Callable
+from contextlib import asynccontextmanager
 from typing import Generator
 
 import pytest
 from fastapi import FastAPI
+from sqlalchemy import Engine
 from sqlalchemy import create_engine
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
 from starlette.testclient import TestClient
 
+from wanted_jjh import settings
 from wanted_jjh.main import get_application
 
+from wanted_jjh.db.instrumentation import instrument_engine
+from wanted_jjh.db.migrations import upgrade
 from wanted_jjh.db.session import DBBase
+from wanted_jjh.db.session import create_db_engine
+from wanted_jjh.enums import LanguageCode
+from wanted_jjh.models.company import Company
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_tag import CompanyTag
+from wanted_jjh.models.company_tag import CompanyTagName
 from wanted_jjh.routers.utils.db import get_db
+from wanted_jjh.routers.utils.db import get_db_opener
 
 BASE_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 SQLALCHEMY_DATABASE_URL: str = os.getenv("TEST_DATABASE_URI", "sqlite://")
 
+# 검색 색인은 요청마다 테스트 DB 세션으로 동기화되므로, 운영 DB 로 미리 구축하지 않는다.
+settings.SEARCH_INDEX_WARMUP = False
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
+# 운영 엔진(create_db_engine)과 같이 요청별 SQL 문 수/DB 시간을 측정한다.
+instrument_engine(engine)
 
 Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -55,7 +74,83 @@ def api(app: FastAPI, db_session: Session) -> Generator[TestClient, None, None]:
         finally:
             pass
 
+    @asynccontextmanager
+    async def _open_test_db():
+        yield db_session
+
     app.dependency_overrides[get_db] = _get_test_db
+    app.dependency_overrides[get_db_opener] = lambda: _open_test_db
 
     with TestClient(app) as client:
         yield client
+
+
+@pytest.fixture
+def sql_statements(
+    db_session: Session,
+) -> Generator[list[tuple[str, tuple]], None, None]:
+    """테스트 DB 로 실행된 SQL 문과 파라미터를 순서대로 기록한다."""
+    statements = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, *args):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.fixture
+def make_companies(db_session: Session) -> Callable[..., None]:
+    """
+    회사_{i}/company_{i} 회사 company_count 개를 추가하고, 모든 회사에
+    태그_{i}/tag_{i} 태그 tag_count 개를 연결한다. (db_session 을 주면 그 세션에 추가한다.)
+    """
+
+    def _make_companies(
+        *, company_count: int, tag_count: int, db_session: Session = db_session
+    ) -> None:
+        tags = []
+        for i in range(tag_count):
+            tag = CompanyTag()
+            tag.names.extend(
+                [
+                    CompanyTagName(language_code=LanguageCode.ko, name=f"태그_{i}"),
+                    CompanyTagName(language_code=LanguageCode.en, name=f"tag_{i}"),
+                ]
+            )
+            tags.append(tag)
+
+        for i in range(company_count):
+            company = Company()
+            company.names.extend(
+                [
+                    CompanyName(language_code=LanguageCode.ko, name=f"회사_{i}"),
+                    CompanyName(language_code=LanguageCode.en, name=f"company_{i}"),
+                ]
+            )
+            company.tags.extend(tags)
+            db_session.add(company)
+
+        db_session.commit()
+
+    return _make_companies
+
+
+@pytest.fixture
+def warm_up_indexes(api: TestClient, db_session: Session) -> Callable[[], None]:
+    def _warm_up_indexes() -> None:
+        # 서버 시작 시(lifespan)처럼 인메모리 색인을 미리 구축해 둔다.
+        api.app.state.company_name_index.sync(db_session)
+        api.app.state.company_tag_index.sync(db_session)
+
+    return _warm_up_indexes
+
+
+@pytest.fixture
+def import_engine(tmp_path) -> Generator[Engine, None, None]:
+    """테스트마다 새로 만드는 파일 SQLite DB (대량 적재/재구축처럼 커밋하는 테스트용)"""
+    engine = create_db_engine(f"sqlite:///{tmp_path}/import.sqlite")
+    upgrade(engine)
+    yield engine
+    engine.dispose()
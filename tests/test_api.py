@@ -1,7 +1,12 @@
+import io
+import json
+
+import pytest
 from starlette.testclient import TestClient
 
 from wanted_jjh.db.session import Session
 from wanted_jjh.enums import LanguageCode
+from wanted_jjh.importers.company_csv import read_company_rows
 from wanted_jjh.models.company import Company
 from wanted_jjh.models.company import CompanyName
 from wanted_jjh.models.company_tag import CompanyTag
@@ -13,6 +18,7 @@ def test_company_name_autocomplete(api: TestClient, db_session: Session):
     1. 회사명 자동완성
     회사명의 일부만 들어가도 검색이 되어야 합니다.
     header의 x-wanted-language 언어값에 따라 해당 언어로 출력되어야 합니다.
+    완전 일치 > 접두어 일치 > 부분 일치 > 짧은 회사명 순으로 정렬됩니다.
     """
     # Arrange
     company1 = Company()
@@ -39,9 +45,54 @@ def test_company_name_autocomplete(api: TestClient, db_session: Session):
 
     assert resp.status_code == 200
     assert searched_companies == [
+        {"company_name": "스피링크"},
         {"company_name": "주식회사 링크드코리아"},
+    ]
+
+
+def test_company_name_autocomplete_pagination(api: TestClient, db_session: Session):
+    """
+    limit 개수만큼만 응답합니다.
+    다음 페이지가 있으면 x-next-cursor 헤더로 cursor 를 전달합니다.
+    """
+    # Arrange
+    for name in [
+        "링크드코리아",
+        "링크",
+        "스피링크",
+        "링크플로우",
+        "주식회사 링크드코리아",
+    ]:
+        company = Company()
+        company.names.append(CompanyName(language_code="ko", name=name))
+        db_session.add(company)
+    db_session.commit()
+
+    # Act
+    first_resp = api.get(
+        "/search?query=링크&limit=3", headers=[("x-wanted-language", "ko")]
+    )
+    second_resp = api.get(
+        f"/search?query=링크&limit=3&cursor={first_resp.headers['x-next-cursor']}",
+        headers=[("x-wanted-language", "ko")],
+    )
+
+    # Assert
+    assert first_resp.json() == [
+        {"company_name": "링크"},
+        {"company_name": "링크플로우"},
+        {"company_name": "링크드코리아"},
+    ]
+    assert second_resp.json() == [
         {"company_name": "스피링크"},
+        {"company_name": "주식회사 링크드코리아"},
     ]
+    assert "x-next-cursor" not in second_resp.headers
+
+    # 잘못된 cursor 는 400을 리턴합니다.
+    resp = api.get("/search?query=링크&cursor=invalid")
+
+    assert resp.status_code == 400
 
 
 def test_company_search(api: TestClient, db_session: Session):
@@ -106,6 +157,64 @@ def test_company_search(api: TestClient, db_session: Session):
     assert resp.status_code == 404
 
 
+def test_batch_get_companies(api: TestClient, db_session: Session):
+    """
+    회사명 목록으로 여러 회사를 한 번에 조회합니다.
+    요청 순서대로 응답하고, 없는 회사는 found 가 false 입니다.
+    """
+    # Arrange
+    tag = CompanyTag()
+    tag.names.extend(
+        [
+            CompanyTagName(language_code="ko", name="태그_1"),
+            CompanyTagName(language_code="en", name="tag_1"),
+        ]
+    )
+    for ko_name, en_name in [("원티드랩", "Wantedlab"), ("라인 프레쉬", "LINE FRESH")]:
+        company = Company()
+        company.names.extend(
+            [
+                CompanyName(language_code="ko", name=ko_name),
+                CompanyName(language_code="en", name=en_name),
+            ]
+        )
+        company.tags.append(tag)
+        db_session.add(company)
+    db_session.commit()
+
+    # Act
+    resp = api.post(
+        "/companies:batchGet",
+        json={"company_names": ["LINE FRESH", "없는회사", "원티드랩", "LINE FRESH"]},
+        headers=[("x-wanted-language", "en")],
+    )
+
+    # Assert
+    line_fresh = {
+        "company_name": "LINE FRESH",
+        "found": True,
+        "company": {"company_name": "LINE FRESH", "tags": ["tag_1"]},
+    }
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "results": [
+            line_fresh,
+            {"company_name": "없는회사", "found": False, "company": None},
+            {
+                "company_name": "원티드랩",
+                "found": True,
+                "company": {"company_name": "Wantedlab", "tags": ["tag_1"]},
+            },
+            line_fresh,
+        ]
+    }
+
+    # 빈 목록은 422를 리턴합니다.
+    resp = api.post("/companies:batchGet", json={"company_names": []})
+
+    assert resp.status_code == 422
+
+
 def test_new_company(api: TestClient):
     """
     3.  새로운 회사 추가
@@ -158,6 +267,208 @@ def test_new_company(api: TestClient):
     }
 
 
+def test_new_company_reuses_and_deduplicates_tags(api: TestClient, db_session: Session):
+    """
+    어느 한 언어의 태그명이라도 일치하면 기존 태그를 연결하고,
+    같은 요청 안에서 중복된 새 태그는 하나만 추가합니다. 비어있는(None) 번역명은 저장하지 않습니다.
+    """
+    tag = CompanyTag()
+    tag.names.extend(
+        [
+            CompanyTagName(language_code=LanguageCode.ko, name="태그_1"),
+            CompanyTagName(language_code=LanguageCode.en, name="tag_1"),
+        ]
+    )
+    db_session.add(tag)
+    db_session.commit()
+
+    resp = api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "라인 프레쉬", "en": "LINE FRESH"},
+            "tags": [
+                {"tag_name": {"ko": "다른 이름", "en": "tag_1"}},
+                {"tag_name": {"ko": "태그_2", "en": "tag_2"}},
+                {"tag_name": {"ko": "태그_2"}},
+            ],
+        },
+        headers=[("x-wanted-language", "ko")],
+    )
+
+    assert resp.json() == {"company_name": "라인 프레쉬", "tags": ["태그_1", "태그_2"]}
+    assert db_session.query(CompanyTag).count() == 2
+    assert db_session.query(CompanyTagName).filter_by(name=None).count() == 0
+
+
+def to_ndjson(items: list) -> bytes:
+    return "".join(json.dumps(item) + "\n" for item in items).encode()
+
+
+def to_json_array(items: list) -> bytes:
+    return json.dumps(items).encode()
+
+
+@pytest.mark.parametrize("to_body", [to_ndjson, to_json_array])
+def test_batch_create_companies(api: TestClient, db_session: Session, to_body):
+    """
+    NDJSON 또는 JSON 배열로 여러 회사를 chunk_size 개씩 추가하고, 항목마다 결과를 NDJSON 으로 돌려줍니다.
+    새 태그는 청크가 달라도 요청 전체에서 한 번만 추가합니다.
+    """
+    # Arrange
+    tag = CompanyTag()
+    tag.names.extend(
+        [
+            CompanyTagName(language_code=LanguageCode.ko, name="태그_1"),
+            CompanyTagName(language_code=LanguageCode.en, name="tag_1"),
+        ]
+    )
+    db_session.add(tag)
+    db_session.commit()
+
+    items = [
+        {
+            "company_name": {"ko": "라인 프레쉬", "en": "LINE FRESH"},
+            "tags": [
+                {"tag_name": {"ko": "태그_1", "en": "tag_1"}},
+                {"tag_name": {"ko": "태그_2", "en": "tag_2"}},
+            ],
+        },
+        {"company_name": "회사명만 있는 항목"},
+        {
+            "company_name": {"ko": "원티드랩", "en": "Wantedlab"},
+            "tags": [{"tag_name": {"en": "tag_2"}}],
+        },
+        {
+            "company_name": {"ko": "코드포스트", "en": "code post"},
+            "tags": [{"tag_name": {"ko": "태그_2"}}, {"tag_name": {"en": "tag_1"}}],
+        },
+    ]
+
+    # Act
+    resp = api.post(
+        "/companies:batchCreate",
+        params={"chunk_size": 2},
+        content=to_body(items),
+        headers=[("x-wanted-language", "en")],
+    )
+
+    # Assert
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    results = [json.loads(line) for line in resp.text.splitlines()]
+    assert [result["index"] for result in results] == [0, 1, 2, 3]
+    assert [result["status"] for result in results] == [
+        "created",
+        "invalid",
+        "created",
+        "created",
+    ]
+    assert results[0]["company"] == {
+        "company_name": "LINE FRESH",
+        "tags": ["tag_1", "tag_2"],
+    }
+    assert results[1]["detail"][0]["loc"] == ["company_name"]
+    assert results[2]["company"] == {"company_name": "Wantedlab", "tags": ["tag_2"]}
+    assert results[3]["company"] == {
+        "company_name": "code post",
+        "tags": ["tag_1", "tag_2"],
+    }
+    assert db_session.query(CompanyTag).count() == 2
+
+    resp = api.get("/companies/코드포스트", headers=[("x-wanted-language", "ko")])
+    assert resp.json() == {"company_name": "코드포스트", "tags": ["태그_1", "태그_2"]}
+
+
+def test_batch_create_companies_reports_malformed_items(api: TestClient):
+    """
+    NDJSON 은 읽지 못한 줄만 invalid 로 돌려주고 다음 줄부터 계속 추가합니다.
+    JSON 배열은 문법 오류 이후의 원소를 구분할 수 없으므로 거기서 멈춥니다.
+    """
+    item = {"company_name": {"ko": "라인 프레쉬"}, "tags": []}
+
+    resp = api.post(
+        "/companies:batchCreate",
+        content=b"\n".join([b"{not json", json.dumps(item).encode(), b""]),
+    )
+    assert [json.loads(line)["status"] for line in resp.text.splitlines()] == [
+        "invalid",
+        "created",
+    ]
+
+    resp = api.post(
+        "/companies:batchCreate",
+        content=f"[{json.dumps(item)}, {{not json}}, {json.dumps(item)}]".encode(),
+    )
+    assert [json.loads(line)["status"] for line in resp.text.splitlines()] == [
+        "created",
+        "invalid",
+    ]
+
+
+def test_export_companies(api: TestClient, db_session: Session):
+    """
+    전체 회사를 company_id 순으로 NDJSON / CSV 로 내보냅니다.
+    since_id 이후의 회사만, 또는 선택한 언어만 내보낼 수 있습니다.
+    """
+    # Arrange
+    tags = [
+        CompanyTag(
+            names=[
+                CompanyTagName(language_code="ko", name="태그_1"),
+                CompanyTagName(language_code="en", name="tag_1"),
+            ]
+        ),
+        CompanyTag(names=[CompanyTagName(language_code="ja", name="タグ_2")]),
+    ]
+    companies = [
+        Company(
+            names=[
+                CompanyName(language_code="ko", name="원티드랩"),
+                CompanyName(language_code="en", name="Wantedlab"),
+            ],
+            tags=tags,
+        ),
+        Company(names=[CompanyName(language_code="en", name="LINE FRESH")]),
+    ]
+    db_session.add_all(companies)
+    db_session.commit()
+    wanted_id, line_fresh_id = companies[0].id, companies[1].id
+
+    # Act
+    resp = api.get("/companies/export")
+
+    # Assert
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in resp.text.splitlines()] == [
+        {
+            "company_id": wanted_id,
+            "company_name": {"ko": "원티드랩", "en": "Wantedlab"},
+            "tags": [
+                {"tag_name": {"ko": "태그_1", "en": "tag_1"}},
+                {"tag_name": {"ja": "タグ_2"}},
+            ],
+        },
+        {"company_id": line_fresh_id, "company_name": {"en": "LINE FRESH"}, "tags": []},
+    ]
+
+    resp = api.get("/companies/export", params={"since_id": wanted_id})
+    assert [json.loads(line)["company_id"] for line in resp.text.splitlines()] == [
+        line_fresh_id
+    ]
+
+    # CSV 는 import-companies 의 CSV 형식과 같습니다.
+    resp = api.get(
+        "/companies/export", params={"format": "csv", "language": ["en", "ko"]}
+    )
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert [
+        (row.names, row.tags) for row in read_company_rows(io.StringIO(resp.text))
+    ] == [
+        ({"en": "Wantedlab", "ko": "원티드랩"}, [{"en": "tag_1", "ko": "태그_1"}]),
+        ({"en": "LINE FRESH", "ko": ""}, []),
+    ]
+
+
 def test_search_tag_name(api: TestClient, db_session: Session):
     """
     4.  태그명으로 회사 검색
@@ -0,0 +1,94 @@
+import json
+from collections.abc import AsyncGenerator
+from collections.abc import Generator
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from starlette.testclient import TestClient
+
+from wanted_jjh.db.session import DBBase
+from wanted_jjh.db.session import to_async_database_url
+from wanted_jjh.routers.utils.db import get_db
+from wanted_jjh.routers.utils.db import get_db_opener
+
+
+@pytest.fixture
+def async_api(app: FastAPI, tmp_path) -> Generator[TestClient, None, None]:
+    database_url = f"sqlite:///{tmp_path}/async.sqlite"
+    DBBase.metadata.create_all(create_engine(database_url))
+
+    async_engine = create_async_engine(
+        to_async_database_url(database_url), poolclass=NullPool
+    )
+    AsyncSessionLocal = async_sessionmaker(autoflush=False, bind=async_engine)
+
+    async def _get_test_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncSessionLocal() as db_session:
+            yield db_session
+
+    app.dependency_overrides[get_db] = _get_test_async_db
+    app.dependency_overrides[get_db_opener] = lambda: AsyncSessionLocal
+
+    with TestClient(app) as client:
+        yield client
+
+
+def test_to_async_database_url():
+    assert to_async_database_url("sqlite:///a.sqlite") == "sqlite+aiosqlite:///a.sqlite"
+    assert (
+        to_async_database_url("postgresql://user:pw@db:5432/wanted")
+        == "postgresql+asyncpg://user:pw@db:5432/wanted"
+    )
+
+
+def test_async_session_endpoints(async_api: TestClient):
+    """
+    AsyncSession 으로도 회사 추가/검색/태그 검색/태그 삭제가 동일하게 동작해야 합니다.
+    """
+    resp = async_api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "원티드랩", "en": "Wantedlab", "tw": "Wantedlab"},
+            "tags": [
+                {"tag_name": {"ko": "태그_1", "en": "tag_1", "tw": "tag_1"}},
+                {"tag_name": {"ko": "태그_2", "en": "tag_2", "tw": "tag_2"}},
+            ],
+        },
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert resp.json() == {"company_name": "원티드랩", "tags": ["태그_1", "태그_2"]}
+
+    resp = async_api.get("/search?query=wanted", headers=[("x-wanted-language", "ko")])
+    assert resp.json() == [{"company_name": "원티드랩"}]
+
+    resp = async_api.get("/tags?query=tag_2", headers=[("x-wanted-language", "en")])
+    assert resp.json() == [{"company_name": "Wantedlab"}]
+
+    resp = async_api.delete(
+        "/companies/Wantedlab/tags/tag_1", headers=[("x-wanted-language", "en")]
+    )
+    assert resp.json() == {"company_name": "Wantedlab", "tags": ["tag_2"]}
+
+    resp = async_api.get("/companies/없는회사")
+    assert resp.status_code == 404
+
+    resp = async_api.post(
+        "/companies:batchCreate",
+        content='{"company_name": {"en": "LINE FRESH"}, "tags": []}\n',
+    )
+    assert json.loads(resp.text)["status"] == "created"
+
+    resp = async_api.get("/companies/export", params={"language": "en"})
+    assert [json.loads(line) for line in resp.text.splitlines()] == [
+        {
+            "company_id": 1,
+            "company_name": {"en": "Wantedlab"},
+            "tags": [{"tag_name": {"en": "tag_2"}}],
+        },
+        {"company_id": 2, "company_name": {"en": "LINE FRESH"}, "tags": []},
+    ]
@@ -0,0 +1,146 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_mock_engine
+from sqlalchemy import func
+from sqlalchemy import select
+
+from tests.conftest import BASE_DIR
+from wanted_jjh.db.migrations import upgrade
+from wanted_jjh.db.session import create_db_engine
+from wanted_jjh.importers.company_csv import CompanyCsvImporter
+from wanted_jjh.models.company import Company
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_tag import CompanyTag
+from wanted_jjh.models.company_tag import CompanyTagName
+from wanted_jjh.models.company_tag import association_company_and_company_tag
+
+SAMPLE_CSV_PATH = Path(BASE_DIR) / "data" / "company_tag_sample.csv"
+
+
+def count_rows(engine) -> dict[str, int]:
+    with engine.connect() as conn:
+        return {
+            table.name: conn.scalar(select(func.count()).select_from(table))
+            for table in [
+                Company.__table__,
+                CompanyName.__table__,
+                CompanyTag.__table__,
+                CompanyTagName.__table__,
+                association_company_and_company_tag,
+            ]
+        }
+
+
+def test_import_companies(import_engine, tmp_path):
+    """
+    CSV 의 회사를 모두 적재하고, 같은 태그명은 하나의 태그로 연결합니다.
+    """
+    csv_path = tmp_path / "companies.csv"
+    csv_path.write_text(
+        "company_ko,company_en,company_ja,tag_ko,tag_en,tag_ja\n"
+        "원티드랩,Wantedlab,,태그_1|태그_2,tag_1|tag_2,タグ_1|タグ_2\n"
+        ",LINE FRESH,,태그_2|태그_3|태그_2,tag_2|tag_3|tag_2,\n"
+        "빈 태그,,,,,\n",
+        encoding="utf-8",
+    )
+
+    result = CompanyCsvImporter(import_engine, chunk_size=2).run(csv_path)
+
+    assert (result.rows, result.skipped_rows) == (3, 0)
+    with import_engine.connect() as conn:
+        tag_names = conn.execute(
+            select(CompanyName.name, CompanyTagName.name)
+            .join(
+                association_company_and_company_tag,
+                association_company_and_company_tag.c.company_id
+                == CompanyName.company_id,
+            )
+            .join(
+                CompanyTagName,
+                CompanyTagName.tag_id
+                == association_company_and_company_tag.c.company_tag_id,
+            )
+            .where(
+                CompanyName.language_code == "en", CompanyTagName.language_code == "ko"
+            )
+            .order_by(CompanyName.company_id, CompanyTagName.tag_id)
+        ).all()
+
+    assert [tuple(row) for row in tag_names] == [
+        ("Wantedlab", "태그_1"),
+        ("Wantedlab", "태그_2"),
+        ("LINE FRESH", "태그_2"),
+        ("LINE FRESH", "태그_3"),
+    ]
+    # 비어있는 번역명은 저장하지 않는다. (태그_3 에는 일본어 태그명이 없다.)
+    assert count_rows(import_engine)["company_tag_name_translations"] == 8
+
+
+def test_import_companies_resumes_from_checkpoint(import_engine, tmp_path, monkeypatch):
+    """
+    적재가 중간에 실패해도 다시 실행하면 커밋된 행 이후부터 이어서 적재합니다.
+    """
+    checkpoint_path = tmp_path / "import.checkpoint.json"
+    write_chunk = CompanyCsvImporter._write_chunk
+    written_chunks = []
+
+    def fail_on_third_chunk(self, conn, chunk):
+        if len(written_chunks) == 2:
+            raise RuntimeError("중단")
+        write_chunk(self, conn, chunk)
+        written_chunks.append(chunk)
+
+    monkeypatch.setattr(CompanyCsvImporter, "_write_chunk", fail_on_third_chunk)
+    with pytest.raises(RuntimeError):
+        CompanyCsvImporter(import_engine, chunk_size=30).run(
+            SAMPLE_CSV_PATH, checkpoint_path=checkpoint_path
+        )
+    monkeypatch.undo()
+
+    assert count_rows(import_engine)["companies"] == 60
+
+    result = CompanyCsvImporter(import_engine, chunk_size=30).run(
+        SAMPLE_CSV_PATH, checkpoint_path=checkpoint_path
+    )
+    assert (result.rows, result.skipped_rows) == (40, 60)
+
+    # 한 번에 적재한 결과와 같아야 한다.
+    expected_engine = create_db_engine(f"sqlite:///{tmp_path}/expected.sqlite")
+    upgrade(expected_engine)
+    CompanyCsvImporter(expected_engine).run(SAMPLE_CSV_PATH)
+    assert count_rows(import_engine) == count_rows(expected_engine)
+    expected_engine.dispose()
+
+    # 모두 적재한 뒤 다시 실행하면 아무것도 적재하지 않는다.
+    result = CompanyCsvImporter(import_engine).run(
+        SAMPLE_CSV_PATH, checkpoint_path=checkpoint_path
+    )
+    assert (result.rows, result.skipped_rows) == (0, 100)
+
+
+def test_import_advances_postgresql_id_sequences(import_engine):
+    """
+    PostgreSQL 에서는 직접 부여한 회사/태그 id 이후로 serial 시퀀스를 옮깁니다.
+    """
+    statements = []
+    conn = create_mock_engine(
+        "postgresql://", lambda statement, *args, **kwargs: statements.append(statement)
+    )
+    importer = CompanyCsvImporter(import_engine)
+    importer._next_company_id = 11
+    importer._next_tag_id = 1
+    importer._advance_id_sequences(conn)
+
+    compiled = [statement.compile(conn) for statement in statements]
+    assert [
+        (str(statement), list(statement.params.values())) for statement in compiled
+    ] == [
+        (
+            (
+                "SELECT setval(pg_get_serial_sequence(%(pg_get_serial_sequence_1)s, "
+                "%(pg_get_serial_sequence_2)s), %(setval_2)s) AS setval_1"
+            ),
+            ["companies", "id", 10],
+        )
+    ]
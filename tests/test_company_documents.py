@@ -0,0 +1,207 @@
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from tests.test_company_csv_importer import SAMPLE_CSV_PATH
+from tests.test_migrations import LEGACY_SCHEMA
+from wanted_jjh.db.migrations import upgrade
+from wanted_jjh.db.session import create_db_engine
+from wanted_jjh.importers.company_csv import CompanyCsvImporter
+from wanted_jjh.models.company import Company
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_document import CompanyDocument
+from wanted_jjh.models.company_tag import CompanyTag
+from wanted_jjh.models.company_tag import CompanyTagName
+from wanted_jjh.services.company_document import CompanyDocumentMismatch
+from wanted_jjh.services.company_document import check_company_documents
+from wanted_jjh.services.company_document import rebuild_company_documents
+from wanted_jjh.services.company_export import iter_company_export_batches
+
+
+def test_api_writes_keep_documents_in_sync(api, db_session):
+    """
+    회사 추가/태그 추가/태그 삭제 API 가 같은 트랜잭션에서 회사 문서를 갱신합니다.
+    """
+    api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "라인 프레쉬", "en": "LINE FRESH"},
+            "tags": [
+                {"tag_name": {"ko": "태그_1", "en": "tag_1"}},
+                {"tag_name": {"ko": "태그_2", "en": "tag_2"}},
+            ],
+        },
+        headers={"x-wanted-language": "ko"},
+    )
+    api.put(
+        "/companies/라인 프레쉬/tags",
+        json=[{"tag_name": {"ko": "태그_3", "ja": "タグ_3"}}],
+        headers={"x-wanted-language": "ko"},
+    )
+    api.delete(
+        "/companies/라인 프레쉬/tags/태그_1", headers={"x-wanted-language": "ko"}
+    )
+
+    documents = {
+        document.language_code: document
+        for document in db_session.scalars(select(CompanyDocument))
+    }
+    assert (documents["ko"].name, documents["ko"].tag_names) == (
+        "라인 프레쉬",
+        ["태그_2", "태그_3"],
+    )
+    assert (documents["en"].name, documents["en"].tag_names) == (
+        "LINE FRESH",
+        ["tag_2", ""],
+    )
+    # 회사 추가/태그 변경 응답에 쓰는 태그명 순서도 함께 저장한다.
+    assert documents["ja"].sorted_tag_names == ["", "タグ_3"]
+    assert documents["ja"].tag_count == 2
+    assert list(check_company_documents(db_session)) == []
+
+
+def test_orm_writes_keep_documents_in_sync(db_session):
+    """
+    서비스를 거치지 않은 ORM 쓰기도 flush 시점에 회사 문서를 갱신합니다.
+    """
+    tag = CompanyTag(names=[CompanyTagName(language_code="ko", name="태그_1")])
+    company = Company(
+        names=[CompanyName(language_code="ko", name="원티드랩")], tags=[tag]
+    )
+    db_session.add(company)
+    db_session.flush()
+    assert list(check_company_documents(db_session)) == []
+
+    tag.names[0].name = "태그_2"
+    db_session.add(
+        CompanyName(company_id=company.id, language_code="en", name="wanted")
+    )
+    db_session.flush()
+    assert list(check_company_documents(db_session)) == []
+    document = db_session.get(CompanyDocument, (company.id, "en"))
+    assert (document.name, document.tag_names) == ("wanted", [""])
+
+    company.tags.remove(tag)
+    db_session.flush()
+    assert list(check_company_documents(db_session)) == []
+    assert db_session.get(CompanyDocument, (company.id, "ko")).tag_count == 0
+
+
+def test_check_and_rebuild_documents(import_engine):
+    """
+    검사기는 누락/불일치/고아 문서를 찾아내고, 재구축하면 모두 복구됩니다.
+    """
+    CompanyCsvImporter(import_engine, chunk_size=40, report=lambda _: None).run(
+        SAMPLE_CSV_PATH
+    )
+    with import_engine.connect() as conn:
+        assert list(check_company_documents(conn, batch_size=30)) == []
+
+    with import_engine.begin() as conn:
+        conn.execute(
+            text(
+                "UPDATE company_documents SET tag_names = '[]', tag_count = 0 "
+                "WHERE company_id = 1 AND language_code = 'ko'"
+            )
+        )
+        conn.execute(text("DELETE FROM company_documents WHERE company_id = 2"))
+        conn.execute(
+            text(
+                "INSERT INTO company_documents "
+                "(company_id, language_code, name, tag_names, tag_count) "
+                "VALUES (100000, 'ko', '없는 회사', '[]', 0)"
+            )
+        )
+
+    with import_engine.connect() as conn:
+        mismatches = list(check_company_documents(conn, batch_size=30))
+    assert mismatches == [
+        CompanyDocumentMismatch(100000, "ko", "orphan"),
+        CompanyDocumentMismatch(1, "ko", "stale"),
+        *(
+            CompanyDocumentMismatch(2, code, "missing")
+            for code in ["en", "ja", "ko", "tw"]
+        ),
+    ]
+
+    with import_engine.connect() as conn:
+        company_count = rebuild_company_documents(conn, batch_size=30)
+        assert company_count == conn.scalar(text("SELECT count(*) FROM companies"))
+        assert list(check_company_documents(conn, batch_size=30)) == []
+
+
+def test_upgrade_builds_documents_for_existing_database(tmp_path):
+    """
+    회사 문서 테이블이 없는 기존 DB 에 upgrade 를 실행하면 문서를 만들어 둡니다.
+    """
+    engine = create_db_engine(f"sqlite:///{tmp_path}/legacy.sqlite")
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(text("INSERT INTO companies (id) VALUES (1)"))
+        conn.execute(
+            text(
+                "INSERT INTO company_name_translations (company_id, language_code, name) "
+                "VALUES (1, 'ko', '원티드랩')"
+            )
+        )
+
+    upgrade(engine)
+
+    with Session(engine) as session:
+        document = session.get(CompanyDocument, (1, "ko"))
+        assert (document.name, document.tag_names) == ("원티드랩", [])
+        assert list(check_company_documents(session)) == []
+    engine.dispose()
+
+
+def test_upgrade_rebuilds_documents_without_sorted_tag_names(tmp_path):
+    """
+    정렬된 태그명 컬럼이 없는 회사 문서 테이블에 upgrade 를 실행하면 문서를 다시 만듭니다.
+    """
+    engine = create_db_engine(f"sqlite:///{tmp_path}/documents.sqlite")
+    upgrade(engine)
+    with Session(engine) as session:
+        session.add(
+            Company(
+                names=[CompanyName(language_code="ko", name="원티드랩")],
+                tags=[
+                    CompanyTag(names=[CompanyTagName(language_code="ko", name=name)])
+                    for name in ["태그_4", "태그_20", "태그_16"]
+                ],
+            )
+        )
+        session.commit()
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE company_documents DROP COLUMN sorted_tag_names"))
+
+    upgrade(engine)
+
+    with Session(engine) as session:
+        document = session.get(CompanyDocument, (1, "ko"))
+        assert document.tag_names == ["태그_4", "태그_20", "태그_16"]
+        assert document.sorted_tag_names == ["태그_16", "태그_20", "태그_4"]
+        assert list(check_company_documents(session)) == []
+    engine.dispose()
+
+
+def test_export_reads_documents_in_batches(db_session):
+    """
+    내보내기는 서버 측 커서로 batch_size 개씩 company_id 순으로 읽습니다.
+    """
+    db_session.add_all(
+        Company(names=[CompanyName(language_code="ko", name=f"회사_{i}")])
+        for i in range(5)
+    )
+    db_session.commit()
+
+    batches = list(
+        iter_company_export_batches(
+            db_session=db_session, language_codes=["ko"], batch_size=2
+        )
+    )
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [dto.names for batch in batches for dto in batch] == [
+        {"ko": f"회사_{i}"} for i in range(5)
+    ]
@@ -0,0 +1,180 @@
+import csv
+import os
+
+import pytest
+
+from wanted_jjh.db.session import Session
+from wanted_jjh.enums import LanguageCode
+from wanted_jjh.indexes.company_name import CompanyNameIndex
+from wanted_jjh.models.company import Company
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.services import company as company_services
+
+SAMPLE_CSV_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data",
+    "company_tag_sample.csv",
+)
+
+
+@pytest.fixture
+def sample_companies(db_session: Session) -> None:
+    with open(SAMPLE_CSV_PATH, "r") as f:
+        for row in csv.DictReader(f):
+            company = Company()
+            company.names.extend(
+                [
+                    CompanyName(language_code=LanguageCode.ko, name=row["company_ko"]),
+                    CompanyName(language_code=LanguageCode.en, name=row["company_en"]),
+                    CompanyName(language_code=LanguageCode.ja, name=row["company_ja"]),
+                ]
+            )
+            db_session.add(company)
+    db_session.commit()
+
+
+@pytest.mark.parametrize(
+    "query", ["", "a", "주", "co", "랩", "원티드", "Post", "LAB", "inc.", "없는회사명"]
+)
+def test_index_matches_like_search(
+    db_session: Session, sample_companies: None, query: str
+):
+    """
+    색인 검색 결과는 순서까지 LIKE 검색 결과와 같아야 합니다.
+    """
+    name_index = CompanyNameIndex()
+
+    for language_code in [LanguageCode.ko, LanguageCode.en]:
+        like_result = company_services.search_companies_by_name(
+            db_session=db_session, name=query, language_code=language_code
+        )
+        index_result = company_services.search_companies_by_name(
+            db_session=db_session,
+            name=query,
+            language_code=language_code,
+            name_index=name_index,
+        )
+
+        assert index_result == like_result
+
+
+@pytest.mark.parametrize("query", ["", "a", "an", "lab", "ting"])
+def test_index_pagination(db_session: Session, sample_companies: None, query: str):
+    """
+    cursor 로 페이지를 이어 읽으면 limit 없이 검색한 결과와 같아야 합니다.
+    """
+    name_index = CompanyNameIndex()
+
+    for search_name_index in [None, name_index]:
+        expected = company_services.search_companies_by_name(
+            db_session=db_session, name=query, name_index=search_name_index
+        ).companies
+
+        companies, cursor = [], None
+        while True:
+            page = company_services.search_companies_by_name(
+                db_session=db_session,
+                name=query,
+                name_index=search_name_index,
+                limit=7,
+                cursor=cursor,
+            )
+            companies.extend(page.companies)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert companies == expected
+
+
+def test_index_ranking(db_session: Session):
+    """
+    완전 일치 > 접두어 일치 > 부분 일치 > 짧은 회사명 순으로, 회사는 한 번만 나옵니다.
+    """
+    companies = []
+    for ko_name, en_name in [
+        ("주식회사 원티드", "Wanted Inc"),
+        ("원티드랩", "Wantedlab"),
+        ("원티드", "Wanted"),
+        ("더원티드", "The Wanted"),
+    ]:
+        company = Company()
+        company.names.extend(
+            [
+                CompanyName(language_code=LanguageCode.ko, name=ko_name),
+                CompanyName(language_code=LanguageCode.en, name=en_name),
+            ]
+        )
+        companies.append(company)
+    db_session.add_all(companies)
+    db_session.commit()
+
+    name_index = CompanyNameIndex()
+    name_index.sync(db_session)
+
+    assert name_index.search("원티드") == [
+        companies[2].id,
+        companies[1].id,
+        companies[3].id,
+        companies[0].id,
+    ]
+    assert name_index.search("wanted", limit=2) == [companies[2].id, companies[1].id]
+
+
+def test_index_sync_only_reads_new_names(db_session: Session):
+    """
+    색인은 마지막으로 반영한 이후에 추가된 회사명만 읽어옵니다.
+    """
+    name_index = CompanyNameIndex()
+
+    company = Company()
+    company.names.append(CompanyName(language_code=LanguageCode.ko, name="원티드랩"))
+    db_session.add(company)
+    db_session.commit()
+
+    name_index.sync(db_session)
+    assert name_index.search("티드") == [company.id]
+
+    other_company = Company()
+    other_company.names.append(
+        CompanyName(language_code=LanguageCode.en, name="Wanted Space")
+    )
+    db_session.add(other_company)
+    db_session.commit()
+
+    name_index.sync(db_session)
+    assert len(name_index) == 2
+    assert name_index.search("wanted") == [other_company.id]
+    assert name_index.get_name(other_company.id, LanguageCode.en) == "Wanted Space"
+    assert name_index.get_name(other_company.id, LanguageCode.ko) == ""
+
+
+def test_index_sync_does_not_change_running_search(db_session: Session):
+    """
+    진행 중인 검색은 시작할 때의 posting 을 끝까지 읽습니다.
+    (도중에 sync 되어도 회사를 건너뛰거나 두 번 돌려주지 않음)
+    """
+    companies = []
+    for name in ["원티드랩", "원티드스페이스", "원티드 랩"]:
+        company = Company()
+        company.names.append(CompanyName(language_code=LanguageCode.ko, name=name))
+        companies.append(company)
+    db_session.add_all(companies[:2])
+    db_session.commit()
+
+    name_index = CompanyNameIndex()
+    name_index.sync(db_session)
+    matches = name_index.iter_matches("원티드")
+    assert next(matches)[1] == companies[0].id
+
+    # 두 회사명 사이에 정렬되는 회사명이 추가된다.
+    db_session.add(companies[2])
+    db_session.commit()
+    name_index.sync(db_session)
+
+    assert [company_id for _, company_id in matches] == [companies[1].id]
+    assert name_index.search("원티드") == [
+        companies[0].id,
+        companies[2].id,
+        companies[1].id,
+    ]
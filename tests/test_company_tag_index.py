@@ -0,0 +1,176 @@
+from array import array
+
+import pytest
+from starlette.testclient import TestClient
+
+from tests.test_company_name_index import SAMPLE_CSV_PATH
+from wanted_jjh.db.session import Session
+from wanted_jjh.enums import LanguageCode
+from wanted_jjh.exceptions import BusinessException
+from wanted_jjh.exceptions import TagNotFound
+from wanted_jjh.importers.company_csv import read_company_rows
+from wanted_jjh.indexes.company_tag import CompanyTagIndex
+from wanted_jjh.indexes.company_tag import difference
+from wanted_jjh.indexes.company_tag import intersect
+from wanted_jjh.indexes.company_tag import union
+from wanted_jjh.models.company import Company
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_tag import CompanyTag
+from wanted_jjh.models.company_tag import CompanyTagName
+from wanted_jjh.services import company as company_services
+
+
+@pytest.fixture
+def sample_companies(db_session: Session) -> None:
+    tags = {}
+    with open(SAMPLE_CSV_PATH, newline="", encoding="utf-8") as f:
+        for row in read_company_rows(f):
+            company = Company()
+            company.names.extend(
+                CompanyName(language_code=code, name=name)
+                for code, name in row.names.items()
+            )
+            for names in row.tags:
+                tag = tags.get(names["ko"])
+                if tag is None:
+                    tag = tags[names["ko"]] = CompanyTag()
+                    tag.names.extend(
+                        CompanyTagName(language_code=code, name=name)
+                        for code, name in names.items()
+                    )
+                if tag not in company.tags:
+                    company.tags.append(tag)
+            db_session.add(company)
+
+    # 회사가 연결되지 않은 태그
+    db_session.add(
+        CompanyTag(names=[CompanyTagName(language_code="ko", name="태그_없음")])
+    )
+    db_session.commit()
+
+
+@pytest.mark.parametrize(
+    "tag_names, any_tag_names, exclude_tag_names",
+    [
+        (["태그_11"], [], []),
+        (["tag_11", "タグ_29"], [], []),
+        (["태그_11"], [], ["tag_29", "태그_14"]),
+        ([], ["태그_2", "tag_26", "태그_없음"], []),
+        (["태그_11"], ["태그_2", "태그_26"], ["태그_4"]),
+        ([], ["태그_11"], ["태그_11"]),
+        (["태그_없음"], [], []),
+    ],
+)
+def test_index_matches_sql_search(
+    db_session: Session,
+    sample_companies: None,
+    tag_names: list[str],
+    any_tag_names: list[str],
+    exclude_tag_names: list[str],
+):
+    """
+    색인으로 계산한 AND/OR/NOT 검색 결과는 순서까지 SQL 검색 결과와 같아야 합니다.
+    """
+    tag_index = CompanyTagIndex()
+
+    for language_code in [LanguageCode.ko, LanguageCode.en]:
+        results = [
+            company_services.search_company_by_tag(
+                db_session=db_session,
+                tag_names=tag_names,
+                any_tag_names=any_tag_names,
+                exclude_tag_names=exclude_tag_names,
+                language_code=language_code,
+                tag_index=search_tag_index,
+            )
+            for search_tag_index in [None, tag_index]
+        ]
+
+        assert results[0] == results[1]
+
+
+def test_index_follows_tag_changes(
+    api: TestClient, db_session: Session, sample_companies: None
+):
+    """
+    태그를 추가/삭제하면 다음 검색에서 색인이 바뀐 회사만 다시 읽어 반영합니다.
+    """
+    tag_index = api.app.state.company_tag_index
+
+    def search(**kwargs) -> list[str]:
+        return [
+            company_dto.name
+            for company_dto in company_services.search_company_by_tag(
+                db_session=db_session, tag_index=tag_index, **kwargs
+            )
+        ]
+
+    assert "code post" in search(tag_names=["태그_4"], exclude_tag_names=["tag_11"])
+
+    api.put(
+        "/companies/code post/tags",
+        json=[{"tag_name": {"ko": "태그_new", "en": "tag_new"}}],
+        headers={"x-wanted-language": "ko"},
+    )
+    assert search(tag_names=["tag_new", "タグ_4"]) == ["code post"]
+
+    api.delete("/companies/code post/tags/태그_4", headers={"x-wanted-language": "ko"})
+    assert "code post" not in search(any_tag_names=["태그_4"])
+    assert search(any_tag_names=["태그_new"], exclude_tag_names=["태그_4"]) == [
+        "code post"
+    ]
+
+
+def test_search_by_tags_api(
+    api: TestClient, db_session: Session, sample_companies: None
+):
+    """
+    /tags 는 query(AND), any(OR), exclude(NOT) 를 여러 번 받을 수 있습니다.
+    """
+    resp = api.get(
+        "/tags",
+        params={"query": ["태그_11", "tag_29"], "exclude": ["태그_14"]},
+        headers={"x-wanted-language": "ko"},
+    )
+    assert resp.status_code == 200
+    assert resp.json() == [
+        {"company_name": company_dto.name}
+        for company_dto in company_services.search_company_by_tag(
+            db_session=db_session,
+            tag_names=["태그_11", "tag_29"],
+            exclude_tag_names=["태그_14"],
+        )
+    ]
+
+    assert api.get("/tags", params={"exclude": "태그_11"}).status_code == 400
+    assert api.get("/tags", params={"any": ["태그_11", "없는태그"]}).status_code == 404
+
+
+def test_search_validates_tag_names(db_session: Session, sample_companies: None):
+    for tag_index in [None, CompanyTagIndex()]:
+        with pytest.raises(TagNotFound):
+            company_services.search_company_by_tag(
+                db_session=db_session,
+                tag_names=["태그_11"],
+                any_tag_names=["없는태그"],
+                tag_index=tag_index,
+            )
+        with pytest.raises(BusinessException):
+            company_services.search_company_by_tag(
+                db_session=db_session,
+                exclude_tag_names=["태그_11"],
+                tag_index=tag_index,
+            )
+
+
+@pytest.mark.parametrize("sizes", [(3, 5), (3, 1000), (1000, 3), (500, 700)])
+def test_posting_set_operations(sizes: tuple[int, int]):
+    """
+    posting 길이 차이에 따라 이진 탐색/set 연산을 골라도 결과는 같아야 합니다.
+    """
+    left = array("I", range(0, sizes[0] * 3, 3))
+    right = array("I", range(0, sizes[1] * 2, 2))
+
+    assert list(intersect([left, right])) == sorted(set(left) & set(right))
+    assert list(union([left, right])) == sorted(set(left) | set(right))
+    assert list(difference(left, right)) == sorted(set(left) - set(right))
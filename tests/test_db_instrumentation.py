@@ -0,0 +1,89 @@
+import logging
+import re
+from collections.abc import Callable
+
+import pytest
+from starlette.testclient import TestClient
+
+from wanted_jjh import settings
+
+
+def parse_server_timing(value: str) -> tuple[int, float]:
+    match = re.fullmatch(r'db;desc="(\d+) queries";dur=([\d.]+)', value)
+    assert match is not None
+    return int(match.group(1)), float(match.group(2))
+
+
+def test_server_timing_header_reports_request_queries(
+    api: TestClient,
+    sql_statements: list[tuple[str, tuple]],
+    make_companies: Callable[..., None],
+):
+    """
+    응답의 Server-Timing 헤더로 그 요청에서 실행된 SQL 문 수와 DB 시간을 전달합니다.
+    """
+    make_companies(company_count=2, tag_count=2)
+    sql_statements.clear()
+
+    resp = api.get("/companies/company_0", headers=[("x-wanted-language", "ko")])
+
+    query_count, db_ms = parse_server_timing(resp.headers["server-timing"])
+    assert resp.status_code == 200
+    assert query_count == len(sql_statements) > 0
+    assert db_ms > 0
+
+    # 캐시된 응답은 DB 를 조회하지 않는다.
+    resp = api.get("/companies/company_0", headers=[("x-wanted-language", "ko")])
+    assert resp.headers["x-cache"] == "hit"
+    assert parse_server_timing(resp.headers["server-timing"]) == (0, 0.0)
+
+
+def test_db_metrics_are_aggregated_by_route_name(
+    api: TestClient, make_companies: Callable[..., None]
+):
+    """
+    GET /metrics/db 는 라우트 이름별 요청 수, SQL 문 수, DB 시간을 누적해서 보여줍니다.
+    """
+    make_companies(company_count=2, tag_count=2)
+
+    query_counts = [
+        parse_server_timing(
+            api.get(
+                f"/companies/company_{i}", headers=[("x-wanted-language", "ko")]
+            ).headers["server-timing"]
+        )[0]
+        for i in range(2)
+    ]
+    api.get("/없는경로")
+
+    metrics = api.get("/metrics/db").json()
+
+    assert metrics["enabled"] is True
+    route = metrics["routes"]["company:get-company"]
+    assert route["requests"] == 2
+    assert route["queries"] == sum(query_counts)
+    assert route["max_queries"] == max(query_counts)
+    assert route["db_ms"] >= route["max_db_ms"] > 0
+    assert metrics["routes"]["unmatched"]["queries"] == 0
+
+
+def test_slow_queries_are_logged_with_route_name(
+    api: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    make_companies: Callable[..., None],
+):
+    """
+    SLOW_QUERY_MS 이상 걸린 SQL 문은 라우트 이름과 함께 경고 로그로 남깁니다.
+    """
+    make_companies(company_count=1, tag_count=1)
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0)
+
+    with caplog.at_level(logging.WARNING, logger="wanted_jjh.db.instrumentation"):
+        api.get("/tags?query=tag_0", headers=[("x-wanted-language", "ko")])
+
+    assert caplog.records
+    assert all("(company:search-by-tag)" in r.getMessage() for r in caplog.records)
+    assert api.get("/metrics/db").json()["routes"]["company:search-by-tag"][
+        "slow_queries"
+    ] == len(caplog.records)
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import text
+from starlette.testclient import TestClient
+
+from wanted_jjh import settings
+from wanted_jjh.db.session import create_async_db_engine
+from wanted_jjh.db.session import create_db_engine
+from wanted_jjh.db.session import engine
+from wanted_jjh.routers.utils import db as db_utils
+
+
+def test_session_is_not_created_for_requests_without_db(
+    app: FastAPI, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    DB 를 사용하지 않는 요청(/docs, /openapi.json, 404)에서는 세션을 만들지 않습니다.
+    """
+    created_sessions = []
+
+    monkeypatch.setattr(db_utils, "Session", lambda: created_sessions.append(object()))
+
+    with TestClient(app) as client:
+        assert client.get("/docs").status_code == 200
+        assert client.get("/openapi.json").status_code == 200
+        assert client.get("/not-found").status_code == 404
+
+    assert created_sessions == []
+
+
+def test_session_is_released_when_handler_raises():
+    """
+    핸들러에서 예외가 발생해도 세션과 커넥션은 반납되어야 합니다.
+    """
+    checked_out = engine.pool.checkedout()
+
+    db_dependency = db_utils.get_sync_db()
+    db_session = next(db_dependency)
+    db_session.connection()
+
+    assert engine.pool.checkedout() == checked_out + 1
+
+    with pytest.raises(RuntimeError):
+        db_dependency.throw(RuntimeError("handler error"))
+
+    assert engine.pool.checkedout() == checked_out
+
+
+def test_sqlite_production_profile(tmp_path):
+    """
+    production 프로파일은 커넥션마다 WAL 등 PRAGMA 를 적용하고 커넥션 풀을 설정합니다.
+    """
+    database_url = f"sqlite:///{tmp_path}/profile.sqlite"
+    sync_engine = create_db_engine(database_url)
+
+    with sync_engine.connect() as conn:
+        assert conn.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert conn.scalar(text("PRAGMA synchronous")) == 1  # NORMAL
+        assert conn.scalar(text("PRAGMA busy_timeout")) == 5000
+        assert conn.scalar(text("PRAGMA temp_store")) == 2  # MEMORY
+        assert conn.scalar(text("PRAGMA cache_size")) == -64 * 1024
+
+    assert sync_engine.pool.size() == settings.DB_POOL_SIZE
+
+    async def _async_pragmas():
+        async_engine = create_async_db_engine(database_url)
+        async with async_engine.connect() as conn:
+            journal_mode = await conn.scalar(text("PRAGMA journal_mode"))
+            busy_timeout = await conn.scalar(text("PRAGMA busy_timeout"))
+        await async_engine.dispose()
+        return journal_mode, busy_timeout
+
+    assert asyncio.run(_async_pragmas()) == ("wal", 5000)
+
+
+def test_sqlite_default_profile(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "SQLITE_PROFILE", "default")
+
+    sync_engine = create_db_engine(f"sqlite:///{tmp_path}/default.sqlite")
+
+    with sync_engine.connect() as conn:
+        assert conn.scalar(text("PRAGMA journal_mode")) == "delete"
@@ -0,0 +1,210 @@
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy import text
+from starlette.testclient import TestClient
+
+from wanted_jjh import settings
+from wanted_jjh.db.migrations import upgrade
+from wanted_jjh.db.session import Session
+from wanted_jjh.enums import LanguageCode
+from wanted_jjh.enums import SearchMode
+from wanted_jjh.importers.company_csv import CompanyCsvImporter
+from wanted_jjh.models.company import Company
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_tag import CompanyTag
+from wanted_jjh.models.company_tag import CompanyTagName
+from wanted_jjh.models.full_text import company_name_fts
+from wanted_jjh.models.full_text import company_tag_name_fts
+from wanted_jjh.normalization import normalize_name
+from wanted_jjh.services.company import search_companies_by_name
+
+from tests.test_migrations import LEGACY_SCHEMA
+
+
+def add_company(api: TestClient, names: dict[str, str], tags: list[dict] = ()):
+    resp = api.post(
+        "/companies",
+        json={
+            "company_name": names,
+            "tags": [{"tag_name": tag_name} for tag_name in tags],
+        },
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert resp.status_code == 200
+
+
+def search(api: TestClient, url: str) -> list[str]:
+    resp = api.get(url, headers=[("x-wanted-language", "ko")])
+    assert resp.status_code == 200
+    return [company["company_name"] for company in resp.json()]
+
+
+def test_normalize_name():
+    assert normalize_name("ＷＡＮＴＥＤ Lab") == "wanted lab"
+    assert normalize_name("ｳｫﾝﾃｯﾄﾞ") == "ウォンテッド"
+    assert normalize_name("Straße") == "strasse"
+
+
+def test_search_company_name_full_text(api: TestClient):
+    """
+    mode=fts 는 대소문자/전각·반각과 관계없이 회사명을 찾고, BM25 점수 순으로 돌려줍니다.
+    3글자보다 짧은 검색어도 찾을 수 있습니다.
+    """
+    add_company(api, {"ko": "원티드랩", "en": "Wantedlab"})
+    add_company(api, {"ko": "ＷＡＮＴＥＤ 코리아"})
+    add_company(api, {"ko": "원티드 마케팅 서비스 주식회사"})
+    add_company(api, {"ko": "링크드코리아", "tw": "ｳｫﾝﾃｯﾄﾞ"})
+
+    assert search(api, "/search?query=WANTED&mode=fts") == [
+        "원티드랩",
+        "ＷＡＮＴＥＤ 코리아",
+    ]
+    # 기본 검색은 ASCII 대소문자만 무시한다.
+    assert search(api, "/search?query=WANTED") == ["원티드랩"]
+
+    assert search(api, "/search?query=원티드&mode=fts") == [
+        "원티드랩",
+        "원티드 마케팅 서비스 주식회사",
+    ]
+    assert search(api, "/search?query=ウォンテ&mode=fts") == ["링크드코리아"]
+    assert search(api, "/search?query=코리&mode=fts") == [
+        "링크드코리아",
+        "ＷＡＮＴＥＤ 코리아",
+    ]
+    # FTS5 문법의 특수 문자도 검색어 그대로 찾는다.
+    assert search(api, '/search?query="OR"&mode=fts') == []
+
+
+def test_search_company_name_full_text_pagination(api: TestClient):
+    for i in range(5):
+        add_company(api, {"ko": f"원티드_{i}"})
+
+    resp = api.get(
+        "/search?query=원티드&mode=fts&limit=3", headers=[("x-wanted-language", "ko")]
+    )
+    assert [company["company_name"] for company in resp.json()] == [
+        "원티드_0",
+        "원티드_1",
+        "원티드_2",
+    ]
+
+    cursor = resp.headers["x-next-cursor"]
+    resp = api.get(
+        f"/search?query=원티드&mode=fts&limit=3&cursor={cursor}",
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert [company["company_name"] for company in resp.json()] == [
+        "원티드_3",
+        "원티드_4",
+    ]
+    assert "x-next-cursor" not in resp.headers
+
+    resp = api.get("/search?query=원티드&mode=fts&cursor=0.1.2")
+    assert resp.status_code == 400
+
+
+def test_search_company_by_tag_full_text(api: TestClient):
+    """
+    mode=fts 는 태그명이 검색어를 포함하는 태그로 AND/OR/NOT 을 적용합니다.
+    없는 태그명은 404 대신 빈 결과입니다.
+    """
+    add_company(api, {"ko": "회사_1"}, [{"ko": "파이썬", "en": "Python"}])
+    add_company(
+        api,
+        {"ko": "회사_2"},
+        [{"ko": "파이썬 웹", "en": "Python Web"}, {"en": "Remote Work"}],
+    )
+    add_company(api, {"ko": "회사_3"}, [{"ko": "자바", "en": "Java"}])
+
+    assert search(api, "/tags?query=PYTHON&mode=fts") == ["회사_1", "회사_2"]
+    assert search(api, "/tags?query=python&query=remote&mode=fts") == ["회사_2"]
+    assert search(api, "/tags?any=python&any=자바&exclude=web&mode=fts") == [
+        "회사_1",
+        "회사_3",
+    ]
+    assert search(api, "/tags?query=웹&mode=fts") == ["회사_2"]
+    assert search(api, "/tags?query=없는태그&mode=fts") == []
+    # 기본 검색은 태그명 전체가 같아야 한다. (대소문자/전각·반각은 무시한다.)
+    assert api.get("/tags?query=pyth").status_code == 404
+
+
+def test_orm_writes_keep_full_text_index_in_sync(
+    db_session: Session, make_companies: Callable[..., None]
+):
+    make_companies(company_count=2, tag_count=2)
+
+    company = Company(names=[CompanyName(language_code=LanguageCode.en, name="NEW")])
+    company.tags.append(
+        CompanyTag(names=[CompanyTagName(language_code=LanguageCode.en, name="Tag")])
+    )
+    db_session.add(company)
+    db_session.commit()
+
+    assert (
+        db_session.scalar(
+            select(company_name_fts.c.name).where(
+                company_name_fts.c.rowid == company.names[0].id
+            )
+        )
+        == "new"
+    )
+    assert db_session.execute(
+        select(company_tag_name_fts.c.rowid, company_tag_name_fts.c.name)
+    ).all() == [
+        (name.id, normalize_name(name.name))
+        for name in db_session.scalars(
+            select(CompanyTagName).order_by(CompanyTagName.id)
+        )
+    ]
+
+
+def test_full_text_search_can_be_disabled(api: TestClient, monkeypatch):
+    monkeypatch.setattr(settings, "FULL_TEXT_SEARCH", False)
+
+    resp = api.get("/search?query=wanted&mode=fts")
+
+    assert resp.status_code == 400
+
+
+def test_upgrade_indexes_existing_translations(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/legacy.sqlite")
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(text("INSERT INTO companies (id) VALUES (1)"))
+        conn.execute(
+            text(
+                "INSERT INTO company_name_translations (company_id, language_code, name)"
+                " VALUES (1, 'en', 'Wantedlab'), (1, 'ja', NULL)"
+            )
+        )
+
+    upgrade(engine)
+    upgrade(engine)
+
+    with engine.connect() as conn:
+        assert conn.execute(
+            select(company_name_fts.c.rowid, company_name_fts.c.name)
+        ).all() == [(1, "wantedlab")]
+    engine.dispose()
+
+
+@pytest.mark.parametrize("query", ["wanted", "ＷＡＮＴＥＤ", "랩"])
+def test_import_indexes_translations(import_engine, tmp_path, query):
+    """대량 적재한 회사명도 전문 검색 색인에 추가됩니다."""
+    csv_path = tmp_path / "companies.csv"
+    csv_path.write_text(
+        "company_ko,company_en,tag_ko,tag_en\n원티드랩,Wantedlab,태그_1,tag_1\n",
+        encoding="utf-8",
+    )
+    CompanyCsvImporter(import_engine, report=lambda message: None).run(csv_path)
+
+    with Session(bind=import_engine) as db_session:
+        result = search_companies_by_name(
+            db_session=db_session, name=query, mode=SearchMode.fts
+        )
+
+    assert [company.name for company in result.companies] == ["원티드랩"]
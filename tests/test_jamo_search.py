@@ -0,0 +1,93 @@
+import pytest
+from starlette.testclient import TestClient
+
+from wanted_jjh.db.session import Session
+from wanted_jjh.enums import SearchMode
+from wanted_jjh.hangul import is_chosung_query
+from wanted_jjh.hangul import to_chosung
+from wanted_jjh.hangul import to_jamo
+from wanted_jjh.services.company import search_companies_by_name
+
+from tests.test_full_text_search import add_company
+from tests.test_full_text_search import search
+
+
+def test_decompose_hangul():
+    assert to_jamo("원티드 Lab") == "ㅇㅜㅓㄴㅌㅣㄷㅡ Lab"
+    assert to_jamo("닭갈비") == "ㄷㅏㄹㄱㄱㅏㄹㅂㅣ"
+    assert to_jamo("ㅘ") == "ㅗㅏ"
+    # 조합형(NFD)으로 입력된 음절도 같은 자모가 된다.
+    assert to_jamo("한") == "ㅎㅏㄴ"
+    assert to_chosung("원티드 랩") == "ㅇㅌㄷ ㄹ"
+    assert is_chosung_query("ㅇㅌ ㄷ")
+    assert not is_chosung_query("ㅇㅌ드")
+    assert not is_chosung_query(" ")
+
+
+def test_search_company_name_jamo(api: TestClient):
+    """
+    mode=jamo 는 초성 검색어와 조합 중인 음절로 끝나는 검색어로 한국어 회사명을 찾습니다.
+    """
+    add_company(api, {"ko": "원티드랩", "en": "Wantedlab"})
+    add_company(api, {"ko": "닭갈비 코리아", "en": "Korea"})
+    add_company(api, {"ko": "과일나라"})
+    add_company(api, {"ko": "고래", "en": "Whale"})
+
+    assert search(api, "/search?query=ㅇㅌㄷ&mode=jamo") == ["원티드랩"]
+    assert search(api, "/search?query=ㅋㄹ&mode=jamo") == ["닭갈비 코리아"]
+    assert search(api, "/search?query=원틷&mode=jamo") == ["원티드랩"]
+    assert search(api, "/search?query=원ㅌ&mode=jamo") == ["원티드랩"]
+    assert search(api, "/search?query=달&mode=jamo") == ["닭갈비 코리아"]
+    # 접두어 일치 > 짧은 회사명 순
+    assert search(api, "/search?query=고&mode=jamo") == ["고래", "과일나라"]
+    # 한글이 없는 검색어는 기본 검색과 같다.
+    assert search(api, "/search?query=wanted&mode=jamo") == ["원티드랩"]
+
+    # 기본 검색은 입력한 글자 그대로 찾는다.
+    assert search(api, "/search?query=ㅇㅌㄷ") == []
+    assert search(api, "/search?query=원틷") == []
+
+
+def test_search_company_name_jamo_pagination(api: TestClient):
+    for i in range(5):
+        add_company(api, {"ko": f"원티드_{i}"})
+
+    resp = api.get(
+        "/search?query=ㅇㅌ&mode=jamo&limit=3", headers=[("x-wanted-language", "ko")]
+    )
+    assert [company["company_name"] for company in resp.json()] == [
+        "원티드_0",
+        "원티드_1",
+        "원티드_2",
+    ]
+
+    resp = api.get(
+        f"/search?query=ㅇㅌ&mode=jamo&limit=3&cursor={resp.headers['x-next-cursor']}",
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert [company["company_name"] for company in resp.json()] == [
+        "원티드_3",
+        "원티드_4",
+    ]
+    assert "x-next-cursor" not in resp.headers
+
+
+def test_new_company_invalidates_jamo_search(api: TestClient):
+    add_company(api, {"ko": "원티드랩"})
+    urls = ["/search?query=ㅇㅌ&mode=jamo", "/search?query=원틷&mode=jamo"]
+    for url in urls:
+        search(api, url)
+
+    add_company(api, {"ko": "원티드스페이스"})
+
+    for url in urls:
+        assert search(api, url) == ["원티드랩", "원티드스페이스"]
+
+
+def test_jamo_search_requires_name_index(db_session: Session, api: TestClient):
+    with pytest.raises(Exception, match="색인"):
+        search_companies_by_name(
+            db_session=db_session, name="ㅇㅌ", mode=SearchMode.jamo
+        )
+
+    assert api.get("/tags?query=ㅇㅌ&mode=jamo").status_code == 400
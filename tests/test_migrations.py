@@ -0,0 +1,82 @@
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy import inspect
+from sqlalchemy import text
+
+from wanted_jjh.db.migrations import upgrade
+
+# 인덱스가 추가되기 전의 스키마
+LEGACY_SCHEMA = [
+    "CREATE TABLE companies (id INTEGER PRIMARY KEY)",
+    "CREATE TABLE company_tags (id INTEGER PRIMARY KEY)",
+    (
+        "CREATE TABLE company_name_translations ("
+        "id INTEGER PRIMARY KEY, company_id INTEGER REFERENCES companies(id), "
+        "language_code VARCHAR, name VARCHAR)"
+    ),
+    (
+        "CREATE TABLE company_tag_name_translations ("
+        "id INTEGER PRIMARY KEY, tag_id INTEGER REFERENCES company_tags(id), "
+        "language_code VARCHAR, name VARCHAR)"
+    ),
+    (
+        "CREATE TABLE association_company_and_company_tag ("
+        "company_id INTEGER REFERENCES companies(id), "
+        "company_tag_id INTEGER REFERENCES company_tags(id))"
+    ),
+]
+
+
+def test_upgrade_legacy_database(tmp_path):
+    """
+    인덱스가 없는 기존 DB 에 upgrade 를 실행하면 중복 태그 연결을 정리하고 인덱스를 추가합니다.
+    여러 번 실행해도 안전해야 하며, 유니크 인덱스가 있으면 중복 연결을 다시 찾지 않습니다.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path}/legacy.sqlite")
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(text("INSERT INTO companies (id) VALUES (1)"))
+        conn.execute(text("INSERT INTO company_tags (id) VALUES (1), (2)"))
+        conn.execute(
+            text(
+                "INSERT INTO association_company_and_company_tag "
+                "(company_id, company_tag_id) VALUES (1, 1), (1, 1), (1, 2)"
+            )
+        )
+
+    upgrade(engine)
+
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    upgrade(engine)
+    assert not any(
+        "association_company_and_company_tag" in statement
+        and ("GROUP BY" in statement or statement.startswith("DELETE"))
+        for statement in statements
+    )
+
+    index_names = {
+        index["name"]
+        for table_name in inspect(engine).get_table_names()
+        for index in inspect(engine).get_indexes(table_name)
+    }
+    assert {
+        "ix_company_name_translations_language_code_name",
+        "ix_company_tag_name_translations_language_code_name",
+        "ux_association_company_and_company_tag_company_id_company_tag_id",
+    } <= index_names
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT company_id, company_tag_id "
+                "FROM association_company_and_company_tag ORDER BY company_tag_id"
+            )
+        ).all()
+    assert [tuple(row) for row in rows] == [(1, 1), (1, 2)]
+    engine.dispose()
@@ -0,0 +1,206 @@
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy import update
+from starlette.testclient import TestClient
+
+from wanted_jjh.cli import main
+from wanted_jjh.db.migrations import upgrade
+from wanted_jjh.db.session import Session
+from wanted_jjh.enums import LanguageCode
+from wanted_jjh.importers.company_csv import CompanyCsvImporter
+from wanted_jjh.models.company import CompanyName
+from wanted_jjh.models.company_tag import CompanyTag
+from wanted_jjh.models.company_tag import CompanyTagName
+from wanted_jjh.services.company import search_company_by_tag
+
+from tests.test_full_text_search import add_company
+from tests.test_migrations import LEGACY_SCHEMA
+
+
+def get(api: TestClient, url: str):
+    return api.get(url, headers=[("x-wanted-language", "ko")])
+
+
+def test_name_keys_are_populated_on_write(
+    db_session: Session, make_companies: Callable[..., None]
+):
+    make_companies(company_count=1, tag_count=1)
+    db_session.add(CompanyName(language_code=LanguageCode.en, name="ＷＡＮＴＥＤ Lab"))
+    db_session.commit()
+
+    assert db_session.execute(
+        select(CompanyName.name, CompanyName.name_key).order_by(CompanyName.id)
+    ).all() == [
+        ("회사_0", "회사_0"),
+        ("company_0", "company_0"),
+        ("ＷＡＮＴＥＤ Lab", "wanted lab"),
+    ]
+
+
+def test_exact_lookups_ignore_case_and_width(api: TestClient):
+    """
+    회사명/태그명 완전 일치 조회는 대소문자와 전각/반각 차이를 무시합니다.
+    """
+    add_company(api, {"ko": "원티드랩", "en": "Wantedlab"}, [{"en": "Python"}])
+    add_company(api, {"ko": "링크드코리아", "en": "Linked"}, [{"en": "python"}])
+
+    for company_name in ["wantedlab", "WANTEDLAB", "ＷａｎｔｅｄＬａｂ"]:
+        resp = get(api, f"/companies/{company_name}")
+        assert resp.status_code == 200
+        assert resp.json()["company_name"] == "원티드랩"
+
+    resp = api.post(
+        "/companies:batchGet",
+        json={"company_names": ["WANTEDLAB", "ｌｉｎｋｅｄ", "없는회사"]},
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert [item["found"] for item in resp.json()["results"]] == [
+        True,
+        True,
+        False,
+    ]
+
+    # 표기가 다른 태그명으로도 같은 태그를 찾는다.
+    assert get(api, "/tags?query=PYTHON").json() == [
+        {"company_name": "원티드랩"},
+        {"company_name": "링크드코리아"},
+    ]
+
+    resp = api.delete(
+        "/companies/WANTEDLAB/tags/ＰＹＴＨＯＮ", headers=[("x-wanted-language", "ko")]
+    )
+    assert resp.status_code == 200
+    assert get(api, "/tags?query=Python").json() == [{"company_name": "링크드코리아"}]
+
+
+def test_colliding_names_resolve_to_first_added_company(api: TestClient):
+    """
+    정규화한 회사명이 같은 회사가 여럿이면 먼저 추가된 회사명의 회사를 찾습니다.
+    """
+    add_company(api, {"ko": "원티드랩", "en": "Wantedlab"}, [{"ko": "파이썬"}])
+    add_company(
+        api, {"ko": "원티드재팬", "en": "ＷＡＮＴＥＤＬＡＢ"}, [{"ko": "파이썬"}]
+    )
+
+    assert get(api, "/companies/WANTEDLAB").json()["company_name"] == "원티드랩"
+    resp = api.post(
+        "/companies:batchGet",
+        json={"company_names": ["ｗａｎｔｅｄｌａｂ"]},
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert resp.json()["results"][0]["company"]["company_name"] == "원티드랩"
+
+    resp = api.put(
+        "/companies/wantedlab/tags",
+        json=[{"tag_name": {"ko": "자바"}}],
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert resp.json()["company_name"] == "원티드랩"
+
+    resp = api.delete(
+        "/companies/ＷａｎｔｅｄＬａｂ/tags/파이썬",
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert resp.json() == {"company_name": "원티드랩", "tags": ["자바"]}
+    assert get(api, "/companies/원티드재팬").json()["tags"] == ["파이썬"]
+
+
+def test_tag_search_without_index_ignores_case_and_width(
+    db_session: Session, make_companies: Callable[..., None]
+):
+    make_companies(company_count=2, tag_count=2)
+
+    company_dtos = search_company_by_tag(
+        db_session=db_session, tag_names=["TAG_0", "ｔａｇ_1"]
+    )
+
+    assert [company_dto.name for company_dto in company_dtos] == ["회사_0", "회사_1"]
+
+
+def test_new_tags_reuse_tags_with_same_name_key(api: TestClient, db_session: Session):
+    add_company(api, {"ko": "회사_1"}, [{"ko": "파이썬", "en": "Python"}])
+    add_company(api, {"ko": "회사_2"}, [{"en": "PYTHON"}, {"en": "ｐｙｔｈｏｎ"}])
+
+    assert db_session.scalar(select(func.count()).select_from(CompanyTag)) == 1
+    assert get(api, "/companies/회사_2").json()["tags"] == ["파이썬"]
+
+
+def test_lookup_variant_invalidates_cached_response(api: TestClient):
+    add_company(
+        api, {"ko": "원티드랩", "en": "Wantedlab"}, [{"ko": "파이썬", "en": "Python"}]
+    )
+    assert get(api, "/companies/WANTEDLAB").json()["tags"] == ["파이썬"]
+    assert get(api, "/companies/WANTEDLAB").headers["x-cache"] == "hit"
+
+    api.delete(
+        "/companies/wantedlab/tags/python", headers=[("x-wanted-language", "ko")]
+    )
+
+    assert get(api, "/companies/WANTEDLAB").status_code == 404
+
+
+def test_import_reuses_tags_with_same_name_key(import_engine, tmp_path):
+    csv_path = tmp_path / "companies.csv"
+    csv_path.write_text(
+        "company_ko,company_en,tag_ko,tag_en\n"
+        "원티드랩,Wantedlab,,Python\n"
+        "링크드코리아,Linked,,PYTHON\n",
+        encoding="utf-8",
+    )
+    CompanyCsvImporter(import_engine, report=lambda message: None).run(csv_path)
+
+    with Session(bind=import_engine) as db_session:
+        assert db_session.scalar(select(func.count()).select_from(CompanyTag)) == 1
+        assert db_session.scalars(
+            select(CompanyName.name_key).order_by(CompanyName.id)
+        ).all() == ["원티드랩", "wantedlab", "링크드코리아", "linked"]
+
+
+def test_upgrade_backfills_name_keys(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/legacy.sqlite")
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(text("INSERT INTO companies (id) VALUES (1)"))
+        conn.execute(
+            text(
+                "INSERT INTO company_name_translations (company_id, language_code, name)"
+                " VALUES (1, 'en', 'ＷａｎｔｅｄＬａｂ'), (1, 'ja', NULL)"
+            )
+        )
+
+    upgrade(engine)
+    upgrade(engine)
+
+    with engine.connect() as conn:
+        assert conn.execute(
+            select(CompanyName.name, CompanyName.name_key).order_by(CompanyName.id)
+        ).all() == [("ＷａｎｔｅｄＬａｂ", "wantedlab"), (None, None)]
+    engine.dispose()
+
+
+def test_backfill_name_keys_command(
+    tmp_path, capsys: pytest.CaptureFixture, make_companies: Callable[..., None]
+):
+    database_url = f"sqlite:///{tmp_path}/backfill.sqlite"
+    engine = create_engine(database_url)
+    upgrade(engine)
+    with Session(bind=engine) as db_session:
+        make_companies(company_count=3, tag_count=2, db_session=db_session)
+        for translation in (CompanyName, CompanyTagName):
+            db_session.execute(update(translation).values(name_key=None))
+        db_session.commit()
+
+    main(["backfill-name-keys", "--batch-size", "4", "--database-url", database_url])
+
+    assert "10 개" in capsys.readouterr().out
+    with Session(bind=engine) as db_session:
+        assert db_session.scalars(
+            select(CompanyTagName.name_key).order_by(CompanyTagName.id)
+        ).all() == ["태그_0", "tag_0", "태그_1", "tag_1"]
+    engine.dispose()
@@ -0,0 +1,199 @@
+import json
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy import select
+from starlette.testclient import TestClient
+
+from wanted_jjh.db.session import Session
+from wanted_jjh.models.company import Company
+from wanted_jjh.models.company_tag import CompanyTag
+from wanted_jjh.services.company import _insert_id_rows
+
+
+@pytest.mark.parametrize("company_count, tag_count", [(2, 2), (20, 15)])
+@pytest.mark.parametrize(
+    "method, url, kwargs, max_statement_count",
+    [
+        ("get", "/search?query=company", {}, 1),
+        ("get", "/tags?query=tag_0", {}, 1),
+        ("get", "/tags?query=tag_0&any=tag_1&any=태그_0&exclude=tag_1", {}, 1),
+        ("get", "/companies/company_0", {}, 1),
+        ("get", "/companies/export", {}, 1),
+        (
+            "post",
+            "/companies:batchGet",
+            {"json": {"company_names": ["company_0", "회사_1", "없는회사"]}},
+            1,
+        ),
+        (
+            "put",
+            "/companies/company_0/tags",
+            {"json": [{"tag_name": {"ko": "태그_new", "en": "tag_new"}}]},
+            # 새 태그명을 전문 검색 색인에 추가하는 INSERT ... SELECT 1 개 포함
+            15,
+        ),
+        ("delete", "/companies/company_0/tags/tag_1", {}, 11),
+        (
+            "post",
+            "/companies",
+            {
+                "json": {
+                    "company_name": {"ko": "새회사", "en": "new company"},
+                    "tags": [{"tag_name": {"ko": "태그_0", "en": "tag_0"}}],
+                }
+            },
+            14,
+        ),
+    ],
+)
+def test_query_count_does_not_depend_on_row_count(
+    api: TestClient,
+    sql_statements: list[tuple[str, tuple]],
+    method: str,
+    url: str,
+    kwargs: dict,
+    max_statement_count: int,
+    company_count: int,
+    tag_count: int,
+    make_companies: Callable[..., None],
+    warm_up_indexes: Callable[[], None],
+):
+    """
+    회사/태그 수와 상관없이 API 마다 실행되는 SQL 문 수는 일정해야 합니다. (N+1 방지)
+    """
+    make_companies(company_count=company_count, tag_count=tag_count)
+    warm_up_indexes()
+    sql_statements.clear()
+
+    resp = getattr(api, method)(url, headers=[("x-wanted-language", "ko")], **kwargs)
+
+    assert resp.status_code == 200
+    assert len(sql_statements) <= max_statement_count
+
+
+def make_tag_payload(count: int, *, offset: int = 0) -> list[dict]:
+    # 짝수 번째는 기존 태그(태그_0 ~ 태그_9), 홀수 번째는 새 태그
+    return [
+        {
+            "tag_name": {"ko": f"태그_{i % 10}", "en": f"tag_{i % 10}"}
+            if i % 2 == 0
+            else {"ko": f"태그_new_{i}", "en": f"tag_new_{i}"}
+        }
+        for i in range(offset, offset + count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "method, url, make_json",
+    [
+        ("put", "/companies/company_0/tags", lambda tags: tags),
+        (
+            "post",
+            "/companies",
+            lambda tags: {
+                "company_name": {"ko": "새회사", "en": "new company"},
+                "tags": tags,
+            },
+        ),
+    ],
+)
+def test_query_count_does_not_depend_on_request_tag_count(
+    api: TestClient,
+    sql_statements: list[tuple[str, tuple]],
+    method: str,
+    url: str,
+    make_json,
+    make_companies: Callable[..., None],
+):
+    """
+    요청한 태그 수와 상관없이 태그 조회/추가/연결에 실행되는 SQL 문 수는 같아야 합니다.
+    """
+    make_companies(company_count=2, tag_count=10)
+
+    statement_counts = []
+    for tag_count, offset in [(2, 0), (30, 100)]:
+        sql_statements.clear()
+        resp = getattr(api, method)(
+            url,
+            headers=[("x-wanted-language", "ko")],
+            json=make_json(make_tag_payload(tag_count, offset=offset)),
+        )
+        assert resp.status_code == 200
+        statement_counts.append(len(sql_statements))
+
+    assert statement_counts[0] == statement_counts[1]
+
+
+def test_batch_create_query_count_does_not_depend_on_company_count(
+    api: TestClient,
+    sql_statements: list[tuple[str, tuple]],
+    make_companies: Callable[..., None],
+    warm_up_indexes: Callable[[], None],
+):
+    """
+    청크 하나에 추가하는 회사 수와 상관없이 청크마다 실행되는 SQL 문 수는 같아야 합니다.
+    앞 청크에서 조회/추가한 태그는 다음 청크에서 다시 조회하지 않습니다.
+    """
+    make_companies(company_count=2, tag_count=10)
+    warm_up_indexes()
+
+    def post(items: list[dict], *, chunk_size: int) -> None:
+        resp = api.post(
+            "/companies:batchCreate",
+            params={"chunk_size": chunk_size},
+            content="".join(json.dumps(item) + "\n" for item in items).encode(),
+            headers=[("x-wanted-language", "ko")],
+        )
+        assert resp.status_code == 200
+        assert all(
+            json.loads(line)["status"] == "created" for line in resp.text.splitlines()
+        )
+
+    statement_counts = []
+    for company_count in [2, 30]:
+        sql_statements.clear()
+        post(
+            [
+                {
+                    "company_name": {"ko": f"새회사_{company_count}_{i}"},
+                    "tags": make_tag_payload(3, offset=company_count * 100 + i * 3),
+                }
+                for i in range(company_count)
+            ],
+            chunk_size=company_count,
+        )
+        statement_counts.append(len(sql_statements))
+
+    assert statement_counts[0] == statement_counts[1]
+
+    sql_statements.clear()
+    post(
+        [
+            {"company_name": {"ko": f"새회사_{i}"}, "tags": make_tag_payload(4)}
+            for i in range(3)
+        ],
+        chunk_size=1,
+    )
+    tag_lookups = [
+        statement
+        for statement, _ in sql_statements
+        if statement.startswith("SELECT company_tag_name_translations.name")
+    ]
+    # 첫 청크에서만 언어(ko, en)별로 한 번씩 조회한다.
+    assert len(tag_lookups) == 2
+
+
+@pytest.mark.parametrize("dialect_name", ["sqlite", "postgresql"])
+def test_insert_id_rows_returns_ids_in_insert_order(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch, dialect_name: str
+):
+    """
+    id 만 있는 회사/태그 행을 여러 개 추가하면 추가한 순서대로 id 를 돌려줍니다.
+    (postgresql 은 SQLite 전용 NULL id 문장 대신 기본값 행을 추가하는 경로입니다.)
+    """
+    monkeypatch.setattr(db_session.get_bind().dialect, "name", dialect_name)
+    for model in (Company, CompanyTag):
+        ids = _insert_id_rows(db_session=db_session, model=model, count=3)
+        assert ids == sorted(ids) and len(set(ids)) == 3
+        assert db_session.scalars(select(model.id).order_by(model.id)).all() == ids
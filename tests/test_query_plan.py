@@ -0,0 +1,131 @@
+import re
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy import text
+from starlette.testclient import TestClient
+
+from wanted_jjh.db.session import Session
+from wanted_jjh.models.company_tag import CompanyTag
+from wanted_jjh.models.company_tag import CompanyTagName
+
+# 인덱스 없이 테이블 전체를 읽는 실행 계획 (예: "SCAN company_name_translations")
+FULL_SCAN_PATTERN = re.compile(r"^SCAN (\w+)$")
+
+
+def explain(db_session: Session, statement: str, parameters) -> list[str]:
+    rows = db_session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    )
+    return [row.detail for row in rows]
+
+
+@pytest.mark.parametrize(
+    "method, url, kwargs",
+    [
+        ("get", "/search?query=company", {}),
+        ("get", "/tags?query=tag_0", {}),
+        ("get", "/companies/company_0", {}),
+        ("get", "/companies/export?since_id=5", {}),
+        (
+            "post",
+            "/companies:batchGet",
+            {"json": {"company_names": ["company_0", "회사_1", "없는회사"]}},
+        ),
+        (
+            "put",
+            "/companies/company_0/tags",
+            {"json": [{"tag_name": {"ko": "태그_1", "en": "tag_new"}}]},
+        ),
+        ("delete", "/companies/company_0/tags/tag_1", {}),
+        (
+            "post",
+            "/companies",
+            {
+                "json": {
+                    "company_name": {"ko": "새회사", "en": "new company"},
+                    "tags": [{"tag_name": {"ko": "태그_0", "en": "tag_0"}}],
+                }
+            },
+        ),
+        (
+            "post",
+            "/companies:batchCreate",
+            {
+                "content": (
+                    '{"company_name": {"ko": "새회사"}, '
+                    '"tags": [{"tag_name": {"ko": "태그_0", "en": "tag_new"}}]}\n'
+                    '{"company_name": {"en": "new company"}, "tags": []}\n'
+                )
+            },
+        ),
+    ],
+)
+def test_service_queries_use_indexes(
+    api: TestClient,
+    db_session: Session,
+    sql_statements: list[tuple[str, tuple]],
+    method: str,
+    url: str,
+    kwargs: dict,
+    make_companies: Callable[..., None],
+    warm_up_indexes: Callable[[], None],
+):
+    """
+    API 가 실행하는 모든 조회/수정/삭제 쿼리는 테이블 전체를 스캔하지 않고 인덱스를 사용해야 합니다.
+    """
+    make_companies(company_count=20, tag_count=10)
+    db_session.execute(text("ANALYZE"))
+    warm_up_indexes()
+    sql_statements.clear()
+
+    resp = getattr(api, method)(url, headers=[("x-wanted-language", "ko")], **kwargs)
+    assert resp.status_code == 200
+
+    assert_no_full_scans(db_session, sql_statements)
+
+
+def test_tag_index_sync_uses_indexes(
+    api: TestClient,
+    db_session: Session,
+    sql_statements: list[tuple[str, tuple]],
+    make_companies: Callable[..., None],
+    warm_up_indexes: Callable[[], None],
+):
+    """
+    태그 색인은 갱신된 회사의 연결과 태그명만 인덱스로 읽어와야 합니다.
+    """
+    make_companies(company_count=20, tag_count=10)
+    # 회사에 연결되지 않은 태그 (갱신된 회사의 태그명은 전체 태그명의 일부다.)
+    db_session.add_all(
+        CompanyTag(names=[CompanyTagName(language_code="ko", name=f"태그_{i}")])
+        for i in range(10, 100)
+    )
+    db_session.commit()
+    db_session.execute(text("ANALYZE"))
+    warm_up_indexes()
+    api.delete("/companies/company_0/tags/tag_1")
+    sql_statements.clear()
+
+    resp = api.get("/tags?query=tag_1")
+    assert resp.status_code == 200
+    assert len(resp.json()) == 19
+
+    assert len(sql_statements) == 3
+    assert_no_full_scans(db_session, sql_statements)
+
+
+def assert_no_full_scans(
+    db_session: Session, sql_statements: list[tuple[str, tuple]]
+) -> None:
+    statements = [
+        (statement, parameters)
+        for statement, parameters in sql_statements
+        if statement.lstrip().startswith(("SELECT", "UPDATE", "DELETE"))
+    ]
+    assert statements
+
+    for statement, parameters in statements:
+        plan = explain(db_session, statement, parameters)
+        full_scans = [detail for detail in plan if FULL_SCAN_PATTERN.match(detail)]
+        assert full_scans == [], f"{statement}\n{plan}"
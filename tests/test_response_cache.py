@@ -0,0 +1,249 @@
+from collections.abc import Callable
+
+import pytest
+from starlette.testclient import TestClient
+
+from wanted_jjh.caches.response import CachedResponse
+from wanted_jjh.caches.response import LocalCacheBackend
+from wanted_jjh.caches.response import LocalSharedStore
+from wanted_jjh.caches.response import SharedCacheBackend
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_response(body: bytes) -> CachedResponse:
+    return CachedResponse(body=body, headers={"content-type": "application/json"})
+
+
+def test_local_cache_backend_evicts_least_recently_used():
+    backend = LocalCacheBackend(ttl_seconds=60, max_entries=2, max_bytes=10)
+
+    backend.set("a", make_response(b"aaa"), tags=["tag-a"])
+    backend.set("b", make_response(b"bbb"), tags=[])
+    assert backend.get("a") is not None
+    backend.set("c", make_response(b"ccc"), tags=[])
+
+    # 항목 수 한도를 넘으면 가장 오래 사용하지 않은 b 가 제거된다.
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+
+    # 응답 크기 합계 한도를 넘으면 a, c 순서로 제거된다.
+    backend.set("d", make_response(b"dddddddd"), tags=[])
+    assert [backend.get(key) is not None for key in "acd"] == [False, False, True]
+    assert backend.stats() == {
+        "entries": 1,
+        "bytes": 8,
+        "evictions": 3,
+        "expirations": 0,
+    }
+
+
+def test_local_cache_backend_expires_and_invalidates():
+    clock = FakeClock()
+    backend = LocalCacheBackend(
+        ttl_seconds=60, max_entries=10, max_bytes=1024, clock=clock
+    )
+    backend.set("a", make_response(b"a"), tags=["company-name:원티드"])
+    backend.set("b", make_response(b"b"), tags=["company-name:원티드", "tag-name:x"])
+    backend.set("c", make_response(b"c"), tags=["tag-name:y"])
+
+    assert backend.invalidate(["company-name:원티드", "tag-name:z"]) == 2
+    assert backend.get("a") is None
+    assert backend.get("b") is None
+
+    clock.now = 60
+    assert backend.get("c") is None
+    assert backend.stats()["expirations"] == 1
+
+
+def test_shared_cache_backend():
+    clock = FakeClock()
+    backend = SharedCacheBackend(LocalSharedStore(clock=clock), ttl_seconds=60)
+    response = CachedResponse(
+        body='[{"company_name":"원티드랩"}]'.encode(),
+        headers={"content-type": "application/json", "x-next-cursor": "0.4.1"},
+    )
+
+    backend.set("a", response, tags=["search:원티"])
+    backend.set("b", response, tags=["search:랩"])
+    assert backend.get("a") == response
+
+    assert backend.invalidate(["search:원티"]) == 1
+    assert backend.get("a") is None
+    assert backend.get("b") == response
+
+    clock.now = 60
+    assert backend.get("b") is None
+
+
+class RoundTripCountingStore(LocalSharedStore):
+    """바로 실행한 명령과 pipeline 을 저장소 왕복 한 번으로 센다."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.round_trips = 0
+
+    def get(self, name: str) -> bytes | None:
+        self.round_trips += 1
+        return super().get(name)
+
+    def sunion(self, *names: str) -> set[bytes]:
+        self.round_trips += 1
+        return super().sunion(*names)
+
+    def pipeline(self, transaction: bool = True):
+        self.round_trips += 1
+        return super().pipeline(transaction)
+
+
+def test_shared_cache_backend_round_trips():
+    """
+    무효화는 태그 수와 상관없이 태그 합집합 조회와 삭제 pipeline 두 번에 끝나고,
+    keyspace 세대 번호는 pipeline 한 번으로 올린다.
+    """
+    store = RoundTripCountingStore()
+    backend = SharedCacheBackend(store, ttl_seconds=60)
+    tags = [f"company-name:회사_{index}" for index in range(1000)]
+    for index, tag in enumerate(tags):
+        backend.set(str(index), make_response(b"a"), tags=[tag, "tag-name:x"])
+
+    store.round_trips = 0
+    assert backend.invalidate(tags) == 1000
+    assert store.round_trips == 2
+    # 무효화하지 않은 태그(tag-name:x)의 집합만 남는다.
+    assert store.dbsize() == 1
+
+    assert backend.generation("search") == 0
+    store.round_trips = 0
+    backend.bump_generations(["search", "search-fts"])
+    assert store.round_trips == 1
+    assert (backend.generation("search"), backend.generation("search-jamo")) == (1, 0)
+
+
+@pytest.fixture
+def cached_api(api: TestClient, make_companies: Callable[..., None]) -> TestClient:
+    make_companies(company_count=3, tag_count=3)
+    return api
+
+
+def get(api: TestClient, url: str, language: str = "ko"):
+    return api.get(url, headers=[("x-wanted-language", language)])
+
+
+def test_get_responses_are_cached(
+    cached_api: TestClient, sql_statements: list[tuple[str, tuple]]
+):
+    """
+    같은 경로/파라미터/언어의 GET 요청은 DB 조회 없이 캐시된 응답을 돌려줍니다.
+    """
+    for url in [
+        "/companies/company_0",
+        "/tags?query=tag_1",
+        "/search?query=회사&limit=1",
+    ]:
+        first = get(cached_api, url)
+        sql_statements.clear()
+        second = get(cached_api, url)
+
+        assert (first.headers["x-cache"], second.headers["x-cache"]) == ("miss", "hit")
+        assert second.content == first.content
+        assert second.headers.get("x-next-cursor") == first.headers.get("x-next-cursor")
+        assert sql_statements == []
+
+    # 언어가 다르면 다른 응답이다.
+    assert get(cached_api, "/companies/company_0", "en").headers["x-cache"] == "miss"
+
+    # 오류 응답은 캐시하지 않는다.
+    assert get(cached_api, "/companies/없는회사").status_code == 404
+    assert "x-cache" not in get(cached_api, "/companies/없는회사").headers
+
+    metrics = cached_api.get("/metrics/response-cache").json()
+    assert metrics["backend"] == "local"
+    assert (metrics["hits"], metrics["misses"]) == (3, 6)
+
+
+def test_write_invalidates_only_affected_responses(cached_api: TestClient):
+    """
+    태그 추가/삭제, 회사 추가는 결과가 바뀌는 응답만 무효화합니다.
+    회사/태그는 요청과 다른 언어의 이름으로 조회한 응답도 무효화됩니다.
+    """
+    urls = [
+        "/companies/회사_0",
+        "/companies/company_1",
+        "/tags?query=tag_2",
+        "/tags?query=태그_0",
+        "/search?query=회사",
+        "/search?query=new",
+    ]
+    for url in urls:
+        get(cached_api, url)
+
+    resp = cached_api.delete(
+        "/companies/company_0/tags/태그_2", headers=[("x-wanted-language", "ko")]
+    )
+    assert resp.status_code == 200
+
+    assert get(cached_api, "/companies/회사_0").json()["tags"] == ["태그_0", "태그_1"]
+    assert get(cached_api, "/tags?query=tag_2").json() == [
+        {"company_name": "회사_1"},
+        {"company_name": "회사_2"},
+    ]
+    for url in ["/companies/company_1", "/tags?query=태그_0", "/search?query=회사"]:
+        assert get(cached_api, url).headers["x-cache"] == "hit"
+
+    resp = cached_api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "새회사", "en": "new company"},
+            "tags": [{"tag_name": {"en": "tag_0"}}],
+        },
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert resp.status_code == 200
+
+    assert get(cached_api, "/search?query=회사").json() == [
+        {"company_name": "회사_0"},
+        {"company_name": "회사_1"},
+        {"company_name": "회사_2"},
+        {"company_name": "새회사"},
+    ]
+    assert get(cached_api, "/search?query=new").json() == [{"company_name": "새회사"}]
+    assert get(cached_api, "/tags?query=태그_0").headers["x-cache"] == "miss"
+    assert get(cached_api, "/companies/company_1").headers["x-cache"] == "hit"
+
+
+def test_new_company_invalidates_search_responses_by_keyspace(cached_api: TestClient):
+    """
+    회사가 추가되면 회사명 검색 응답은 검색어와 상관없이 검색 방식별로 한 번에 무효화됩니다.
+    한글이 없는 회사명은 초성/자모 검색 응답을 무효화하지 않습니다.
+    """
+    urls = [
+        "/search?query=회사",
+        "/search?query=없는회사",
+        "/search?query=company&mode=fts",
+        "/search?query=ㅎㅅ&mode=jamo",
+        "/search?query=횟&mode=jamo",
+    ]
+    for url in urls:
+        get(cached_api, url)
+
+    resp = cached_api.post(
+        "/companies",
+        json={"company_name": {"ko": "zzz", "en": "zzz"}, "tags": []},
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert resp.status_code == 200
+
+    assert [get(cached_api, url).headers["x-cache"] for url in urls] == [
+        "miss",
+        "miss",
+        "miss",
+        "hit",
+        "hit",
+    ]
@@ -0,0 +1,47 @@
+from collections.abc import Callable
+
+import pytest
+from starlette.testclient import TestClient
+
+from wanted_jjh import settings
+
+
+@pytest.mark.parametrize(
+    "method, url, body",
+    [
+        ("GET", "/search?query=회사&limit=2", None),
+        ("GET", "/tags?query=tag_1", None),
+        (
+            "POST",
+            "/companies:batchGet",
+            {"company_names": ["company_0", "없는회사", "회사_1"]},
+        ),
+    ],
+)
+def test_fast_json_response_matches_validated_response(
+    api: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    method: str,
+    url: str,
+    body: dict | None,
+    make_companies: Callable[..., None],
+):
+    """
+    FAST_JSON_RESPONSE 를 켜도 목록 응답의 본문과 헤더는 검증 경로와 같습니다.
+    """
+    make_companies(company_count=3, tag_count=2)
+
+    def request():
+        return api.request(
+            method, url, json=body, headers=[("x-wanted-language", "ko")]
+        )
+
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSE", False)
+    validated = request()
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSE", True)
+    fast = request()
+
+    assert validated.status_code == fast.status_code == 200
+    assert fast.content == validated.content
+    assert fast.headers["content-type"] == validated.headers["content-type"]
+    assert fast.headers.get("x-next-cursor") == validated.headers.get("x-next-cursor")
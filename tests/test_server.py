@@ -0,0 +1,44 @@
+import pytest
+
+from wanted_jjh import server
+from wanted_jjh import settings
+
+
+@pytest.mark.parametrize(
+    ("backend", "redis_url"),
+    [("local", None), ("shared", None)],
+)
+def test_multiple_workers_require_shared_response_cache(
+    monkeypatch: pytest.MonkeyPatch, backend: str, redis_url: str | None
+):
+    """
+    프로세스 메모리 응답 캐시는 다른 워커의 쓰기로 무효화되지 않으므로,
+    여러 워커로는 DB 를 건드리기 전에 실행을 거부합니다.
+    """
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_BACKEND", backend)
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_REDIS_URL", redis_url)
+    monkeypatch.setattr(
+        server,
+        "prepare_database",
+        lambda: pytest.fail("마이그레이션 전에 거부해야 한다."),
+    )
+
+    with pytest.raises(SystemExit, match="RESPONSE_CACHE_BACKEND=shared"):
+        server.run_production_server(host="127.0.0.1", port=0, workers=2)
+
+
+@pytest.mark.parametrize(
+    ("backend", "redis_url", "workers"),
+    [
+        ("shared", "redis://localhost:6379/0", 2),
+        ("none", None, 2),
+        ("local", None, 1),
+    ],
+)
+def test_response_cache_allowed_for_workers(
+    monkeypatch: pytest.MonkeyPatch, backend: str, redis_url: str | None, workers: int
+):
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_BACKEND", backend)
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_REDIS_URL", redis_url)
+
+    server._check_response_cache(workers)
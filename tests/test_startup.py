@@ -0,0 +1,73 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import wanted_jjh
+
+# fastapi / pydantic / sqlalchemy 를 import 한 뒤 이 저장소 코드(wanted_jjh.main)의 import 시간 예산
+MAIN_IMPORT_BUDGET_MS = 300
+
+PRELOADED_MODULES = ["fastapi", "pydantic", "sqlalchemy.orm", "sqlalchemy.ext.asyncio"]
+
+SRC_DIR = str(Path(next(iter(wanted_jjh.__path__))).parent)
+
+
+def run_import(module: str, tmp_path: Path, *, preload: list[str] = ()) -> dict:
+    """
+    새 프로세스에서 module 을 import 하고 import 시간과 로드된 모듈을 반환한다.
+    DATABASE_URI 는 아직 없는 SQLite 파일을 가리킨다.
+    """
+    code = "\n".join(
+        [
+            "import json, sys, time",
+            *[f"import {name}" for name in preload],
+            "started_at = time.perf_counter()",
+            f"import {module}",
+            "elapsed_ms = (time.perf_counter() - started_at) * 1000",
+            "print(json.dumps({'ms': elapsed_ms, 'modules': sorted(sys.modules)}))",
+        ]
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        env={
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, [SRC_DIR, os.environ.get("PYTHONPATH")])
+            ),
+            "DATABASE_URI": f"sqlite:///{tmp_path / 'startup.sqlite'}",
+            "ASYNC_DB": "false",
+        },
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def test_import_main_within_budget(tmp_path):
+    # 가장 빠른 값으로 비교해 다른 프로세스로 인한 일시적인 지연을 배제한다.
+    elapsed_ms = min(
+        run_import("wanted_jjh.main", tmp_path, preload=PRELOADED_MODULES)["ms"]
+        for _ in range(3)
+    )
+
+    assert elapsed_ms < MAIN_IMPORT_BUDGET_MS
+
+
+def test_import_main_does_not_touch_database(tmp_path):
+    result = run_import("wanted_jjh.main", tmp_path)
+
+    # 스키마는 `cli.py migrate` / `cli.py serve` 에서 만들고, import 만으로는 DB 파일을 열지 않는다.
+    assert not (tmp_path / "startup.sqlite").exists()
+    assert "sqlalchemy.testing" not in result["modules"]
+    # ASYNC_DB 가 꺼져 있으면 비동기 엔진과 드라이버를 만들지 않는다.
+    assert "aiosqlite" not in result["modules"]
+
+
+def test_import_cli_is_lightweight(tmp_path):
+    modules = run_import("wanted_jjh.cli", tmp_path)["modules"]
+
+    assert "sqlalchemy" not in modules
+    assert "fastapi" not in modules